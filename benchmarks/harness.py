@@ -0,0 +1,71 @@
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+from src import setup
+from src.audio import Audio
+from src.cache import ResponseCache
+from src.game import Game, Api
+from src.stub_server import StubServer
+
+"""
+Spoločná príprava pre merania - pygame s dummy ovládačmi (bez okna a zvuku)
+a lokálna náhrada servera s vopred vytvorenými dátami
+"""
+
+
+def start_server(users: int = 10, scores: int = 100):
+    """Spustí lokálnu náhradu servera a presmeruje na ňu hru"""
+    server = StubServer().start()
+    for i in range(users):
+        server.data.create_user(f"player{i}")
+    for i in range(scores):
+        server.data.create_score(i % users + 1, (i * 7919) % 50)
+    setup.SERVER_URL = server.url
+    Api.cache = ResponseCache(ttl=setup.RESPONSE_CACHE_TTL, max_size=setup.RESPONSE_CACHE_SIZE)
+    return server
+
+
+def start_game(virtual_time: bool = True):
+    """
+    Inicializuje pygame a vytvorí hru. Pri virtuálnom čase sa čas hry
+    posúva len cez frame(), nie podľa reálnych hodín
+    """
+    Audio.pre_init()
+    pg.init()
+    pg.display.set_mode(setup.SCREEN_SIZE)
+    setup.STORE_PATH = ':memory:'
+    game = Game()
+    if virtual_time:
+        game.clock_ms = 1000.0
+        game.time_source = lambda: game.clock_ms
+    return game
+
+
+def switch_scene(game: Game, name: str, timeout: float = 5):
+    """Prejde na scénu a počká kým scéna nenačíta dáta zo servera"""
+    game.scene.reset()
+    game.scene = game.get_scene(name)
+    game.prewarm_queue = []
+    frame(game)
+    end = time.perf_counter() + timeout
+    while game.scene.is_loading() and time.perf_counter() < end:
+        time.sleep(0.005)
+        frame(game)
+
+
+def frame(game: Game, ms: float = 1000 / 60):
+    """Jeden snímok hry s posunom virtuálneho času o ms"""
+    game.clock_ms += ms
+    game.update()
+    game.draw()
+    game.renderer.present()
+
+
+def stop(server: StubServer):
+    Api.shutdown()
+    server.stop()
+    pg.quit()
@@ -0,0 +1,69 @@
+import argparse
+import time
+import pygame as pg
+
+from benchmarks import harness
+from src import setup
+from src.game import Game
+
+"""
+Porovnanie spotreby CPU statických scén s idle módom a bez neho.
+Spustenie z koreňového priečinka: python -m benchmarks.idle_cpu --seconds 10
+Dummy video ovládač SDL pri pg.event.wait neuspí proces, ale stále kontroluje
+frontu eventov. Samotné čakanie sa preto zmeria zvlášť (baseline) a od idle
+spotreby sa odpočíta. S reálnym ovládačom je baseline takmer nulová.
+"""
+
+SCENES = ["main_menu", "credits", "stats", "my_stats", "game_over"]
+
+
+def measure(game: Game, scene: str, seconds: float, idle: bool):
+    """Vráti (CPU sekundy za minútu, počet snímkov) pre scénu"""
+    game.idle_mode = idle
+    game.scene.reset()
+    game.scene = game.get_scene(scene)
+    game.prewarm_queue = []
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    frames = game.renderer.frames
+    while time.perf_counter() - start < seconds:
+        game.step()
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - start_cpu
+    return cpu / elapsed * 60, game.renderer.frames - frames
+
+
+def measure_wait(seconds: float):
+    """CPU sekundy za minútu samotného čakania na event (bez hry)"""
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        pg.event.wait(setup.IDLE_MAX_WAIT)
+    return (time.process_time() - start_cpu) / (time.perf_counter() - start) * 60
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU time per minute with and without idle mode")
+    parser.add_argument('--seconds', type=float, default=5, help="Duration of each measurement")
+    parser.add_argument('--scenes', nargs='*', default=SCENES)
+    args = parser.parse_args()
+
+    server = harness.start_server()
+    game = harness.start_game(virtual_time=False)
+
+    baseline = measure_wait(args.seconds)
+    print(f"video driver {pg.display.get_driver()}, bare pg.event.wait {baseline:.2f} cpu s/min "
+          f"(subtracted in 'idle net')")
+    print(f"{'scene':<12}{'busy cpu s/min':>16}{'idle cpu s/min':>16}{'idle net':>10}"
+          f"{'busy frames':>13}{'idle frames':>13}")
+    for scene in args.scenes:
+        busy, busy_frames = measure(game, scene, args.seconds, idle=False)
+        idle, idle_frames = measure(game, scene, args.seconds, idle=True)
+        net = max(0.0, idle - baseline)
+        print(f"{scene:<12}{busy:16.2f}{idle:16.2f}{net:10.2f}{busy_frames:13}{idle_frames:13}")
+
+    harness.stop(server)
+
+
+if __name__ == '__main__':
+    main()
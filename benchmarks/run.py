@@ -0,0 +1,232 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from benchmarks import harness
+import pygame as pg
+from src import setup
+from src.components import Font, Menu, Table
+from src.events import coalesce_motion
+
+"""
+Sada meraní výkonu bežiaca bez okna a zvuku (SDL dummy ovládače).
+Výstup je stabilný JSON, ktorý sa dá porovnať s uloženým baseline súborom.
+Spustenie z koreňového priečinka:
+    python -m benchmarks.run --out results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.2
+"""
+
+SCENES = ["welcome", "main_menu", "my_stats", "stats", "credits", "show", "play", "game_over"]
+TABLE_ROWS = [10, 100, 1000, 100000]
+RESOLUTIONS = [(1920, 1080), (3840, 2160)]
+
+
+def measure(fn, iterations: int, warmup: int = 5):
+    """Zmeria trvanie funkcie v ms a vráti štatistiky"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'iterations': iterations,
+        'mean_ms': round(sum(samples) / len(samples), 4),
+        'p50_ms': round(samples[len(samples) // 2], 4),
+        'p99_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 4),
+    }
+
+
+def bench_scenes(game, iterations):
+    """Game.update + Game.draw (+ odoslanie na displej) pre každú scénu"""
+    results = {}
+    for name in SCENES:
+        harness.switch_scene(game, name)
+        results[f"scene.{name}"] = measure(lambda: harness.frame(game), iterations)
+    return results
+
+
+def bench_resolutions(game, iterations):
+    """Snímky scén v natívnom rozlíšení okna (preškálované obrázky a texty z cache viewportu)"""
+    results = {}
+    for width, height in RESOLUTIONS:
+        pg.display.set_mode((width, height), pg.RESIZABLE)
+        game.resize()
+        for name in SCENES:
+            harness.switch_scene(game, name)
+            results[f"scene.{name}.{width}x{height}"] = measure(lambda: harness.frame(game), iterations)
+    pg.display.set_mode(setup.SCREEN_SIZE)
+    game.resize()
+    return results
+
+
+def bench_tables(game, iterations):
+    results = {}
+    for rows in TABLE_ROWS:
+        data = [{'score': i, 'user': f"player{i}", 'created_at': str(i)} for i in range(rows)]
+        table = Table("Top scores", data)
+        table.add_column('Score', 'score')
+        table.add_column('Player', 'user')
+        table.add_column('Date', 'created_at')
+
+        def draw():
+            table.draw(game.renderer)
+            game.renderer.present()
+
+        results[f"table.draw.{rows}"] = measure(draw, iterations)
+    return results
+
+
+def bench_font(iterations):
+    font = Font.get('regular', 'md', 'light')
+    texts = [f"Your score: {i}" for i in range(100)]
+
+    def cached():
+        for text in texts:
+            font.render(text)
+
+    def uncached():
+        Font.text_cache.clear()
+        for text in texts:
+            font.render(text)
+
+    return {
+        'font.render.cached_x100': measure(cached, iterations),
+        'font.render.uncached_x100': measure(uncached, iterations),
+    }
+
+
+def bench_menu_motion(iterations, events: int = 500):
+    """
+    Menu.handle_event pri záplave MOUSEMOTION eventov - každý event zvlášť
+    a po spojení do jedného eventu za snímok (ako v Game.poll_events)
+    """
+    menu = Menu('MAIN MENU')
+    for text in ["PLAY!", "MY STATS", "STATS", "CREDITS", "EXIT"]:
+        menu.add_button(text, lambda: None)
+    rng = random.Random(1)
+    width, height = setup.SCREEN_SIZE
+    flood = [pg.event.Event(pg.MOUSEMOTION, pos=(rng.randrange(width), rng.randrange(height)),
+                            rel=(1, 1), buttons=(0, 0, 0)) for _ in range(events)]
+
+    def handle():
+        for event in flood:
+            menu.handle_event(event)
+
+    def coalesced():
+        for event in coalesce_motion(flood):
+            menu.handle_event(event)
+
+    return {
+        f'menu.motion_flood.{events}': measure(handle, iterations),
+        f'menu.motion_flood.{events}.coalesced': measure(coalesced, iterations),
+    }
+
+
+def bench_startup(runs: int):
+    """Čas od spustenia procesu po vykreslenie prvého snímku cez main.main"""
+    samples = []
+    # rovnaká izolácia ako harness - lokálne skóre ani cache odpovedí sa nedotknú súborov vývojára
+    env = dict(os.environ, SIMON_SERVER_URL=setup.SERVER_URL, SIMON_STORE=':memory:', SIMON_RESPONSE_CACHE='',
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-m', 'benchmarks.run', '--startup-child'],
+                             capture_output=True, text=True, env=env, check=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    samples.sort()
+    return {'startup.first_frame': {
+        'iterations': runs,
+        'mean_ms': round(sum(samples) / runs, 4),
+        'p50_ms': round(samples[runs // 2], 4),
+        'p99_ms': round(samples[-1], 4),
+    }}
+
+
+def startup_child():
+    """Spustí main.main, po prvom snímku hru ukončí a vypíše čas štartu"""
+    import main
+    from src.game import Game
+    from src.metrics import startup
+
+    def first_frame(game):
+        game.step()
+        print(round(startup.total(), 3))
+
+    Game.main_loop = first_frame
+    try:
+        main.main()
+    except SystemExit:
+        pass
+
+
+def compare(results: dict, baseline: dict, threshold: float):
+    """Vráti zoznam meraní, ktorých p50 je horšie ako baseline o viac ako threshold"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if not base or not base['p50_ms']:
+            continue
+        change = result['p50_ms'] / base['p50_ms'] - 1
+        if change > threshold:
+            regressions.append(f"{name}: p50 {base['p50_ms']} ms -> {result['p50_ms']} ms (+{change:.0%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless performance benchmarks")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--startup-runs', type=int, default=5)
+    parser.add_argument('--out', help="Write results as JSON to this file")
+    parser.add_argument('--baseline', help="Compare against a stored results file")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed p50 slowdown (0.2 = 20%%)")
+    parser.add_argument('--startup-child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.startup_child:
+        startup_child()
+        return
+
+    server = harness.start_server(users=10, scores=1000)
+    game = harness.start_game()
+    results = {}
+    results.update(bench_scenes(game, args.iterations))
+    results.update(bench_resolutions(game, args.iterations))
+    results.update(bench_tables(game, args.iterations))
+    results.update(bench_font(args.iterations))
+    results.update(bench_menu_motion(args.iterations))
+    if args.startup_runs:
+        results.update(bench_startup(args.startup_runs))
+    harness.stop(server)
+
+    output = {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pg.version.ver,
+            'platform': platform.platform(),
+        },
+        'results': dict(sorted(results.items())),
+    }
+    text = json.dumps(output, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(text + "\n")
+    print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print("REGRESSION " + regression, file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,76 @@
+import os
 import sys
+import json
+import argparse
+from src.metrics import startup
 import pygame as pg
-from src.game import Game
-from src import setup, tools
+from src.game import Game, Api
+from src import setup, tools, viewport
+from src.assets import Assets
+from src.audio import Audio
+from src.cache import ResponseCache
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Simon game")
+    parser.add_argument('--record', metavar='FILE', help="Record input events and the sequence seed to FILE")
+    parser.add_argument('--replay', metavar='FILE', help="Replay a recording made with --record")
+    parser.add_argument('--speed', choices=['real', 'max'], default='real', help="Replay speed")
+    parser.add_argument('--report', metavar='FILE', help="Write the replay report to FILE (default stdout)")
+    parser.add_argument('--headless', action='store_true', help="Run without window and sound (SDL dummy drivers)")
+    return parser.parse_args(argv)
+
+
+def main(args=None):
+    args = args or parse_args([])
+    if args.headless:
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    replay = recorder = server = None
+    if args.replay:
+        from src.replay import Replay
+        from src.stub_server import StubServer
+        replay = Replay(args.replay)
+        setup.SEED = replay.seed
+        # prehrávanie nesmie posielať skóre na ostrý server ani meniť lokálne úložisko
+        server = StubServer().start()
+        setup.SERVER_URL = server.url
+        setup.STORE_PATH = ':memory:'
+        Api.cache = ResponseCache(ttl=setup.RESPONSE_CACHE_TTL, max_size=setup.RESPONSE_CACHE_SIZE)
+    startup.mark('import')
+    Audio.pre_init()
     pg.init()
-    pg.display.set_mode(setup.SCREEN_SIZE)
+    startup.mark('pg.init')
+    viewport.set_mode(setup.FULLSCREEN)
     pg.display.set_caption(setup.CAPTION)
-    pg.display.set_icon(pg.image.load(tools.parse_path(setup.IMG_PATH, 'others', "icon.png")).convert_alpha())
-    Game().main_loop()
+    pg.display.set_icon(Assets.image(tools.parse_path(setup.IMG_PATH, 'others', "icon.png")))
+    startup.mark('display')
+    game = Game()
+    if args.record:
+        from src.replay import Recorder
+        recorder = Recorder(args.record, game.core.seed)
+        recorder.attach(game)
+    if replay:
+        from src.replay import dump_report
+        dump_report(replay.run(game, max_speed=args.speed == 'max'), args.report)
+    else:
+        game.main_loop()
+    if recorder:
+        recorder.close()
+    game.player.close()
+    Api.shutdown()
+    if server:
+        server.stop()
+    game.profiler.stop_capture()
+    if setup.FRAME_STATS_REPORT:
+        print(json.dumps(game.frame_report(), indent=2))
+    if setup.AUDIO_LATENCY_REPORT:
+        print(json.dumps(Audio.report(), indent=2))
+    if game.profiler.phases:
+        print(json.dumps(game.profiler.report(), indent=2))
     pg.quit()
     sys.exit()
 
 
 if __name__ == '__main__':
-    main()
+    main(parse_args())
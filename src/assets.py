@@ -0,0 +1,109 @@
+import os
+import pygame as pg
+
+from src import setup
+from src.atlas import Atlas
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.bmp')
+SOUND_EXTENSIONS = ('.wav', '.ogg')
+
+
+class Assets:
+    """
+    Centrálne úložisko obrázkov a zvukov. Každý súbor sa načíta (a obrázok
+    skonvertuje) len raz, komponenty dostávajú zdieľané referencie.
+    Do zdieľaných surfacov sa preto nesmie kresliť.
+    """
+    images = {}
+    sounds = {}
+    atlas = None
+
+    @staticmethod
+    def source(path: str):
+        """
+        Vráti zdroj pre pygame loader - súborový objekt nad balíkom
+        assetov, alebo cestu k súboru ak balík neexistuje
+        """
+        if setup.BUNDLE and path in setup.BUNDLE:
+            return setup.BUNDLE.open(path)
+        return path
+
+    @classmethod
+    def image(cls, path: str):
+        """Vráti obrázok so zachovanou priehľadnosťou, pri prvom použití ho načíta"""
+        if path not in cls.images:
+            cls.images[path] = pg.image.load(cls.source(path), os.path.basename(path)).convert_alpha()
+        return cls.images[path]
+
+    @classmethod
+    def sprite(cls, path: str):
+        """
+        Vráti obrázok z atlasu (setup.ATLAS_IMAGES), pri prvom použití
+        atlas vytvorí. Obrázky mimo atlasu vráti ako samostatný surface
+        """
+        if path not in setup.ATLAS_IMAGES:
+            return cls.image(path)
+        if cls.atlas is None:
+            images = {p: pg.image.load(cls.source(p), os.path.basename(p)) for p in setup.ATLAS_IMAGES}
+            cls.atlas = Atlas(images, setup.ATLAS_WIDTH)
+        return cls.atlas.get(path)
+
+    @classmethod
+    def sound(cls, path: str):
+        """Vráti zvuk, pri prvom použití ho načíta"""
+        if path not in cls.sounds:
+            cls.sounds[path] = pg.mixer.Sound(cls.source(path))
+        return cls.sounds[path]
+
+    @classmethod
+    def load(cls, path: str):
+        """Načíta obrázok alebo zvuk podľa koncovky súboru"""
+        ext = os.path.splitext(path)[1].lower()
+        if ext in IMAGE_EXTENSIONS:
+            return cls.sprite(path)
+        if ext in SOUND_EXTENSIONS:
+            return cls.sound(path)
+        raise ValueError(f"Unknown asset type: {path}")
+
+    @classmethod
+    def preload(cls, group: str):
+        """Načíta všetky súbory skupiny definovanej v setup.ASSET_GROUPS"""
+        for path in setup.ASSET_GROUPS.get(group, []):
+            cls.load(path)
+
+    @classmethod
+    def unload(cls, path: str):
+        """
+        Odstráni súbor z úložiska. Pamäť sa uvoľní až keď ho
+        nepoužíva žiadny komponent.
+        """
+        cls.images.pop(path, None)
+        cls.sounds.pop(path, None)
+
+    @classmethod
+    def unload_group(cls, group: str):
+        for path in setup.ASSET_GROUPS.get(group, []):
+            cls.unload(path)
+
+    @staticmethod
+    def size_of(asset):
+        """Odhad veľkosti dát v pamäti v bajtoch"""
+        if isinstance(asset, pg.Surface):
+            return asset.get_pitch() * asset.get_height()
+        mixer = pg.mixer.get_init()
+        if not mixer:
+            return 0
+        frequency, size, channels = mixer
+        return int(asset.get_length() * frequency * channels * abs(size) / 8)
+
+    @classmethod
+    def memory(cls):
+        """Vráti veľkosť v bajtoch pre každý načítaný súbor"""
+        assets = {**cls.images, **cls.sounds}
+        if cls.atlas:
+            assets['atlas'] = cls.atlas.surface
+        return {path: cls.size_of(asset) for path, asset in sorted(assets.items())}
+
+    @classmethod
+    def total_memory(cls):
+        return sum(cls.memory().values())
@@ -0,0 +1,59 @@
+from typing import Dict
+import pygame as pg
+
+"""
+Textúrový atlas - viac obrázkov zabalených do jedného surfacu. Komponenty
+dostanú Sprite (atlas + oblasť), renderer ho vykreslí ako časť atlasu.
+"""
+
+
+class Sprite:
+    __slots__ = ('surface', 'rect')
+
+    def __init__(self, surface: pg.Surface, rect: pg.Rect):
+        """Oblasť rect v surfaci atlasu, rozmermi sa správa ako samostatný obrázok"""
+        self.surface = surface
+        self.rect = rect
+
+    def get_size(self):
+        return self.rect.size
+
+    def get_width(self):
+        return self.rect.w
+
+    def get_height(self):
+        return self.rect.h
+
+
+class Atlas:
+    def __init__(self, images: Dict[str, pg.Surface], max_width: int = 1024, padding: int = 1):
+        """
+        Zabalí obrázky do jedného surfacu po riadkoch (od najvyšších),
+        medzi obrázkami necháva medzeru padding, aby sa pri škálovaní
+        nepremiešali susedné obrázky
+        :param images: Obrázky podľa cesty
+        :param max_width: Maximálna šírka atlasu
+        """
+        self.regions = {}
+        x = y = row_height = width = 0
+        for path, image in sorted(images.items(), key=lambda item: (-item[1].get_height(), item[0])):
+            w, h = image.get_size()
+            if x and x + w > max_width:
+                x, y = 0, y + row_height + padding
+                row_height = 0
+            self.regions[path] = pg.Rect(x, y, w, h)
+            x += w + padding
+            row_height = max(row_height, h)
+            width = max(width, x - padding)
+        self.surface = pg.Surface((max(1, width), max(1, y + row_height)), pg.SRCALPHA)
+        if pg.display.get_surface():
+            self.surface = self.surface.convert_alpha()
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blits([(images[path], rect) for path, rect in self.regions.items()], False)
+        self.sprites = {path: Sprite(self.surface, rect) for path, rect in self.regions.items()}
+
+    def __contains__(self, path: str):
+        return path in self.sprites
+
+    def get(self, path: str):
+        return self.sprites[path]
@@ -0,0 +1,159 @@
+import time
+import pygame as pg
+
+from src import setup
+from src.metrics import Histogram
+
+# Hranice košov histogramu oneskorenia zvuku v milisekundách
+LATENCY_BUCKETS = (1, 2, 5, 10, 15, 20, 30, 50, 100)
+
+
+class Audio:
+    """
+    Zvukový subsystém. Mixer sa inicializuje s malým bufferom (setup.AUDIO_BUFFER),
+    každá dlaždica má vlastný rezervovaný kanál, takže rýchle kliknutia na
+    rôzne dlaždice si nekradnú kanály a opakované kliknutie na tú istú
+    dlaždicu zvuk len reštartuje. Ostatné zvuky hrajú na voľných kanáloch.
+    """
+    tile_channels = {}
+    # čas posledného vstupu hráča (perf_counter) pre meranie oneskorenia
+    input_time = None
+    latency = Histogram(LATENCY_BUCKETS)
+
+    @staticmethod
+    def pre_init():
+        """Nastaví parametre mixera, musí sa zavolať pred pg.init()"""
+        pg.mixer.pre_init(setup.AUDIO_FREQUENCY, -16, 2, setup.AUDIO_BUFFER)
+
+    @classmethod
+    def reserve(cls, tile_ids: list):
+        """Rezervuje jeden kanál pre každú dlaždicu"""
+        if not pg.mixer.get_init():
+            return
+        count = len(tile_ids)
+        pg.mixer.set_num_channels(count + setup.AUDIO_CHANNELS)
+        pg.mixer.set_reserved(count)
+        cls.tile_channels = {tile_id: pg.mixer.Channel(i) for i, tile_id in enumerate(tile_ids)}
+
+    @classmethod
+    def mark_input(cls):
+        """Zaznamená čas vstupu hráča (kliknutie, kláves)"""
+        cls.input_time = time.perf_counter()
+
+    @classmethod
+    def play_tile(cls, tile_id: int, sound: pg.mixer.Sound):
+        """Prehrá zvuk dlaždice na jej kanáli"""
+        channel = cls.tile_channels.get(tile_id)
+        if channel:
+            channel.play(sound)
+        else:
+            sound.play()
+        Music.duck(sound.get_length())
+
+    @classmethod
+    def play(cls, sound: pg.mixer.Sound):
+        """Prehrá zvuk na voľnom (nerezervovanom) kanáli"""
+        sound.play()
+
+    @classmethod
+    def record_latency(cls):
+        """Oneskorenie od vstupu hráča po práve spustený zvuk (ukladá sa len v režime merania)"""
+        if cls.input_time is None:
+            return
+        if setup.AUDIO_LATENCY_REPORT:
+            cls.latency.add((time.perf_counter() - cls.input_time) * 1000)
+        cls.input_time = None
+
+    @staticmethod
+    def buffer_latency():
+        """Oneskorenie spôsobené bufferom mixera v ms"""
+        init = pg.mixer.get_init()
+        if not init:
+            return 0.0
+        return setup.AUDIO_BUFFER / init[0] * 1000
+
+    @classmethod
+    def report(cls):
+        """
+        Oneskorenie od kliknutia po zvuk - čas spracovania v hre (vstup ->
+        spustenie zvuku) a odhad celkového oneskorenia vrátane buffera mixera
+        """
+        buffer = cls.buffer_latency()
+        return {
+            'mixer': pg.mixer.get_init(),
+            'buffer_ms': round(buffer, 3),
+            'input_to_play_ms': cls.latency.to_dict(),
+            'estimated_total_ms': {
+                'mean': round(cls.latency.mean() + buffer, 3),
+                'max': round(cls.latency.max + buffer, 3),
+            },
+        }
+
+
+class Music:
+    """
+    Hudba v pozadí. Prehráva sa cez pg.mixer.music, ktorý skladbu dekóduje
+    postupne počas prehrávania (stream zo súboru alebo z balíka assetov),
+    takže pamäť nezávisí od dĺžky skladby. Pri prechode do scén zo
+    setup.MUSIC_MUTED_SCENES hudba stíchne, pri zvukoch dlaždíc sa stlmí.
+    """
+    enabled = False
+    playing = False
+    source = None
+    duck_until = 0
+
+    @classmethod
+    def scene_changed(cls, scene: str, enabled: bool):
+        """Spustí alebo postupne stíši hudbu podľa scény a nastavenia hry"""
+        cls.enabled = enabled
+        should_play = enabled and scene not in setup.MUSIC_MUTED_SCENES
+        if should_play and not cls.playing:
+            cls.start()
+        elif not should_play and cls.playing:
+            cls.stop()
+
+    @classmethod
+    def start(cls):
+        if not pg.mixer.get_init():
+            return
+        if cls.source is None:
+            from src.assets import Assets
+            # súborový objekt ostáva otvorený, mixer z neho číta počas prehrávania
+            cls.source = Assets.source(setup.MUSIC_PATH)
+            pg.mixer.music.load(cls.source, setup.MUSIC_PATH.rsplit('.', 1)[-1])
+        cls.apply_volume()
+        pg.mixer.music.play(-1, fade_ms=setup.MUSIC_FADE_TIME)
+        cls.playing = True
+
+    @classmethod
+    def stop(cls):
+        if pg.mixer.get_init():
+            pg.mixer.music.fadeout(setup.MUSIC_FADE_TIME)
+        cls.playing = False
+
+    @classmethod
+    def duck(cls, seconds: float):
+        """Stlmí hudbu na zadaný čas (počas zvuku dlaždice)"""
+        if not cls.playing:
+            return
+        cls.duck_until = max(cls.duck_until, time.perf_counter() + seconds)
+        cls.apply_volume()
+
+    @classmethod
+    def update(cls):
+        """Po skončení stlmenia vráti hlasitosť, volá sa každý snímok"""
+        if cls.duck_until and time.perf_counter() >= cls.duck_until:
+            cls.duck_until = 0
+            cls.apply_volume()
+
+    @classmethod
+    def next_timer(cls):
+        """Počet ms do konca stlmenia (pre čakanie v idle móde), None = žiadne"""
+        if not cls.duck_until:
+            return None
+        return max(0.0, (cls.duck_until - time.perf_counter()) * 1000)
+
+    @classmethod
+    def apply_volume(cls):
+        if pg.mixer.get_init():
+            pg.mixer.music.set_volume(setup.MUSIC_VOLUME * (setup.MUSIC_DUCK if cls.duck_until else 1))
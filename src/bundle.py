@@ -0,0 +1,129 @@
+import argparse
+import io
+import json
+import mmap
+import os
+import struct
+
+"""
+Balík assetov - jeden súbor s indexom, ktorý nahrádza desiatky malých súborov
+v priečinku assets. Formát: MAGIC, dĺžka indexu (uint32 LE), index v JSON
+{cesta: [offset, veľkosť]} a za ním dáta všetkých súborov za sebou.
+Vytvorenie balíka: python -m src.bundle --src assets --out assets.bundle
+"""
+
+MAGIC = b'SIMONPK1'
+HEADER = struct.Struct('<8sI')
+
+
+def normalize(path: str):
+    """Cesta v indexe balíka vždy s oddeľovačom '/'"""
+    return path.replace(os.sep, '/').strip('/')
+
+
+class BufferReader(io.RawIOBase):
+    def __init__(self, buffer: memoryview):
+        """Súbor len na čítanie nad časťou balíka bez kopírovania dát"""
+        super().__init__()
+        self.buffer = buffer
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self.buffer[self.position:self.position + len(b)]
+        b[:len(chunk)] = chunk
+        self.position += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.buffer)
+        self.position = max(0, min(offset, len(self.buffer)))
+        return self.position
+
+    def tell(self):
+        return self.position
+
+
+class Bundle:
+    def __init__(self, path: str):
+        """
+        Otvorí balík a namapuje ho do pamäte. Súbory sa čítajú
+        priamo z namapovanej pamäte, bez otvárania ďalších súborov.
+        """
+        self.path = path
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_size = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            raise ValueError(f"Not an asset bundle: {path}")
+        self.index = json.loads(self.map[HEADER.size:HEADER.size + index_size])
+        self.data_start = HEADER.size + index_size
+
+    @staticmethod
+    def load(path: str):
+        """Otvorí balík, ak neexistuje vráti None (hra použije priečinok assets)"""
+        if not path or not os.path.isfile(path):
+            return None
+        return Bundle(path)
+
+    def __contains__(self, path: str):
+        return normalize(path) in self.index
+
+    def get(self, path: str):
+        """Vráti dáta súboru ako memoryview do namapovanej pamäte"""
+        offset, size = self.index[normalize(path)]
+        start = self.data_start + offset
+        return memoryview(self.map)[start:start + size]
+
+    def open(self, path: str):
+        """Vráti súborový objekt pre pygame loadery"""
+        return BufferReader(self.get(path))
+
+    def listdir(self, directory: str):
+        """Názvy súborov priamo v zadanom priečinku"""
+        prefix = normalize(directory) + '/'
+        return sorted({p[len(prefix):] for p in self.index if p.startswith(prefix) and '/' not in p[len(prefix):]})
+
+
+def build(src: str = 'assets', out: str = 'assets.bundle'):
+    """
+    Zabalí všetky súbory z priečinka src do jedného súboru. Cesty v indexe
+    obsahujú aj názov priečinka (napr. assets/images/tiles/red.png), aby
+    sedeli s cestami, ktoré hra skladá cez tools.parse_path.
+    """
+    index = {}
+    chunks = []
+    offset = 0
+    for root, dirs, files in os.walk(src):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            with open(path, 'rb') as f:
+                data = f.read()
+            index[normalize(path)] = [offset, len(data)]
+            chunks.append(data)
+            offset += len(data)
+    raw_index = json.dumps(index, separators=(',', ':')).encode()
+    with open(out, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(raw_index)))
+        f.write(raw_index)
+        for chunk in chunks:
+            f.write(chunk)
+    return index
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Zabalí assety hry do jedného súboru")
+    parser.add_argument('--src', default='assets')
+    parser.add_argument('--out', default='assets.bundle')
+    args = parser.parse_args()
+    files = build(args.src, args.out)
+    print(f"Packed {len(files)} files into {args.out} ({os.path.getsize(args.out)} bytes)")
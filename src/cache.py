@@ -0,0 +1,207 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from src.metrics import Histogram
+
+# Hranice košov histogramu veku starých odpovedí v sekundách
+STALENESS_BUCKETS = (1, 5, 15, 60, 300, 900, 3600, 86400)
+
+
+class LRUCache:
+    def __init__(self, max_size: int = 128):
+        """
+        Ohraničená cache, ktorá pri zaplnení vyhodí najdlhšie nepoužitú položku
+        :param max_size: Maximálny počet položiek v cache
+        """
+        self.max_size = max_size
+        self.items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default=None):
+        """Vráti položku podľa kľúča a označí ju ako naposledy použitú"""
+        if key in self.items:
+            self.hits += 1
+            self.items.move_to_end(key)
+            return self.items[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value):
+        """Uloží položku, v prípade prekročenia veľkosti vyhodí najstaršiu"""
+        self.items[key] = value
+        self.items.move_to_end(key)
+        while len(self.items) > self.max_size:
+            self.items.popitem(last=False)
+
+    def get_or_create(self, key: Hashable, factory: Callable):
+        """Vráti položku z cache, ak neexistuje vytvorí ju zavolaním factory"""
+        if key in self.items:
+            self.hits += 1
+            self.items.move_to_end(key)
+            return self.items[key]
+        self.misses += 1
+        value = factory()
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        """Vyprázdni cache a vynuluje počítadlá"""
+        self.items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self):
+        """Vráti pomer zásahov ku všetkým prístupom (0 - 1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def info(self):
+        """Vráti štatistiky cache"""
+        return {
+            'size': len(self.items),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def __contains__(self, key):
+        return key in self.items
+
+    def __len__(self):
+        return len(self.items)
+
+
+class ResponseCache:
+    def __init__(self, path: str = None, ttl: float = 60, max_size: int = 64):
+        """
+        Cache odpovedí GET požiadaviek (stale-while-revalidate). Čerstvá
+        položka sa vráti bez požiadavky, po uplynutí ttl sa vráti stará
+        položka a na pozadí sa overí podmienenou požiadavkou (ETag /
+        Last-Modified). Zapisuje sa z vlákien na pozadí, preto zámok.
+        :param path: JSON súbor, do ktorého sa cache ukladá medzi behmi, None = neukladať
+        :param ttl: Čas v sekundách, počas ktorého je položka čerstvá
+        :param max_size: Maximálny počet položiek, najdlhšie nepoužité sa vyhodia
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        # od najdlhšie nepoužitej po naposledy použitú
+        self.entries = OrderedDict()
+        self.revalidating = set()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+        self.evictions = 0
+        # vek starej položky (s) v čase keď bola vrátená
+        self.staleness = Histogram(STALENESS_BUCKETS)
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    entries = json.load(f)
+                self.entries = OrderedDict(sorted(entries.items(), key=lambda item: item[1]['time']))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                self.entries = OrderedDict()
+            self.evict()
+
+    def evict(self):
+        """Vyhodí najdlhšie nepoužité položky nad max_size"""
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def lookup(self, key: str):
+        """
+        Vráti (dáta, treba_overiť). Pri chýbajúcej položke (None, True),
+        pri starej položke ju označí ako overovanú, aby sa overila len raz
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, True
+            self.entries.move_to_end(key)
+            age = time.time() - entry['time']
+            if age <= self.ttl:
+                self.hits += 1
+                return entry['data'], False
+            self.stale_hits += 1
+            self.staleness.add(age - self.ttl)
+            revalidate = key not in self.revalidating
+            self.revalidating.add(key)
+            return entry['data'], revalidate
+
+    def validators(self, key: str):
+        """Hlavičky podmienenej požiadavky pre položku"""
+        with self.lock:
+            entry = self.entries.get(key) or {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def cached(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry['data'] if entry else None
+
+    def put(self, key: str, data, etag: str = None, last_modified: str = None):
+        with self.lock:
+            self.entries[key] = {'data': data, 'etag': etag, 'last_modified': last_modified, 'time': time.time()}
+            self.entries.move_to_end(key)
+            self.revalidating.discard(key)
+            self.evict()
+
+    def touch(self, key: str):
+        """Server potvrdil, že položka sa nezmenila (304)"""
+        with self.lock:
+            self.not_modified += 1
+            if key in self.entries:
+                self.entries[key]['time'] = time.time()
+            self.revalidating.discard(key)
+
+    def release(self, key: str):
+        """Overenie zlyhalo, položka ostane stará"""
+        with self.lock:
+            self.revalidating.discard(key)
+
+    def invalidate(self, prefix: str = ''):
+        """Zahodí položky, ktorých kľúč začína prefixom ('' = všetky)"""
+        with self.lock:
+            for key in [key for key in self.entries if key.startswith(prefix)]:
+                del self.entries[key]
+                self.invalidations += 1
+
+    def save(self):
+        if not self.path:
+            return
+        with self.lock:
+            text = json.dumps(self.entries)
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def info(self):
+        with self.lock:
+            total = self.hits + self.stale_hits + self.misses
+            return {
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.stale_hits) / total, 4) if total else 0.0,
+                'not_modified': self.not_modified,
+                'invalidations': self.invalidations,
+                'evictions': self.evictions,
+                'staleness_s': self.staleness.to_dict(),
+            }
@@ -1,8 +1,12 @@
-import os
 from typing import Callable, Tuple
 import pygame as pg
 
 from src import tools, setup
+from src.assets import Assets
+from src.audio import Audio
+from src.cache import LRUCache
+from src.events import EventRouter
+from src.viewport import Viewport
 
 
 class Clickable:
@@ -12,6 +16,8 @@ class Clickable:
         self.y = y
         self.width = width
         self.height = height
+        # vypnutý komponent EventRouter preskočí (napr. skryté tlačidlo)
+        self.enabled = True
 
     def mouse_over(self, mouse_pos):
         mx = mouse_pos[0]
@@ -24,6 +30,14 @@ class Clickable:
     def click(self, callback: Callable, params: Tuple = ()):
         callback(*params)
 
+    def handle_event(self, event):
+        """Event myši nad komponentom (doručí ho EventRouter)"""
+        pass
+
+    def leave(self):
+        """Myš opustila komponent"""
+        pass
+
 
 class Button(Clickable):
     def __init__(
@@ -31,17 +45,19 @@ class Button(Clickable):
             pos: Tuple,
             action: Callable,
             params: Tuple = (),
-            _type: str = "primary"
+            _type: str = "primary",
+            on_hover: Callable = None
     ):
-        self.bg = pg.image.load(os.path.join("assets", "images", "buttons", f"btn_{_type}.png")).convert_alpha()
-        self.font = Font('regular') if _type == 'primary' else Font('regular', color='white')
+        self.bg = Assets.sprite(tools.parse_path(setup.IMG_PATH, "buttons", f"btn_{_type}.png"))
+        self.font = Font.get('regular') if _type == 'primary' else Font.get('regular', color='white')
         self.set_text(text)
         self.pos = pos
         self.type = _type
         self.action = action
         self.params = params
+        self.on_hover = on_hover
         self.hovering = False
-        self.sound = pg.mixer.Sound(tools.parse_path(setup.SOUND_PATH, "buttons", "button.wav"))
+        self.sound = Assets.sound(tools.parse_path(setup.SOUND_PATH, "buttons", "button.wav"))
         super().__init__(pos[0], pos[1], self.bg.get_width(), self.bg.get_height())
 
     def draw(self, win):
@@ -52,16 +68,16 @@ class Button(Clickable):
         ))
 
     def handle_event(self, event):
-        mouse_pos = pg.mouse.get_pos()
-        if self.mouse_over(mouse_pos):
-            if event.type == pg.MOUSEBUTTONDOWN:
-                self.click()
-            elif event.type == pg.MOUSEMOTION:
-                if not self.hovering:
-                    self.hovering = True
-                    self.sound.play()
-        else:
-            self.hovering = False
+        if event.type == pg.MOUSEBUTTONDOWN:
+            self.click()
+        elif event.type == pg.MOUSEMOTION and not self.hovering:
+            self.hovering = True
+            Audio.play(self.sound)
+            if self.on_hover:
+                self.on_hover()
+
+    def leave(self):
+        self.hovering = False
 
     def set_position(self, pos):
         self.pos = pos
@@ -83,9 +99,9 @@ class Tile(Clickable):
         self.position = position
         self.blink_time = setup.TILE_LIGHT_TIME
         self.active = False
-        self.sound = pg.mixer.Sound(tools.parse_path(setup.SOUND_PATH, "tiles", f"{color}.wav"))
-        self.img_off = pg.image.load(tools.parse_path(setup.IMG_PATH, "tiles", f"{color}.png")).convert_alpha()
-        self.img_on = pg.image.load(tools.parse_path(setup.IMG_PATH, "tiles", f"{color}_on.png")).convert_alpha()
+        self.sound = Assets.sound(tools.parse_path(setup.SOUND_PATH, "tiles", f"{color}.wav"))
+        self.img_off = Assets.sprite(tools.parse_path(setup.IMG_PATH, "tiles", f"{color}.png"))
+        self.img_on = Assets.sprite(tools.parse_path(setup.IMG_PATH, "tiles", f"{color}_on.png"))
         super().__init__(position[0], position[1], self.img_off.get_width(), self.img_off.get_height())
 
     def get_img(self):
@@ -96,27 +112,82 @@ class Tile(Clickable):
 
     def play_sound(self):
         if self.active:
-            self.sound.play()
+            Audio.play_tile(self.id, self.sound)
 
     def click(self, callback: Callable, params: Tuple = ()):
         super().click(callback, params)
         self.play_sound()
+        Audio.record_latency()
 
 
 class Font:
+    # zdieľané pygame fonty podľa (font, veľkosť) a Font objekty podľa (font, veľkosť, farba)
+    fonts = {}
+    # fonty pre mierku okna podľa (font, veľkosť, mierka), pri zmene veľkosti
+    # okna vznikajú nové mierky, staré sa vyhodia
+    scaled_fonts = LRUCache(setup.SCALED_FONT_CACHE)
+    registry = {}
+    # vyrenderované texty podľa (font, veľkosť, farba, text)
+    text_cache = LRUCache(setup.TEXT_CACHE_SIZE)
+
     def __init__(self, _font: str = "regular", size: str = "md", color: str = "black"):
         """
         Vytvorí pygame font podla zadaného fontu
         Je možné použiť iba fonty naimportované v setupe
+        Samotný pygame font sa načíta zo súboru len raz a zdieľa sa
         :param _font: Font z pričinka assets/fonts
         :param size: Veľkost definovaná v setupe
         :param color: Farba definovaná v setupe
         """
-        self.font = pg.font.Font(setup.FONTS[_font], setup.FONT_SIZES[size])
+        self.key = (_font, size, color)
+        self.font = Font.load(_font, size)
         self.color = setup.COLORS[color]
 
+    @classmethod
+    def get(cls, _font: str = "regular", size: str = "md", color: str = "black"):
+        """Vráti zdieľaný Font z registra, pri prvom použití ho vytvorí"""
+        key = (_font, size, color)
+        if key not in cls.registry:
+            cls.registry[key] = cls(_font, size, color)
+        return cls.registry[key]
+
+    @classmethod
+    def load(cls, _font: str, size: str, scale: float = 1):
+        """
+        Načíta pygame font zo súboru, ak ešte nebol načítaný
+        :param scale: Mierka okna, písmo sa načíta vo veľkosti pre natívne rozlíšenie
+        """
+        if scale != 1:
+            return cls.scaled_fonts.get_or_create(
+                (_font, size, scale),
+                lambda: pg.font.Font(Assets.source(setup.FONTS[_font]), round(setup.FONT_SIZES[size] * scale))
+            )
+        key = (_font, size)
+        if key not in cls.fonts:
+            cls.fonts[key] = pg.font.Font(Assets.source(setup.FONTS[_font]), setup.FONT_SIZES[size])
+        return cls.fonts[key]
+
+    @classmethod
+    def cache_info(cls):
+        """Štatistiky cache vyrenderovaných textov"""
+        return cls.text_cache.info()
+
     def render(self, text: str):
-        return self.font.render(text, False, self.color)
+        """
+        Vráti vyrenderovaný text z cache. Vrátený surface je zdieľaný,
+        preto sa do neho nesmie kresliť, len sa blituje na obrazovku.
+        """
+        return Font.text_cache.get_or_create((*self.key, text), lambda: self._render(text))
+
+    def _render(self, text: str):
+        surface = self.font.render(text, False, self.color)
+        # v inej mierke okna sa text vyrenderuje ostro väčším písmom, nie preškáluje
+        Viewport.register(surface, lambda scale: self.render_scaled(text, scale))
+        return surface
+
+    def render_scaled(self, text: str, scale: float):
+        """Vyrenderuje text písmom vo veľkosti pre zadanú mierku"""
+        return Font.load(*self.key[:2], scale).render(text, False, self.color)
 
 
 class InputBox:
@@ -124,23 +195,24 @@ class InputBox:
         self.pos = None
         self.placeholder = placeholder
         self.x, self.y = None, None
-        self.bg = pg.image.load(tools.parse_path(setup.IMG_PATH, 'text_input', "ti_white.png")).convert_alpha()
+        self.bg = Assets.sprite(tools.parse_path(setup.IMG_PATH, 'text_input', "ti_white.png"))
         self.width, self.height = self.bg.get_size()
         self.value = ""
-        self.font = Font(size='sm')
+        self.font = Font.get(size='sm')
         self.active = False
         self.timer = 0
         self.cursor_visible = False
         self._set_pos(pos) if pos else None
 
-    def activate(self):
+    def activate(self, mouse_pos: Tuple = None):
         """
         Aktivácia boxu - spustí sa len v prípade ak má box definovanú
         pozíciu. Pozícia môže byť definovaná v konštruktore alebo pri vykreslení
+        :param mouse_pos: Pozícia kliknutia, None = aktuálna pozícia myši
         """
         if not self.pos:
             return
-        mx, my = pg.mouse.get_pos()
+        mx, my = mouse_pos or pg.mouse.get_pos()
         if self.x <= mx <= self.x + self.width:
             if self.y <= my <= self.y + self.height:
                 self.active = True
@@ -156,18 +228,23 @@ class InputBox:
             self.cursor_visible = not self.cursor_visible
             self.timer = now
 
+    def next_timer(self, now):
+        """Počet ms do ďalšieho bliknutia kurzora, None ak box nie je aktívny"""
+        if not self.active:
+            return None
+        return self.timer + setup.BLINK_TIME + 1 - now
+
     def input(self, event, on_confirm: Callable, params: Tuple = ()):
         """
         Vstup do text inputu - skontroluje či je aktívny,
-        získa stlačene klávesy a podla toho vykoná prislušnú akciu.
+        podľa klávesy z eventu vykoná prislušnú akciu.
         [BACKSPACE -> mazanie, ENTER -> callback, * -> pridanie znaku]
         """
         if self.active:
-            key = pg.key.get_pressed()
             # backspace -> remove last character from value
-            if key[pg.K_BACKSPACE]:
+            if event.key == pg.K_BACKSPACE:
                 self.value = self.value[:-1]
-            elif key[pg.K_RETURN]:
+            elif event.key == pg.K_RETURN:
                 on_confirm(*params)
             else:
                 self.value += tools.strip_accents(event.unicode)
@@ -188,8 +265,8 @@ class InputBox:
         screen.blit(self.bg, self.pos)
         screen.blit(text, (self.x + self.width / 2 - tw / 2, self.y + self.height / 2 - th / 2))
         if self.active and self.cursor_visible:
-            pg.draw.rect(screen, (0, 0, 0),
-                         (self.x + self.width / 2 + tw / 2, self.y + self.height / 2 - th / 2, 2, th))
+            screen.draw_rect((0, 0, 0),
+                             (self.x + self.width / 2 + tw / 2, self.y + self.height / 2 - th / 2, 2, th))
 
     def get_value(self):
         """Vráti hodnotu inputboxu očistenú od medzier"""
@@ -222,20 +299,25 @@ class InputBox:
 class Menu:
     def __init__(self, title: str = "Menu", margin: int = 20):
         self.buttons_height = 0
-        self.width, self.height = pg.display.get_surface().get_size()
+        self.width, self.height = setup.SCREEN_SIZE
         self.title = title
         self.margin = margin
         self.buttons = []
         self.buttons_height = 0
-        self.last_hovered = None
+        self.router = EventRouter()
+        self.title_font = Font.get('vintage', 'xl', 'yellow')
 
-    def add_button(self, text: str, action: Callable, params: Tuple = (), _type: str = 'primary'):
+    def add_button(self, text: str, action: Callable, params: Tuple = (), _type: str = 'primary',
+                   on_hover: Callable = None):
         """
         Vytvorí tlačidlo, a následnej prepočíta
-        pozície všetkých tlačidiel v menu
+        pozície všetkých tlačidiel v menu. Vráti vytvorené tlačidlo
         """
-        self.buttons.append(Button(text, (0, 0), action, params, _type))
+        button = Button(text, (0, 0), action, params, _type, on_hover)
+        self.buttons.append(button)
         self._recalculate_button_positions()
+        self.router.add(button)
+        return button
 
     def _recalculate_button_positions(self):
         """Prepočíta pozície tlačidiel"""
@@ -251,12 +333,11 @@ class Menu:
             i += 1
 
     def handle_event(self, event):
-        for button in self.buttons:
-            button.handle_event(event)
+        """Event dostane len tlačidlo pod myšou"""
+        self.router.dispatch(event)
 
     def draw(self, screen):
-        font = Font('vintage', 'xl', 'yellow')
-        text = font.render(self.title)
+        text = self.title_font.render(self.title)
         tw, th = text.get_size()
         screen.blit(text, (self.width / 2 - tw / 2, self.margin))
         for button in self.buttons:
@@ -264,18 +345,48 @@ class Menu:
 
 
 class Table:
-    def __init__(self, title: str, data: list, numbering: bool = True):
-        self.width, self.height = pg.display.get_surface().get_size()
-        self.data = data
+    def __init__(
+            self, title: str,
+            data: list = None,
+            numbering: bool = True,
+            bottom: int = None,
+            loader: Callable = None,
+            page_size: int = setup.TABLE_PAGE_SIZE
+    ):
+        """
+        Tabuľka, ktorá vykresľuje len riadky viditeľné v okne tabuľky.
+        Vyrenderované riadky sa držia v cache, posúva sa kolieskom myši
+        alebo klávesami (šípky, PageUp/PageDown, Home/End).
+        :param data: Riadky tabuľky (list dict), pri loaderi sa dopĺňajú postupne
+        :param bottom: Spodný okraj okna tabuľky, None = spodok obrazovky
+        :param loader: Funkcia (offset, limit, on_done) -> ApiCall načítavajúca
+            ďalšiu stranu dát, on_done dostane list riadkov alebo None pri chybe
+        :param page_size: Počet riadkov načítaných naraz
+        """
+        self.width, self.height = setup.SCREEN_SIZE
+        self.data = list(data or [])
         self.numbering = numbering
-        self.table = []
+        self.columns = []
         self.title = title
-        self.title_font = Font('vintage', 'xl', 'yellow')
-        self.header_font = Font('vintage', 'lg', 'yellow')
-        self.data_font = Font('regular', 'sm', 'white')
+        self.title_font = Font.get('vintage', 'xl', 'yellow')
+        self.header_font = Font.get('vintage', 'lg', 'yellow')
+        self.data_font = Font.get('regular', 'sm', 'white')
         self.padding = 20
-        self.col_count = 0
         self.col_width = self.width
+        self.row_height = int(self.data_font.font.get_linesize() * 1.5)
+        self.rows_top = (self.title_font.font.get_linesize() + self.header_font.font.get_linesize()
+                         + self.padding * 3)
+        self.bottom = bottom if bottom is not None else self.height - self.padding
+        self.visible = max(1, int(self.bottom - self.rows_top) // self.row_height)
+        self.scroll = 0
+        # vyrenderované riadky podľa indexu, texty riadkov nejdú do zdieľanej cache fontov
+        self.row_cache = LRUCache(setup.TABLE_ROW_CACHE)
+        self.loader = loader
+        self.page_size = page_size
+        self.has_more = loader is not None
+        self.call = None
+        if numbering:
+            self.columns.append(("No.", None, None))
 
     def add_column(self, col_name: str, key: str, formatter: Callable = None):
         """
@@ -284,27 +395,118 @@ class Table:
         :param key: Kľúč pre dáta
         :param formatter: Preformátovanie dát
         """
-        self.table.append({
-            "header": col_name,
-            "data": [i[key] for i in self.data]
-        })
-        if formatter:
-            self.table[-1]["data"] = list(map(formatter, self.table[-1]["data"]))
-        if self.numbering and self.table[0]["header"] != "No.":
-            self.table.insert(0, {
-                "header": "No.",
-                "data": list(range(1, len(self.data) + 1))
-            })
-        self.col_width = self.width / len(self.table)
+        self.columns.append((col_name, key, formatter))
+        self.col_width = self.width / len(self.columns)
+        self.row_cache.clear()
+
+    def set_data(self, data: list):
+        """Nahradí riadky tabuľky a posunie ju na začiatok"""
+        self.data = list(data)
+        self.scroll = 0
+        self.row_cache.clear()
+
+    def clear(self):
+        """Vyprázdni tabuľku a zruší načítavanie strany"""
+        if self.call:
+            self.call.cancel()
+            self.call = None
+        self.set_data([])
+        self.has_more = self.loader is not None
+
+    def load(self):
+        """Načíta ďalšiu stranu dát cez loader, vráti ApiCall (None ak netreba)"""
+        if not self.has_more or self.call:
+            return None
+        call = self.loader(len(self.data), self.page_size, self.page_loaded)
+        # loader môže dáta vrátiť hneď (lokálne úložisko), vtedy nič nečaká
+        if call and not call.done():
+            self.call = call
+        return self.call
+
+    def page_loaded(self, rows: list):
+        self.call = None
+        if rows is None:
+            # pri chybe sa strana skúsi načítať znovu pri ďalšom posune
+            return
+        self.data.extend(rows)
+        if len(rows) < self.page_size:
+            self.has_more = False
+        self.prerender()
+        self.prefetch()
+
+    def prefetch(self):
+        """Ak sa okno tabuľky blíži ku koncu načítaných dát, načíta ďalšiu stranu"""
+        if self.scroll + self.visible + self.page_size // 2 >= len(self.data):
+            self.load()
+
+    def scroll_to(self, row: int):
+        self.scroll = max(0, min(row, len(self.data) - self.visible))
+        self.prefetch()
+
+    def handle_event(self, event):
+        if event.type == pg.MOUSEWHEEL:
+            self.scroll_to(self.scroll - event.y * 3)
+        elif event.type == pg.KEYDOWN:
+            steps = {
+                pg.K_UP: -1,
+                pg.K_DOWN: 1,
+                pg.K_PAGEUP: -self.visible,
+                pg.K_PAGEDOWN: self.visible,
+            }
+            if event.key in steps:
+                self.scroll_to(self.scroll + steps[event.key])
+            elif event.key == pg.K_HOME:
+                self.scroll_to(0)
+            elif event.key == pg.K_END:
+                self.scroll_to(len(self.data))
+
+    def prerender(self):
+        """Vyrenderuje nadpisy a viditeľné riadky vopred, aby prvý snímok nič nerenderoval"""
+        self.title_font.render(self.title)
+        for header, _, _ in self.columns:
+            self.header_font.render(header)
+        for index in range(self.scroll, min(len(self.data), self.scroll + self.visible)):
+            self.row_cache.get_or_create(index, lambda: self.render_row(index))
+
+    def render_row(self, index: int, scale: float = 1):
+        """Vyrenderuje všetky bunky riadku do jedného surfacu (v mierke okna scale)"""
+        surface = pg.Surface((round(self.width * scale), round(self.row_height * scale)), pg.SRCALPHA)
+        font = Font.load(*self.data_font.key[:2], scale)
+        item = self.data[index]
+        for i, (_, key, formatter) in enumerate(self.columns):
+            value = index + 1 if key is None else item[key]
+            if formatter:
+                value = formatter(value)
+            text = font.render(str(value), False, self.data_font.color)
+            surface.blit(text, (round((i * self.col_width + self.padding) * scale), 0))
+        if scale == 1:
+            Viewport.register(surface, lambda s: self.render_row(index, s))
+        return surface
 
     def draw(self, screen):
+        self.draw_header(screen)
+        self.draw_rows(screen)
+
+    def draw_header(self, screen):
+        """Nadpis a hlavičky stĺpcov (nemenia sa pri posúvaní)"""
         t_text = self.title_font.render(self.title)
         screen.blit(t_text, (self.width / 2 - t_text.get_width() / 2, self.padding))
-        for i, col in enumerate(self.table):
-            h_txt = self.header_font.render(col['header'])
+        for i, (header, _, _) in enumerate(self.columns):
+            h_txt = self.header_font.render(header)
             screen.blit(h_txt, (i * self.col_width + self.padding, t_text.get_height() + self.padding * 2))
-            for j, item in enumerate(col['data']):
-                d_text = self.data_font.render(str(item))
-                screen.blit(d_text, (
-                    i * self.col_width + self.padding,
-                    j * (d_text.get_height() * 1.5) + h_txt.get_height() + t_text.get_height() + self.padding * 3))
+
+    def draw_rows(self, screen):
+        """Viditeľné riadky a posuvník"""
+        end = min(len(self.data), self.scroll + self.visible)
+        for j, index in enumerate(range(self.scroll, end)):
+            row = self.row_cache.get_or_create(index, lambda: self.render_row(index))
+            screen.blit(row, (0, self.rows_top + j * self.row_height))
+        if len(self.data) > self.visible:
+            self.draw_scrollbar(screen)
+
+    def draw_scrollbar(self, screen):
+        track = pg.Rect(self.width - self.padding / 2 - 3, self.rows_top, 3, self.visible * self.row_height)
+        thumb_height = max(10, track.height * self.visible // len(self.data))
+        thumb_y = track.y + (track.height - thumb_height) * self.scroll // max(1, len(self.data) - self.visible)
+        screen.draw_rect(setup.COLORS['dark'], track)
+        screen.draw_rect(setup.COLORS['light'], (track.x, thumb_y, track.w, thumb_height))
@@ -0,0 +1,61 @@
+import random
+
+"""
+Pravidlá hry Simon nezávislé od pygame (sekvencia, kontrola vstupu, skóre).
+Scény hry ich len ovládajú, simulácia (src.simulation) ich používa bez displeja.
+"""
+
+# Výsledky stlačenia dlaždice
+CORRECT = "correct"
+COMPLETE = "complete"
+WRONG = "wrong"
+
+
+class SimonCore:
+    def __init__(self, tiles: int = 4, seed: int = None):
+        """
+        :param tiles: Počet dlaždíc, id dlaždíc sú 1 až tiles
+        :param seed: Seed generátora sekvencie, None = náhodný (uloží sa do seed)
+        """
+        self.tiles = tiles
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.random = random.Random(self.seed)
+        self.sequence = []
+        self.position = 0
+        self.score = 0
+
+    def generate_next(self):
+        """
+        Vygeneruje ďalšie náhodné číslo do sekvencie
+        Čísla od 1 do počtu dlaždíc súhlasia s id jednotlivých tiles
+        """
+        self.sequence.append(self.random.randint(1, self.tiles))
+        return self.sequence[-1]
+
+    def start_round(self):
+        """Začiatok ťahu hráča - opakuje sa sekvencia od začiatku"""
+        self.position = 0
+
+    def expected(self):
+        """Id dlaždice, ktorú má hráč stlačiť"""
+        return self.sequence[self.position]
+
+    def press(self, tile_id: int):
+        """
+        Spracuje stlačenie dlaždice hráčom a vráti výsledok
+        CORRECT - správna dlaždica, COMPLETE - správne zopakovaná celá sekvencia
+        (skóre sa zvýši), WRONG - nesprávna dlaždica (koniec hry)
+        """
+        if tile_id != self.expected():
+            return WRONG
+        self.position += 1
+        if self.position == len(self.sequence):
+            self.score += 1
+            return COMPLETE
+        return CORRECT
+
+    def reset(self):
+        """Nová hra, generátor pokračuje v rovnakej postupnosti"""
+        self.sequence = []
+        self.position = 0
+        self.score = 0
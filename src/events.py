@@ -0,0 +1,119 @@
+from typing import List
+import pygame as pg
+
+from src import setup
+
+"""
+Smerovanie eventov myši. Klikateľné komponenty sa zaregistrujú do
+EventRouter, ktorý ich drží v mriežke (priestorový index), takže pozícia
+eventu sa vyhodnotí raz a event dostane len komponent pod myšou.
+"""
+
+POSITION_EVENTS = (pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP)
+
+
+# Eventy, ktoré hra nespracúva a zariadenia ich posielajú vo veľkom množstve
+# (dotyk, joystick/gamepad, presúvanie okna). Ostatné eventy ostávajú povolené,
+# hlavne TEXTINPUT (písanie s diakritikou) a eventy okna (WINDOWEXPOSED...)
+NOISY_EVENTS = [
+    pg.FINGERMOTION, pg.FINGERDOWN, pg.FINGERUP, pg.MULTIGESTURE,
+    pg.JOYAXISMOTION, pg.JOYBALLMOTION, pg.JOYHATMOTION,
+    pg.CONTROLLERAXISMOTION, pg.CONTROLLERSENSORUPDATE, pg.CONTROLLERTOUCHPADMOTION,
+    pg.WINDOWMOVED,
+]
+
+
+def block_events(types: list = NOISY_EVENTS):
+    """
+    Zadané typy eventov sa zahodia už v SDL, nedostanú sa do fronty pygame
+    a nezobudia čakanie v idle móde
+    """
+    pg.event.set_blocked(types)
+
+
+def coalesce_motion(events: List[pg.event.Event]):
+    """
+    Spojí po sebe idúce MOUSEMOTION eventy do jedného (posledná pozícia,
+    súčet posunov). Myši s vysokým DPI ich posielajú stovky za snímok,
+    poradie voči ostatným eventom (kliknutia, klávesy) sa zachová
+    """
+    result = []
+    run = []
+    for event in events + [None]:
+        if event is not None and event.type == pg.MOUSEMOTION:
+            run.append(event)
+            continue
+        if len(run) == 1:
+            result.append(run[0])
+        elif run:
+            last = run[-1]
+            rel = (sum(e.rel[0] for e in run), sum(e.rel[1] for e in run))
+            result.append(pg.event.Event(pg.MOUSEMOTION, pos=last.pos, rel=rel, buttons=last.buttons))
+        run = []
+        if event is not None:
+            result.append(event)
+    return result
+
+
+class EventRouter:
+    def __init__(self, cell_size: int = setup.HIT_GRID_CELL):
+        """
+        :param cell_size: Veľkosť bunky mriežky v logických pixeloch
+        """
+        self.cell_size = cell_size
+        self.targets = []
+        self.grid = None
+        self.hovered = None
+
+    def add(self, *targets):
+        """Zaregistruje klikateľné komponenty (po nastavení ich pozície)"""
+        self.targets.extend(targets)
+        self.grid = None
+
+    def invalidate(self):
+        """Pozície komponentov sa zmenili, index sa pri ďalšom evente vytvorí znova"""
+        self.grid = None
+
+    def _cells(self, target):
+        size = self.cell_size
+        for cx in range(int(target.x // size), int((target.x + target.width) // size) + 1):
+            for cy in range(int(target.y // size), int((target.y + target.height) // size) + 1):
+                yield cx, cy
+
+    def _build(self):
+        self.grid = {}
+        for target in self.targets:
+            for cell in self._cells(target):
+                self.grid.setdefault(cell, []).append(target)
+
+    def hit(self, pos):
+        """Komponent na pozícii (prvý zaregistrovaný), None ak tam žiadny nie je"""
+        if self.grid is None:
+            self._build()
+        cell = (int(pos[0] // self.cell_size), int(pos[1] // self.cell_size))
+        for target in self.grid.get(cell, ()):
+            if target.enabled and target.mouse_over(pos):
+                return target
+        return None
+
+    def reset(self):
+        """Zabudne komponent pod myšou (pri opustení scény)"""
+        if self.hovered:
+            self.hovered.leave()
+        self.hovered = None
+
+    def dispatch(self, event):
+        """
+        Doručí event s pozíciou myši komponentu pod myšou a vráti ho.
+        Pri pohybe myši mimo komponentu mu oznámi odchod (leave)
+        """
+        if event.type not in POSITION_EVENTS:
+            return None
+        target = self.hit(event.pos)
+        if event.type == pg.MOUSEMOTION and target is not self.hovered:
+            if self.hovered:
+                self.hovered.leave()
+            self.hovered = target
+        if target:
+            target.handle_event(event)
+        return target
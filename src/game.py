@@ -1,12 +1,122 @@
-import random
+import json
+import queue
+import re
+import time
 import importlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
 import pygame as pg
 from src import setup, tools
+from src.cache import ResponseCache
+from src.core import SimonCore
+from src.assets import Assets
+from src.audio import Audio, Music
 from src.components import Tile
+from src.metrics import FrameStats, PrefetchStats, RequestStats, startup
+from src.profiler import Profiler
+from src.render import Renderer
+from src.store import ScoreStore, ScoreSync
+from src.viewport import Viewport, set_mode
+from src.events import block_events, coalesce_motion
 import requests as req
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Event poslaný po dokončení požiadavky na server (prebudí hlavný cyklus)
+API_EVENT = pg.USEREVENT + 1
+# Event s výsledkom overenia spojenia so serverom (atribút connected)
+CONNECTION_EVENT = pg.USEREVENT + 2
+# Eventy okna, po ktorých treba obrazovku prekresliť celú (dirty rects nestačia)
+EXPOSE_EVENTS = (pg.VIDEOEXPOSE, pg.WINDOWEXPOSED, pg.WINDOWRESTORED)
+
+
+class ApiCall:
+    def __init__(self, future: Future, callback: Callable = None):
+        """
+        Požiadavka na server bežiaca na pozadí
+        :param future: Future s výsledkom (dáta, status)
+        :param callback: Funkcia zavolaná v hlavnom vlákne po dokončení
+        """
+        self.future = future
+        self.callback = callback
+        self.cancelled = False
+        self.handled = False
+
+    def done(self):
+        """Požiadavka skončila a jej callback už bol zavolaný"""
+        return self.handled
+
+    def result(self):
+        """Vráti (dáta, status), blokuje kým požiadavka neskončí"""
+        return self.future.result()
+
+    def cancel(self):
+        """
+        Zruší požiadavku. Ak sa ešte nezačala vykonávať, vôbec sa
+        neodošle, inak sa jej výsledok zahodí a callback sa nezavolá.
+        """
+        self.cancelled = True
+        self.future.cancel()
 
 
 class Api:
+    executor = ThreadPoolExecutor(max_workers=setup.API_WORKERS, thread_name_prefix="api")
+    completed = queue.SimpleQueue()
+    pending = 0
+    stats = RequestStats()
+    cache = ResponseCache(setup.RESPONSE_CACHE_PATH, setup.RESPONSE_CACHE_TTL, setup.RESPONSE_CACHE_SIZE)
+    session = None
+    probe_session = None
+    session_lock = threading.Lock()
+
+    @staticmethod
+    def get_session():
+        """
+        Vráti zdieľanú session s poolom keep-alive spojení na server.
+        Opakovanie pri chybe sa týka len idempotentných požiadaviek (GET, HEAD).
+        """
+        with Api.session_lock:
+            if Api.session is None:
+                retry = Retry(
+                    total=setup.API_RETRIES,
+                    backoff_factor=setup.API_BACKOFF,
+                    status_forcelist=(500, 502, 503, 504),
+                    allowed_methods=frozenset(['GET', 'HEAD'])
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=setup.API_POOL_SIZE,
+                    pool_maxsize=setup.API_POOL_SIZE,
+                    max_retries=retry
+                )
+                session = req.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                Api.session = session
+            return Api.session
+
+    @staticmethod
+    def get_probe_session():
+        """
+        Session pre overenie spojenia - jeden pokus bez opakovania, aby
+        nedostupný server nepredĺžil čakanie a chyba servera (5xx) sa
+        nepovažovala za nedostupnosť
+        """
+        with Api.session_lock:
+            if Api.probe_session is None:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+                session = req.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                Api.probe_session = session
+            return Api.probe_session
+
+    @staticmethod
+    def endpoint_name(method: str, endpoint: str):
+        """Normalizuje endpoint pre štatistiky (id -> {id})"""
+        endpoint = endpoint.split('?')[0]
+        return method + ' ' + re.sub(r'(?<=/)\d+(?=/|$)', '{id}', '/' + endpoint).lstrip('/')
+
     @staticmethod
     def return_response(response: req.Response):
         if response.status_code == 200 or response.status_code == 201:
@@ -15,16 +125,146 @@ class Api:
             return False, response.status_code
 
     @staticmethod
-    def get(endpoint: str):
+    def url(endpoint: str):
+        """
+        Celá adresa endpointu. Slúži aj ako kľúč v Api.cache, aby sa
+        odpovede rôznych serverov (napr. lokálneho stub servera) nemiešali
+        """
+        return setup.SERVER_URL + '/' + endpoint.strip('/')
+
+    @staticmethod
+    def send(method: str, endpoint: str, data: dict = None, cached: bool = False):
+        """
+        Synchrónne odoslanie požiadavky, volá sa vo vlákne na pozadí.
+        Pri chybe spojenia alebo vypršaní času vráti (False, None)
+        Pri cached sa GET pošle ako podmienený a odpoveď sa uloží do Api.cache
+        """
         endpoint = endpoint.strip('/')
-        res = req.get(setup.SERVER_URL + '/' + endpoint)
-        return Api.return_response(res)
+        name = Api.endpoint_name(method, endpoint)
+        url = Api.url(endpoint)
+        headers = Api.cache.validators(url) if cached else None
+        start = time.perf_counter()
+        try:
+            res = Api.get_session().request(method, url, data=data, headers=headers, timeout=setup.API_TIMEOUT)
+            if cached and res.status_code == 304:
+                Api.cache.touch(url)
+                result = Api.cache.cached(url), 200
+            else:
+                result = Api.return_response(res)
+                if cached and result[0]:
+                    Api.cache.put(url, result[0], res.headers.get('ETag'), res.headers.get('Last-Modified'))
+        except (req.RequestException, ValueError):
+            Api.stats.record(name, (time.perf_counter() - start) * 1000, error=True)
+            if cached:
+                Api.cache.release(url)
+            return False, None
+        if cached and not result[0]:
+            Api.cache.release(url)
+        sent = len(res.request.body or b'')
+        Api.stats.record(name, (time.perf_counter() - start) * 1000, sent, len(res.content), not result[0])
+        return result
 
     @staticmethod
-    def post(endpoint: str, data: dict):
+    def request(method: str, endpoint: str, data: dict = None, callback: Callable = None):
+        """
+        Odošle požiadavku na pozadí a hneď vráti ApiCall. Callback
+        dostane (dáta, status) a zavolá sa v hlavnom vlákne v Api.poll
+        """
+        return Api.wrap(Api.executor.submit(Api.send, method, endpoint, data), callback)
+
+    @staticmethod
+    def wrap(future: Future, callback: Callable = None):
+        """Vytvorí ApiCall pre future s výsledkom (dáta, status)"""
+        call = ApiCall(future, callback)
+        Api.pending += 1
+        call.future.add_done_callback(lambda f: Api.complete(call))
+        return call
+
+    @staticmethod
+    def complete(call: ApiCall):
+        """Zaradí dokončenú požiadavku na spracovanie a prebudí hlavný cyklus"""
+        Api.completed.put(call)
+        try:
+            pg.event.post(pg.event.Event(API_EVENT))
+        except pg.error:
+            pass
+
+    @staticmethod
+    def ping():
+        """
+        Overí na pozadí dostupnosť servera (HEAD setup.SERVER_URL).
+        Server je dostupný ak vráti akúkoľvek odpoveď (aj chybu), výsledok
+        sa pošle ako CONNECTION_EVENT a je aj výsledkom vráteného future
+        """
+        def probe():
+            try:
+                Api.get_probe_session().head(setup.SERVER_URL, timeout=setup.CONNECT_TIMEOUT)
+                connected = True
+            except req.RequestException:
+                connected = False
+            try:
+                pg.event.post(pg.event.Event(CONNECTION_EVENT, connected=connected))
+            except pg.error:
+                pass
+            return connected
+
+        return Api.executor.submit(probe)
+
+    @staticmethod
+    def get(endpoint: str, callback: Callable = None, cached: bool = False):
+        """
+        GET požiadavka. Pri cached sa odpoveď v Api.cache vráti hneď (callback
+        sa zavolá v najbližšom Api.poll), stará odpoveď sa navyše overí na pozadí
+        """
+        if not cached:
+            return Api.request('GET', endpoint, callback=callback)
         endpoint = endpoint.strip('/')
-        res = req.post(setup.SERVER_URL + '/' + endpoint, data=data)
-        return Api.return_response(res)
+        data, revalidate = Api.cache.lookup(Api.url(endpoint))
+        if data is None:
+            return Api.wrap(Api.executor.submit(Api.send, 'GET', endpoint, None, True), callback)
+        if revalidate:
+            Api.executor.submit(Api.send, 'GET', endpoint, None, True)
+        future = Future()
+        future.set_result((data, 200))
+        return Api.wrap(future, callback)
+
+    @staticmethod
+    def post(endpoint: str, data: dict, callback: Callable = None):
+        return Api.request('POST', endpoint, data, callback)
+
+    @staticmethod
+    def poll():
+        """Zavolá callbacky dokončených požiadaviek (volá sa raz za snímok)"""
+        while not Api.completed.empty():
+            call = Api.completed.get()
+            call.handled = True
+            Api.pending -= 1
+            if call.cancelled or call.future.cancelled() or not call.callback:
+                continue
+            call.callback(*call.result())
+
+    @staticmethod
+    def pending_count():
+        """Počet odoslaných požiadaviek, ktoré ešte neboli spracované"""
+        return Api.pending
+
+    @staticmethod
+    def dump_stats(path: str):
+        """Uloží štatistiky požiadaviek a cache odpovedí do JSON súboru"""
+        with open(path, 'w') as f:
+            json.dump({**Api.stats.to_dict(), 'response_cache': Api.cache.info()}, f, indent=2)
+
+    @staticmethod
+    def shutdown():
+        """Zruší čakajúce požiadavky, ukončí vlákna na pozadí a zatvorí spojenia"""
+        Api.executor.shutdown(wait=False, cancel_futures=True)
+        Api.cache.save()
+        if setup.API_STATS_FILE:
+            Api.dump_stats(setup.API_STATS_FILE)
+        if Api.session:
+            Api.session.close()
+        if Api.probe_session:
+            Api.probe_session.close()
 
 
 class Player:
@@ -34,44 +274,100 @@ class Player:
         self.high_score = 0
         self.score = 0
         self.scores = []
-        self.click_count = 0
-        self.is_connected = tools.check_internet()
+        # None = overuje sa, výsledok príde ako CONNECTION_EVENT
+        self.is_connected = None
+        self.check_connection()
+        # skóre sa ukladajú lokálne a na server sa posielajú na pozadí
+        self.store = ScoreStore(setup.STORE_PATH)
+        self.sync = ScoreSync(self.store, Api.send, on_sent=Player.invalidate_scores)
+        self.sync.start()
 
-    def create_user(self, name):
+    def check_connection(self):
+        """Spustí overenie spojenia so serverom na pozadí"""
+        self.is_connected = None
+        Api.ping()
+
+    def create_user(self, name, on_done: Callable = None):
         """
         Vytvorí nového používatela alebo vráti už existujúceho.
-        V prípade že sa požiadavka nevykoná, vráti
+        V prípade že sa požiadavka nevykoná, použije sa lokálne uložený
+        používateľ. Po dokončení sa zavolá on_done.
         """
-        res, status = Api.post('users', {'name': name})
-        if not res:
+        def created(res, status):
             self.name = name
-            return False
-        data = res['data']
-        self._id = data['id']
-        self.name = data['name']
-        self.high_score = data['high_score']
+            if res:
+                data = res['data']
+                self._id = data['id']
+                self.name = data['name']
+                self.store.save_user(self.name, self._id, data['high_score'])
+                self.import_scores()
+            else:
+                self.store.save_user(name)
+            user = self.store.user(self.name)
+            self.high_score = user['high_score']
+            self.sync.notify()
+            if on_done:
+                on_done()
+
+        return Api.post('users', {'name': name}, created)
 
-    def get_user_scores(self):
-        """Získa top 10 dosiahnutých skóre pre daného používateľa"""
-        res, status = Api.get(f'user/{self._id}/top-scores')
-        if res:
-            self.scores = res['data']
+    def import_scores(self):
+        """Stiahne skóre používateľa zo servera do lokálneho úložiska (na pozadí)"""
+        def loaded(res, status):
+            if res:
+                self.store.import_scores(name, res['data'])
+
+        name = self.name
+        return Api.get(f'user/{self._id}/top-scores?limit={setup.STORE_IMPORT_LIMIT}', loaded)
+
+    def get_user_scores(self, on_done: Callable = None, offset: int = 0, limit: int = 10):
+        """
+        Vráti stranu najlepších skóre používateľa z lokálneho úložiska
+        (bez požiadavky na server), on_done dostane načítané skóre
+        """
+        self.scores = self.store.top_scores(self.name, offset, limit)
+        if on_done:
+            on_done(self.scores)
 
     def create_score(self):
-        """Pošle skóre na server a vráti info či je nové skóre najlepšie"""
-        Api.post('scores', {'score': self.score, 'user_id': self._id})
+        """
+        Uloží skóre do lokálneho úložiska, odkiaľ sa na pozadí pošle
+        na server, a vráti info či je nové skóre najlepšie
+        """
+        self.store.add_score(self.name, self.score)
+        self.sync.notify()
+        Player.invalidate_scores()
         if self.score > self.high_score:
             self.high_score = self.score
             return True
         else:
             return False
 
+    @staticmethod
+    def invalidate_scores():
+        """Zahodí odpovede s najlepšími skóre z cache (po novom skóre)"""
+        Api.cache.invalidate(Api.url('top-scores'))
+
+    def close(self):
+        """Ukončí synchronizáciu, neodoslané skóre ostanú vo fronte na ďalší štart"""
+        self.sync.stop()
+        self.sync.join(1)
+        if not self.sync.is_alive():
+            self.store.close()
+
 
 class Game:
     def __init__(self):
         self.player = Player()
+        startup.mark('player')
         self.screen = pg.display.get_surface()
-        self.width, self.height = self.screen.get_size()
+        block_events()
+        # rozloženie scén je v logických súradniciach, viewport ich prepočíta na pixely okna
+        self.viewport = Viewport(self.screen.get_size())
+        self.fullscreen = setup.FULLSCREEN
+        self.renderer = Renderer(self.screen, setup.COLORS['background'], full_redraw=not setup.DIRTY_RECTS,
+                                 viewport=self.viewport)
+        self.width, self.height = setup.SCREEN_SIZE
         self.clock = pg.time.Clock()
         self.tiles = [
             Tile(1, "red", (self.width / 2 + 10, 20)),
@@ -79,73 +375,317 @@ class Game:
             Tile(3, "yellow", (20, self.width / 2 + 10)),
             Tile(4, "green", (20, 20))
         ]
-        self.sequence = []
-        self.is_music = True
+        startup.mark('assets')
+        self.core = SimonCore(len(self.tiles), setup.SEED)
+        Audio.reserve([tile.id for tile in self.tiles])
+        self.is_music = setup.MUSIC
         self.running = True
-        self.scenes = self.attach_scenes()
-        self.scene = self.scenes[setup.START_SCENE]
         self.top_scores = []
+        self.scenes = {}
+        self.prewarm_queue = []
+        self.idle_mode = setup.IDLE_MODE
+        self.waiting_event = None
+        self.wake_click = None
+        # zdroj eventov, pri nahrávaní/prehrávaní sa nahradí (src.replay)
+        self.event_source = self.poll_events
+        # simulačný čas hry (ms) beží po pevných krokoch nezávisle od vykresľovania
+        self.time_source = lambda: time.perf_counter() * 1000
+        self.sim_time = None
+        self.last_time = None
+        self.accumulator = 0
+        self.alpha = 0
+        self.frame_stats = {}
+        self.frame_start = None
+        self.was_idle = False
+        self.prefetch_stats = PrefetchStats()
+        self.profiler = Profiler(self)
+        self.scene_classes = self.attach_scenes()
+        self.scene = self.get_scene(setup.START_SCENE)
+        startup.mark('scenes')
+
+    def get_top_scores(self, on_done: Callable = None, offset: int = 0, limit: int = 10):
+        """
+        Získa stranu najlepších skóre zo všetkých hráčov
+        on_done dostane načítané skóre alebo None pri chybe
+        """
+        def loaded(res, status):
+            if res:
+                self.top_scores = res['data']
+            if on_done:
+                on_done(res['data'] if res else None)
+
+        return Api.get(f'top-scores?offset={offset}&limit={limit}', loaded, cached=True)
+
+    @property
+    def sequence(self):
+        """Aktuálna sekvencia id dlaždíc (pravidlá hry sú v SimonCore)"""
+        return self.core.sequence
 
-    def get_top_scores(self):
-        """Získa top 10 najlepších skóre zo všetkých hráčov"""
-        res, status = Api.get('top-scores')
-        if res:
-            self.top_scores = res['data']
+    @sequence.setter
+    def sequence(self, sequence: list):
+        self.core.sequence = sequence
 
     def generate_next(self):
         """
         Vygeneruje ďalšie náhodné číslo do sekvencie
         Čísla od 1 do 4 súhlasia s id jednotlivých tiles
         """
-        self.sequence.append(random.randint(1, 4))
+        return self.core.generate_next()
 
     def attach_scenes(self):
         """
-        Dynamický import všetkých zaregistrovaných scén v
-        setup súbore. V každej scéne je prítupný game objekt.
+        Dynamický import všetkých zaregistrovaných scén v setup súbore.
+        Vráti triedy scén, samotné scény sa vytvárajú až pri prvom použití.
         """
         try:
-            scenes = {}
+            scene_classes = {}
             scene_module = importlib.import_module("src.scenes")
             for scene in setup.SCENES:
                 class_name = tools.snake_to_pascal(scene)
-                scene_class = getattr(scene_module, class_name)
-                scenes[scene] = scene_class(self)
-            return scenes
+                scene_classes[scene] = getattr(scene_module, class_name)
+            return scene_classes
         except:
             self.running = False
+            return {}
+
+    def get_scene(self, name: str):
+        """
+        Vráti scénu podľa názvu, pri prvom použití ju vytvorí
+        (načítanie obrázkov a zvukov). V každej scéne je prístupný game objekt.
+        """
+        if name not in self.scenes:
+            Assets.preload(name)
+            self.scenes[name] = self.scene_classes[name](self)
+        return self.scenes[name]
+
+    def queue_prewarm(self):
+        """Naplánuje vytvorenie scén, na ktoré sa dá z aktuálnej scény prejsť"""
+        if not setup.PREWARM_SCENES:
+            return
+        likely = [self.scene.next, self.scene.previous] + setup.PREWARM_SCENES.get(self.scene.name, [])
+        for name in likely:
+            if name and name not in self.scenes and name not in self.prewarm_queue:
+                self.prewarm_queue.append(name)
+
+    def prewarm(self):
+        """
+        Vytvorí jednu naplánovanú scénu. Volá sa v hlavnom vlákne po
+        vykreslení snímku, keďže pygame surfacy sa nesmú vytvárať inde.
+        """
+        while self.prewarm_queue:
+            name = self.prewarm_queue.pop(0)
+            if name not in self.scenes:
+                self.get_scene(name)
+                return
+
+    def prefetch(self, name: str):
+        """
+        Začne na pozadí načítavať dáta scény, na ktorú hráč pravdepodobne
+        prejde (scéna sa pritom vytvorí, ak ešte neexistuje)
+        """
+        scene = self.get_scene(name)
+        if not scene.prefetched and scene.prefetch():
+            scene.prefetched = True
+            self.prefetch_stats.record(name, 'started')
+
+    def settle_prefetches(self):
+        """
+        Po prechode na scénu - jej prefetch bol využitý, prefetche ostatných
+        scén boli zbytočné a ich dáta sa zahodia, aby neostali zastarané
+        """
+        for name, scene in self.scenes.items():
+            if not scene.prefetched:
+                continue
+            scene.prefetched = False
+            if scene is self.scene:
+                self.prefetch_stats.record(name, 'used')
+            else:
+                self.prefetch_stats.record(name, 'wasted')
+                scene.reset()
+
+    def set_music(self, enabled: bool):
+        """Zapne/vypne hudbu v pozadí"""
+        self.is_music = enabled
+        Music.scene_changed(self.scene.name, enabled)
+
+    def set_fullscreen(self, enabled: bool):
+        """Prepne hru na celú obrazovku (natívne rozlíšenie) alebo do okna"""
+        self.fullscreen = enabled
+        set_mode(enabled)
+        self.resize()
+
+    def resize(self):
+        """
+        Po zmene veľkosti okna prepočíta mierku a celú obrazovku prekreslí.
+        Obrázky a texty sa preškálujú raz pre novú mierku (cache viewportu),
+        statické vrstvy scén sa obnovia podľa novej veľkosti
+        """
+        self.screen = pg.display.get_surface()
+        self.renderer.screen = self.screen
+        self.viewport.resize(self.screen.get_size())
+        self.renderer.invalidate()
+
+    def poll_events(self):
+        """
+        Eventy z fronty pygame vrátane eventu, ktorý ukončil čakanie v idle móde.
+        Pozície myši sa prepočítajú na logické súradnice (aj pre nahrávanie)
+        """
+        events = pg.event.get()
+        if self.waiting_event:
+            events.insert(0, self.waiting_event)
+            self.waiting_event = None
+        return coalesce_motion([self.viewport.map_event(event) for event in events])
 
     def get_events(self):
         """
         Získa eventy, skontroluje či nenastal pokyn vypnutia v
         tom prípade vypne hru. Inak pošle eventy do aktuálnej scény
         """
-        for event in pg.event.get():
+        for event in self.event_source():
             if event.type == pg.QUIT:
                 self.running = False
+            elif event.type == pg.MOUSEBUTTONDOWN and event is not self.wake_click:
+                # čas vstupu sa zaznamená pri každom kliknutí, kliknutie,
+                # ktoré ukončilo čakanie, už zaznamenal wait()
+                Audio.mark_input()
+            elif event.type == pg.VIDEORESIZE:
+                self.resize()
+                continue
+            elif event.type in EXPOSE_EVENTS:
+                # odkrytá časť okna môže byť prázdna, prekreslí sa celá obrazovka
+                self.renderer.invalidate()
+                continue
+            elif event.type == pg.KEYDOWN and event.key == pg.K_F11:
+                self.set_fullscreen(not self.fullscreen)
+                continue
+            if self.profiler.handle_event(event):
+                continue
             self.scene.handle_event(event)
 
     def update(self):
+        """
+        Posunie simulačný čas o toľko pevných krokov (setup.TICK_MS), koľko
+        reálneho času uplynulo od posledného snímku. Zvyšok, ktorý nedal celý
+        krok, sa prenesie do ďalšieho snímku a cez alpha je prístupný pri
+        vykresľovaní (interpolácia medzi krokmi).
+        """
+        real = self.time_source()
+        if self.last_time is None:
+            # prvý snímok vždy obnoví scénu aspoň jedným krokom
+            self.sim_time = real - setup.TICK_MS
+            self.last_time = real
+            self.accumulator = setup.TICK_MS
+        self.accumulator += real - self.last_time
+        self.last_time = real
+        Api.poll()
+        steps = 0
+        while self.accumulator >= setup.TICK_MS and steps < setup.MAX_TICKS_PER_FRAME:
+            self.sim_time += setup.TICK_MS
+            self.accumulator -= setup.TICK_MS
+            self.tick(self.sim_time)
+            steps += 1
+        # po dlhom čakaní (idle mód) sa zvyšný čas dobehne jedným krokom
+        if self.accumulator >= setup.TICK_MS:
+            skipped = self.accumulator - self.accumulator % setup.TICK_MS
+            self.sim_time += skipped
+            self.accumulator -= skipped
+            self.tick(self.sim_time)
+        self.alpha = self.accumulator / setup.TICK_MS
+
+    def now(self):
+        """Aktuálny simulačný čas vrátane neodsimulovaného zvyšku"""
+        return (self.sim_time or 0) + self.accumulator
+
+    def tick(self, now):
         """
         Obnoví aktuálne aktívnu scénu. Skontroluje či je aktuálna scéna
         stále aktívna. Ak nie, resetuje ju, prejde na ďalšiu scénu. Nová
         scéna sa musí znova obnoviť aby sa zamedzilo prebliknutiu obrazovky.
         """
-        now = pg.time.get_ticks()
         self.scene.update(now)
         if self.scene.done:
             self.scene.reset()
-            self.scene = self.scenes[self.scene.next]
+            self.scene = self.get_scene(self.scene.next)
+            Music.scene_changed(self.scene.name, self.is_music)
+            self.settle_prefetches()
+            self.queue_prewarm()
             self.scene.update(now)
 
     def draw(self):
         """
-        Vyplní okno farbou špecifikovanou v setupe
-        a zavolá vykreslenie aktuálne aktívnej scény
+        Zavolá vykreslenie aktuálne aktívnej scény cez renderer - statickú
+        vrstvu a nad ňu dynamickú časť. Pozadie sa vyplní len v oblastiach,
+        ktoré sa od posledného snímku zmenili
         """
-        self.screen.fill(setup.COLORS['background'])
         if self.scene.start_time:
+            self.scene.draw_layer()
             self.scene.draw()
+        self.profiler.draw(self.renderer)
+
+    def wait(self):
+        """
+        Počká na ďalší snímok. Ak je zapnutý idle mód a scéna sa môže zmeniť
+        len na základe eventu, neobnovuje sa so stálou frekvenciou, ale čaká
+        na event alebo najbližší časovač scény (max. setup.IDLE_MAX_WAIT)
+        """
+        self.was_idle = False
+        if self.idle_mode and self.scene.is_idle() and not self.prewarm_queue:
+            self.was_idle = True
+            timeout = setup.IDLE_MAX_WAIT
+            for timer in (self.scene.next_timer(self.now()), Music.next_timer()):
+                if timer is not None:
+                    timeout = min(timeout, timer)
+            event = pg.event.wait(max(1, int(timeout)))
+            if event.type != pg.NOEVENT:
+                self.waiting_event = event
+            if event.type == pg.MOUSEBUTTONDOWN:
+                Audio.mark_input()
+                self.wake_click = event
+            # čakanie sa nezapočíta do obmedzenia FPS
+            self.clock.tick()
+        else:
+            self.clock.tick(setup.FPS)
+
+    def record_frame(self):
+        """Zaznamená dĺžku predchádzajúceho snímku (okrem čakania v idle móde)"""
+        now = time.perf_counter()
+        if self.frame_start is not None and not self.was_idle:
+            stats = self.frame_stats.setdefault(self.scene.name, FrameStats(1000 / setup.REFRESH_RATE))
+            stats.add((now - self.frame_start) * 1000)
+        self.frame_start = now
+
+    def frame_report(self):
+        """Štatistiky dĺžky snímkov pre jednotlivé scény"""
+        return {name: stats.to_dict() for name, stats in self.frame_stats.items()}
+
+    def step(self):
+        """Jeden snímok hry a čakanie na ďalší"""
+        self.frame()
+        with self.profiler.phase('clock.tick'):
+            self.wait()
+
+    def frame(self):
+        """Jeden snímok hry - eventy, obnovenie a vykreslenie"""
+        self.record_frame()
+        self.profiler.begin_frame()
+        with self.profiler.phase('get_events'):
+            self.get_events()
+        with self.profiler.phase('scene.update'):
+            self.update()
+            Music.update()
+        with self.profiler.phase('scene.draw'):
+            self.draw()
+        with self.profiler.phase('display.update'):
+            self.renderer.present()
+        if self.renderer.frames == 1:
+            startup.mark('first frame')
+            if setup.STARTUP_REPORT:
+                print(startup.report())
+            # hudba sa spustí až po prvom snímku, aby nezdržala štart
+            Music.scene_changed(self.scene.name, self.is_music)
+            self.queue_prewarm()
+        elif self.prewarm_queue:
+            self.prewarm()
 
     def main_loop(self):
         """
@@ -153,8 +693,4 @@ class Game:
         Obnovovacia frekvencia cyklu je špecifikovaná v setupe
         """
         while self.running:
-            self.get_events()
-            self.update()
-            self.draw()
-            pg.display.update()
-            self.clock.tick(setup.FPS)
+            self.step()
@@ -0,0 +1,174 @@
+import bisect
+import threading
+import time
+from collections import deque
+from typing import Sequence
+
+# Hranice košov histogramu latencie v milisekundách
+LATENCY_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence = LATENCY_BUCKETS):
+        """
+        Histogram hodnôt s pevnými hranicami košov. Posledný kôš
+        obsahuje všetky hodnoty väčšie ako posledná hranica.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self):
+        labels = [f"<={b}" for b in self.buckets] + [f">{self.buckets[-1]}"]
+        return {
+            'count': self.count,
+            'mean': round(self.mean(), 3),
+            'max': round(self.max, 3),
+            'buckets': dict(zip(labels, self.counts)),
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        """Štatistiky požiadaviek na jeden endpoint"""
+        self.latency = Histogram()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def to_dict(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'error_rate': round(self.errors / self.requests, 4) if self.requests else 0.0,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'latency_ms': self.latency.to_dict(),
+        }
+
+
+class RequestStats:
+    def __init__(self):
+        """
+        Zbiera štatistiky požiadaviek podľa endpointu. Zapisuje sa
+        z vlákien na pozadí, preto je prístup chránený zámkom.
+        """
+        self.endpoints = {}
+        self.lock = threading.Lock()
+
+    def record(self, endpoint: str, latency: float, sent: int = 0, received: int = 0, error: bool = False):
+        """
+        Zaznamená jednu požiadavku
+        :param endpoint: Normalizovaný endpoint (napr. "GET user/{id}/top-scores")
+        :param latency: Trvanie v milisekundách
+        :param sent: Počet odoslaných bajtov
+        :param received: Počet prijatých bajtov
+        :param error: Požiadavka zlyhala
+        """
+        with self.lock:
+            stats = self.endpoints.setdefault(endpoint, EndpointStats())
+            stats.requests += 1
+            stats.errors += int(error)
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+            stats.latency.add(latency)
+
+    def to_dict(self):
+        with self.lock:
+            return {endpoint: stats.to_dict() for endpoint, stats in sorted(self.endpoints.items())}
+
+    def reset(self):
+        with self.lock:
+            self.endpoints = {}
+
+
+class FrameStats:
+    def __init__(self, budget: float, size: int = 3600):
+        """
+        Štatistiky dĺžky snímkov jednej scény
+        :param budget: Dĺžka jedného snímku displeja v ms
+        :param size: Počet posledných snímkov z ktorých sa počítajú percentily
+        """
+        self.budget = budget
+        self.samples = deque(maxlen=size)
+        self.frames = 0
+        self.dropped = 0
+
+    def add(self, ms: float):
+        """Zaznamená snímok, snímok dlhší ako 1.5 násobok rozpočtu je vynechaný"""
+        self.samples.append(ms)
+        self.frames += 1
+        if ms > self.budget * 1.5:
+            self.dropped += 1
+
+    def percentile(self, p: float):
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def to_dict(self):
+        return {
+            'frames': self.frames,
+            'dropped': self.dropped,
+            'p50_ms': round(self.percentile(50), 3),
+            'p99_ms': round(self.percentile(99), 3),
+        }
+
+
+class PrefetchStats:
+    def __init__(self):
+        """Počty spustených, využitých a zbytočných prefetchov dát podľa scény"""
+        self.scenes = {}
+
+    def record(self, scene: str, outcome: str):
+        """:param outcome: 'started', 'used' alebo 'wasted'"""
+        counts = self.scenes.setdefault(scene, {'started': 0, 'used': 0, 'wasted': 0})
+        counts[outcome] += 1
+
+    def total(self, outcome: str):
+        return sum(counts[outcome] for counts in self.scenes.values())
+
+    def to_dict(self):
+        return {
+            scene: {**counts, 'use_rate': round(counts['used'] / counts['started'], 4) if counts['started'] else 0.0}
+            for scene, counts in sorted(self.scenes.items())
+        }
+
+
+class StartupTimer:
+    def __init__(self):
+        """Meranie jednotlivých fáz štartu hry od importu tohto modulu"""
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, phase: str):
+        """Ukončí aktuálnu fázu a zaznamená jej trvanie"""
+        now = time.perf_counter()
+        self.phases.append((phase, (now - self.last) * 1000))
+        self.last = now
+
+    def total(self):
+        return (self.last - self.start) * 1000
+
+    def report(self):
+        """Vráti prehľad trvania fáz ako text"""
+        lines = [f"{phase:<16}{ms:9.1f} ms" for phase, ms in self.phases]
+        lines.append(f"{'total':<16}{self.total():9.1f} ms")
+        return "\n".join(lines)
+
+
+startup = StartupTimer()
@@ -0,0 +1,137 @@
+import cProfile
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import pygame as pg
+
+from src import setup
+from src.cache import LRUCache
+from src.components import Font
+from src.metrics import Histogram
+
+# Hranice košov histogramu trvania fáz snímku v milisekundách
+PHASE_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66)
+
+NULL_PHASE = nullcontext()
+
+# Počet vyrenderovaných riadkov HUD, texty HUD sa menia každý snímok, preto
+# majú vlastnú malú cache a nevytláčajú texty scén zo zdieľanej cache fontov
+HUD_TEXT_CACHE = 32
+
+
+class Profiler:
+    def __init__(self, game):
+        """
+        Meranie fáz hlavného cyklu (eventy, update, draw, display.update,
+        čakanie) pre jednotlivé scény, HUD s FPS a grafom dĺžky snímkov
+        a zachytávanie cProfile do pstats súborov.
+        Zapína sa premennou SIMON_PROFILE alebo klávesou F3 (HUD),
+        F4 spustí/ukončí cProfile.
+        """
+        self.game = game
+        self.enabled = setup.PROFILE
+        self.phases = {}
+        self.frame_times = deque(maxlen=setup.HUD_GRAPH_FRAMES)
+        self.last_frame = None
+        self.capture = None
+        self.capture_scene = None
+        self.font = Font.get('regular', 'xs', 'white')
+        self.text_cache = LRUCache(HUD_TEXT_CACHE)
+
+    def phase(self, name: str):
+        """Context manager merajúci trvanie fázy, ak je profilovanie vypnuté nerobí nič"""
+        if not self.enabled:
+            return NULL_PHASE
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str):
+        start = time.perf_counter()
+        yield
+        ms = (time.perf_counter() - start) * 1000
+        scene = self.phases.setdefault(self.game.scene.name, {})
+        scene.setdefault(name, Histogram(PHASE_BUCKETS)).add(ms)
+
+    def begin_frame(self):
+        """Zaznamená dĺžku predchádzajúceho snímku pre graf v HUD"""
+        now = time.perf_counter()
+        if self.enabled and self.last_frame is not None:
+            self.frame_times.append((now - self.last_frame) * 1000)
+        self.last_frame = now
+
+    def handle_event(self, event):
+        """Klávesy profilera, vráti True ak bol event spracovaný"""
+        if event.type != pg.KEYDOWN:
+            return False
+        if event.key == pg.K_F3:
+            self.enabled = not self.enabled
+            self.frame_times.clear()
+            self.last_frame = None
+            return True
+        if event.key == pg.K_F4:
+            self.stop_capture() if self.capture else self.start_capture()
+            return True
+        return False
+
+    def start_capture(self):
+        """Spustí cProfile, výsledok sa uloží pri stop_capture"""
+        self.capture = cProfile.Profile()
+        self.capture_scene = self.game.scene.name
+        self.capture.enable()
+
+    def stop_capture(self):
+        """Ukončí cProfile a uloží pstats súbor pomenovaný podľa scény, vráti cestu"""
+        if not self.capture:
+            return None
+        self.capture.disable()
+        os.makedirs(setup.PROFILE_DIR, exist_ok=True)
+        path = os.path.join(setup.PROFILE_DIR, f"{self.capture_scene}_{time.strftime('%Y%m%d_%H%M%S')}.pstats")
+        self.capture.dump_stats(path)
+        print(f"Profile saved to {path}")
+        self.capture = None
+        return path
+
+    def report(self):
+        """Štatistiky fáz pre jednotlivé scény a využitie prefetchov"""
+        return {
+            'phases': {
+                scene: {name: histogram.to_dict() for name, histogram in phases.items()}
+                for scene, phases in self.phases.items()
+            },
+            'prefetch': self.game.prefetch_stats.to_dict(),
+        }
+
+    def render(self, text: str):
+        """Vyrenderuje riadok HUD mimo zdieľanej cache fontov (Font.text_cache)"""
+        return self.text_cache.get_or_create(text, lambda: self.font.font.render(text, False, self.font.color))
+
+    def draw(self, screen):
+        """Vykreslí HUD v ľavom hornom rohu"""
+        if not self.enabled:
+            return
+        from src.game import Api
+        cache = Font.cache_info()
+        lines = [
+            f"FPS {self.game.clock.get_fps():.0f}",
+            f"text cache {cache['hit_rate']:.0%} ({cache['size']}/{cache['max_size']})",
+            f"requests {Api.pending_count()}",
+            f"pixels {self.game.renderer.pixels}",
+            f"prefetch {self.game.prefetch_stats.total('used')}/{self.game.prefetch_stats.total('started')} used",
+        ]
+        if self.capture:
+            lines.append("cProfile REC")
+        x, y = 4, 4
+        width = setup.HUD_GRAPH_FRAMES * 2
+        screen.draw_rect(setup.COLORS['dark'], (0, 0, width + 8, len(lines) * 12 + 48))
+        for line in lines:
+            screen.blit(self.render(line), (x, y))
+            y += 12
+        # graf dĺžky snímkov, čiara = rozpočet jedného snímku displeja
+        budget = 1000 / setup.REFRESH_RATE
+        scale = 40 / (budget * 2)
+        for i, ms in enumerate(self.frame_times):
+            height = max(1, min(40, int(ms * scale)))
+            color = setup.COLORS['red'] if ms > budget * 1.5 else setup.COLORS['light']
+            screen.draw_rect(color, (x + i * 2, y + 40 - height, 2, height))
+        screen.draw_rect(setup.COLORS['yellow'], (x, y + 40 - int(budget * scale), width, 1))
@@ -0,0 +1,198 @@
+from typing import Callable, Tuple
+import pygame as pg
+
+from src.atlas import Sprite
+from src.viewport import Viewport
+
+
+class Renderer:
+    def __init__(self, screen: pg.Surface, background: Tuple, full_redraw: bool = False, viewport: Viewport = None):
+        """
+        Vykresľovanie pomocou "dirty" obdĺžnikov. Scény a komponenty nekreslia
+        priamo na obrazovku, ale cez renderer, ktorý si zapamätá čo a kde sa
+        kreslilo. Po porovnaní s predchádzajúcim snímkom sa prekreslia a na
+        displej pošlú len oblasti, ktoré sa zmenili.
+        :param screen: Surface okna
+        :param background: Farba pozadia
+        :param full_redraw: Vždy prekresliť celú obrazovku (bez dirty rects)
+        :param viewport: Prepočet logických súradníc na pixely okna, None = bez prepočtu
+        """
+        self.screen = screen
+        self.viewport = viewport or Viewport(screen.get_size(), screen.get_size())
+        self.background = background
+        self.full_redraw = full_redraw
+        self.ops = []
+        self.previous = []
+        self.dirty = []
+        self.invalidated = True
+        self.pixels = 0
+        self.total_pixels = 0
+        self.frames = 0
+
+    def get_size(self):
+        return self.screen.get_size()
+
+    def blit(self, surface: pg.Surface, pos: Tuple, area: pg.Rect = None):
+        """Zaznamená vykreslenie surfacu (prípadne jeho časti) alebo obrázku z atlasu na pozíciu"""
+        if not self.viewport.identity:
+            surface, pos, area = self.viewport.transform(surface, pos, area)
+        elif isinstance(surface, Sprite):
+            area = area.move(surface.rect.topleft) if area else surface.rect
+            surface = surface.surface
+        size = area.size if area else surface.get_size()
+        rect = pg.Rect((int(pos[0]), int(pos[1])), size)
+        self.ops.append((surface, rect, area))
+        return rect
+
+    def blit_native(self, surface: pg.Surface, pos: Tuple):
+        """Zaznamená vykreslenie surfacu, ktorý už je v rozlíšení okna (bez prepočtu)"""
+        rect = pg.Rect(pos, surface.get_size())
+        self.ops.append((surface, rect, None))
+        return rect
+
+    def draw_rect(self, color: Tuple, rect):
+        """Zaznamená vykreslenie vyplneného obdĺžnika"""
+        rect = self.viewport.to_screen_rect(rect)
+        self.ops.append((tuple(color), rect, None))
+        return rect
+
+    def mark_dirty(self, rect):
+        """
+        Nahlási zmenenú oblasť. Potrebné len ak sa zmenil obsah surfacu,
+        ktorý sa kreslí na rovnaké miesto (napr. kreslenie do existujúceho surfacu)
+        """
+        self.dirty.append(self.viewport.to_screen_rect(rect))
+
+    def invalidate(self):
+        """Pri ďalšom snímku prekreslí celú obrazovku"""
+        self.invalidated = True
+
+    def present(self):
+        """Vykreslí zaznamenané operácie a aktualizuje displej"""
+        if self.full_redraw or self.invalidated:
+            self.screen.fill(self.background)
+            self.screen.set_clip(self.viewport.rect)
+            self._draw_ops(self.ops)
+            self.screen.set_clip(None)
+            pg.display.update()
+            self.pixels = self.screen.get_width() * self.screen.get_height()
+            self.invalidated = False
+        else:
+            rects = self._merge(self._diff() + [rect.clip(self.viewport.rect) for rect in self.dirty])
+            for rect in rects:
+                self.screen.set_clip(rect)
+                self.screen.fill(self.background, rect)
+                self._draw_ops([op for op in self.ops if op[1].colliderect(rect)])
+            self.screen.set_clip(None)
+            if rects:
+                pg.display.update(rects)
+            self.pixels = sum(rect.w * rect.h for rect in rects)
+        self.total_pixels += self.pixels
+        self.frames += 1
+        self.previous = self.ops
+        self.ops = []
+        self.dirty = []
+
+    def _draw_ops(self, ops):
+        """Po sebe idúce surfacy sa vykreslia naraz cez Surface.blits"""
+        batch = []
+        for what, rect, area in ops:
+            if isinstance(what, pg.Surface):
+                batch.append((what, rect, area))
+            else:
+                if batch:
+                    self.screen.blits(batch, False)
+                    batch = []
+                pg.draw.rect(self.screen, what, rect)
+        if batch:
+            self.screen.blits(batch, False)
+
+    def _diff(self):
+        """
+        Porovná operácie aktuálneho a predchádzajúceho snímku. Surfacy
+        z predchádzajúceho snímku sú stále referencované, takže ich id
+        nemôže byť znovu použité novým surfacom.
+        """
+        def key(op):
+            what, rect, area = op
+            what = id(what) if isinstance(what, pg.Surface) else what
+            return what, tuple(rect), tuple(area) if area else None
+
+        current = {key(op): op for op in self.ops}
+        previous = {key(op): op for op in self.previous}
+        changed = [op[1] for k, op in current.items() if k not in previous]
+        changed += [op[1] for k, op in previous.items() if k not in current]
+        area = self.viewport.rect
+        return [rect.clip(area) for rect in changed if rect.colliderect(area)]
+
+    @staticmethod
+    def _merge(rects):
+        """Spojí prekrývajúce sa obdĺžniky, aby sa žiadna oblasť nekreslila dvakrát"""
+        merged = []
+        for rect in rects:
+            rect = pg.Rect(rect)
+            i = rect.collidelist(merged)
+            while i != -1:
+                rect.union_ip(merged.pop(i))
+                i = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+
+class Canvas:
+    def __init__(self, surface: pg.Surface, viewport: Viewport = None):
+        """Priame kreslenie do surfacu s rovnakým rozhraním ako Renderer"""
+        self.surface = surface
+        self.viewport = viewport or Viewport(surface.get_size(), surface.get_size())
+
+    def get_size(self):
+        return self.surface.get_size()
+
+    def blit(self, surface: pg.Surface, pos: Tuple, area: pg.Rect = None):
+        if not self.viewport.identity:
+            surface, pos, area = self.viewport.transform(surface, pos, area)
+        elif isinstance(surface, Sprite):
+            area = area.move(surface.rect.topleft) if area else surface.rect
+            surface = surface.surface
+        return self.surface.blit(surface, pos, area)
+
+    def draw_rect(self, color: Tuple, rect):
+        return pg.draw.rect(self.surface, color, self.viewport.to_screen_rect(rect))
+
+
+class StaticLayer:
+    def __init__(self, background: Tuple):
+        """
+        Predvykreslená nemenná časť scény. Vytvorí sa pri prvom použití
+        a znova len keď sa zmení kľúč (vstupy, z ktorých sa kreslí)
+        :param background: Farba pozadia vrstvy
+        """
+        self.background = background
+        self.surface = None
+        self.key = None
+        self.builds = 0
+
+    def get(self, key, build: Callable, viewport: Viewport):
+        """
+        Vráti surface vrstvy v rozlíšení okna, ak sa kľúč alebo veľkosť okna
+        zmenili, vrstvu nanovo vykreslí funkciou build(canvas). Nový surface
+        (nie prekreslenie starého) zabezpečí, že renderer zmenu vrstvy zaznamená
+        """
+        size = viewport.size
+        if self.surface is None or key != self.key or self.surface.get_size() != size:
+            surface = pg.Surface(size)
+            if pg.display.get_surface():
+                surface = surface.convert()
+            surface.fill(self.background)
+            surface.set_clip(viewport.rect)
+            build(Canvas(surface, viewport))
+            surface.set_clip(None)
+            self.surface = surface
+            self.key = key
+            self.builds += 1
+        return self.surface
+
+    def clear(self):
+        """Uvoľní vrstvu (pri opustení scény)"""
+        self.surface = None
+        self.key = None
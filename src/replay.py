@@ -0,0 +1,201 @@
+import json
+import struct
+import time
+import tracemalloc
+import pygame as pg
+
+from src import setup
+from src.game import CONNECTION_EVENT
+
+"""
+Nahrávanie a prehrávanie vstupu hráča. Záznam je binárny súbor s hlavičkou
+(MAGIC, verzia, seed sekvencie) a záznamami eventov s časom od začiatku
+nahrávania. Prehrávanie posiela eventy do hry cez virtuálne hodiny, buď
+v reálnom čase alebo maximálnou rýchlosťou.
+"""
+
+MAGIC = b'SIMONREC'
+VERSION = 1
+HEADER = struct.Struct('<8sHQ')
+RECORD = struct.Struct('<dHH')
+END = 0
+
+# Formát dát pre jednotlivé typy eventov
+PAYLOADS = {
+    pg.MOUSEMOTION: struct.Struct('<hhhhBBB'),
+    pg.MOUSEBUTTONDOWN: struct.Struct('<hhB'),
+    pg.MOUSEBUTTONUP: struct.Struct('<hhB'),
+    pg.MOUSEWHEEL: struct.Struct('<hh'),
+    pg.KEYDOWN: struct.Struct('<iH'),
+    pg.KEYUP: struct.Struct('<iH'),
+    pg.QUIT: struct.Struct(''),
+    CONNECTION_EVENT: struct.Struct('<?'),
+}
+
+
+def encode(event):
+    """Zakóduje event do bajtov, None ak sa event nenahráva"""
+    payload = PAYLOADS.get(event.type)
+    if payload is None:
+        return None
+    if event.type == pg.MOUSEMOTION:
+        return payload.pack(*map(int, event.pos), *map(int, event.rel), *event.buttons[:3])
+    if event.type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+        return payload.pack(*map(int, event.pos), event.button)
+    if event.type == pg.MOUSEWHEEL:
+        return payload.pack(event.x, event.y)
+    if event.type == pg.KEYDOWN:
+        return payload.pack(event.key, event.mod) + event.unicode.encode()
+    if event.type == pg.KEYUP:
+        return payload.pack(event.key, event.mod)
+    if event.type == CONNECTION_EVENT:
+        return payload.pack(event.connected)
+    return b''
+
+
+def decode(event_type: int, data: bytes):
+    """Vytvorí pygame event z nahraných bajtov"""
+    payload = PAYLOADS[event_type]
+    values = payload.unpack(data[:payload.size])
+    if event_type == pg.MOUSEMOTION:
+        attrs = {'pos': values[0:2], 'rel': values[2:4], 'buttons': values[4:7]}
+    elif event_type in (pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP):
+        attrs = {'pos': values[0:2], 'button': values[2]}
+    elif event_type == pg.MOUSEWHEEL:
+        attrs = {'x': values[0], 'y': values[1]}
+    elif event_type in (pg.KEYDOWN, pg.KEYUP):
+        attrs = {'key': values[0], 'mod': values[1], 'unicode': data[payload.size:].decode()}
+    elif event_type == CONNECTION_EVENT:
+        attrs = {'connected': values[0]}
+    else:
+        attrs = {}
+    return pg.event.Event(event_type, attrs)
+
+
+class Recorder:
+    def __init__(self, path: str, seed: int):
+        """Nahrávanie eventov do súboru, seed je seed sekvencie hry"""
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed))
+        self.start = None
+        self.last = 0
+
+    def attach(self, game):
+        """Obalí zdroj eventov hry tak, aby sa každý event zapísal"""
+        source = game.event_source
+        clock = game.time_source
+
+        def events():
+            result = source()
+            self.write(clock(), result)
+            return result
+
+        game.event_source = events
+
+    def write(self, now: float, events: list):
+        if self.start is None:
+            self.start = now
+        self.last = now - self.start
+        for event in events:
+            data = encode(event)
+            if data is not None:
+                self.file.write(RECORD.pack(self.last, event.type, len(data)) + data)
+
+    def close(self):
+        self.file.write(RECORD.pack(self.last, END, 0))
+        self.file.close()
+
+
+class Replay:
+    def __init__(self, path: str):
+        """Načíta nahrávku - seed a zoznam (čas, event)"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        magic, version, self.seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a recording: {path}")
+        self.events = []
+        self.duration = 0
+        offset = HEADER.size
+        while offset < len(data):
+            t, event_type, size = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            if event_type == END:
+                self.duration = t
+                break
+            self.events.append((t, decode(event_type, data[offset:offset + size])))
+            offset += size
+        self.cursor = 0
+        self.now = 1000.0
+        self.start = self.now
+
+    def clock(self):
+        """Virtuálne hodiny hry (ms)"""
+        return self.now
+
+    def poll(self):
+        """Eventy, ktorých čas už nastal"""
+        due = []
+        while self.cursor < len(self.events) and self.events[self.cursor][0] <= self.now - self.start:
+            due.append(self.events[self.cursor][1])
+            self.cursor += 1
+        # okno sa dá zavrieť aj počas prehrávania
+        due += [event for event in pg.event.get() if event.type == pg.QUIT]
+        return due
+
+    def finished(self):
+        return self.now - self.start > self.duration
+
+    def run(self, game, max_speed: bool = False):
+        """
+        Prehrá nahrávku v hre a vráti report (trvanie, štatistiky snímkov,
+        alokácie pamäte). Pri max. rýchlosti sa virtuálny čas posúva o jeden
+        snímok (1000 / setup.FPS) bez čakania.
+        """
+        game.time_source = self.clock
+        game.event_source = self.poll
+        game.idle_mode = False
+        frame_ms = 1000 / (setup.FPS or 60)
+        tracemalloc.start()
+        wall_start = time.perf_counter()
+        while game.running and not self.finished():
+            if max_speed:
+                # čakanie na server sa neprehráva rýchlejšie, inak by
+                # eventy prišli do scény, ktorá ešte čaká na odpoveď
+                if game.scene.is_loading():
+                    time.sleep(0.001)
+                else:
+                    self.now += frame_ms
+            else:
+                self.now = self.start + (time.perf_counter() - wall_start) * 1000
+            game.frame()
+            if not max_speed:
+                game.clock.tick(setup.FPS)
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            'duration_ms': round(self.duration, 3),
+            'wall_ms': round((time.perf_counter() - wall_start) * 1000, 3),
+            'events': len(self.events),
+            'frames': game.renderer.frames,
+            'high_score': game.player.high_score,
+            'frame_stats': game.frame_report(),
+            'memory': {
+                'current_bytes': current,
+                'peak_bytes': peak,
+                'top_allocations': [
+                    {'where': str(stat.traceback), 'bytes': stat.size, 'count': stat.count}
+                    for stat in snapshot.statistics('lineno')[:10]
+                ],
+            },
+        }
+
+
+def dump_report(report: dict, path: str = None):
+    text = json.dumps(report, indent=2)
+    if path:
+        with open(path, 'w') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
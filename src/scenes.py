@@ -1,6 +1,11 @@
 import pygame as pg
-from src import setup, tools
+from src import core, setup, tools
+from src.assets import Assets
+from src.audio import Audio
 from src.components import Menu, Font, InputBox, Button, Table
+from src.events import EventRouter
+from src.game import CONNECTION_EVENT
+from src.render import StaticLayer
 
 """
 Scény sa registrujú v src.setup v liste SCENES
@@ -15,15 +20,44 @@ class _Scene(object):
 
     def __init__(self, game, next_scene: str = None, previous_scene: str = None):
         self.game = game
+        self.name = tools.pascal_to_snake(type(self).__name__)
         self.next = next_scene
         self.previous = previous_scene
         self.done = False
         self.start_time = None
+        self.calls = []
+        self.prefetched = False
+        self.loading_font = Font.get(color='light')
+        self.layer = StaticLayer(setup.COLORS['background'])
+        # klikateľné komponenty scény, eventy myši dostane len komponent pod myšou
+        self.router = EventRouter()
 
     def reset(self):
-        """Pripravenie scény pre ďalšie použitie"""
+        """Pripravenie scény pre ďalšie použitie, zruší nedokončené požiadavky"""
         self.done = False
         self.start_time = False
+        for call in self.calls:
+            call.cancel()
+        self.calls = []
+        self.layer.clear()
+        self.router.reset()
+
+    def track(self, call):
+        """Zaregistruje požiadavku na server, ktorá sa zruší pri opustení scény"""
+        if call:
+            self.calls.append(call)
+        return call
+
+    def is_loading(self):
+        """Vráti True ak scéna čaká na odpoveď servera"""
+        self.calls = [call for call in self.calls if not call.done()]
+        return len(self.calls) > 0
+
+    def draw_loading(self, text: str = "Loading..."):
+        """Vykreslí text načítavania v strede obrazovky"""
+        l_text = self.loading_font.render(text)
+        self.game.renderer.blit(l_text, (
+            self.game.width / 2 - l_text.get_width() / 2, self.game.height / 2 - l_text.get_height() / 2))
 
     def back(self):
         """Prejdenie na predchádzajúcu scénu (ak je definovaná)"""
@@ -35,10 +69,47 @@ class _Scene(object):
         """Spracovanie eventov hry, nutné prepísanie v jednotlivých scénach"""
         pass
 
+    def static_key(self):
+        """
+        Vstupy, z ktorých sa kreslí statická vrstva. Keď sa hodnota zmení,
+        vrstva sa pri ďalšom snímku vykreslí znova
+        """
+        return None
+
+    def draw_static(self, screen):
+        """Nemenná časť scény, vykreslí sa raz do statickej vrstvy"""
+        pass
+
+    def build_layer(self):
+        """Vráti statickú vrstvu, pri zmene kľúča ju najprv vykreslí znova"""
+        return self.layer.get(self.static_key(), self.draw_static, self.game.viewport)
+
+    def draw_layer(self):
+        """Vykreslí statickú vrstvu (pri zmene kľúča ju najprv obnoví)"""
+        self.game.renderer.blit_native(self.build_layer(), (0, 0))
+
     def draw(self):
-        """Vykreslenie scény, nutné prepísanie v jednotlivých scénach"""
+        """Vykreslenie dynamickej časti scény (nad statickou vrstvou)"""
         pass
 
+    def prefetch(self):
+        """
+        Začne načítavať dáta scény ešte pred prechodom na ňu (Game.prefetch).
+        Vráti True ak sa niečo začalo načítavať
+        """
+        return False
+
+    def is_idle(self):
+        """
+        Scéna sa mení len na základe eventov alebo časovača (next_timer),
+        hlavný cyklus ju teda nemusí obnovovať každý snímok
+        """
+        return False
+
+    def next_timer(self, now):
+        """Počet ms do najbližšej časovanej zmeny scény, None = žiadna"""
+        return None
+
     def update(self, now):
         """
         Obnovenie scény. Ak štart. čas nebol nastavený,
@@ -60,62 +131,109 @@ class Welcome(_Scene):
         self.reconnect_btn = Button("Retry", (0, 0), self.reconnect, _type="danger")
         self.reconnect_btn.set_position(
             (self.game.width / 2 - self.reconnect_btn.width / 2, self.game.height / 2 + 30))
+        self.router.add(self.start_btn, self.reconnect_btn)
+        self.err_font = Font.get('regular', 'sm', 'red')
+        self.title_font = Font.get('vintage', '2xl', 'yellow')
+        self.retry_at = 0
+        self.now = 0
 
     def handle_event(self, event):
+        if event.type == CONNECTION_EVENT:
+            self.game.player.is_connected = event.connected
+            self.retry_at = self.game.now() + setup.CONNECT_RETRY_TIME
+            return
+        if self.is_loading():
+            return
+        # tlačidlá sú na rovnakom mieste, aktívne je len jedno podľa stavu spojenia
+        self.start_btn.enabled = bool(self.game.player.is_connected)
+        self.reconnect_btn.enabled = self.game.player.is_connected is False
+        self.router.dispatch(event)
         if self.game.player.is_connected:
-            self.start_btn.handle_event(event)
             if event.type == pg.MOUSEBUTTONDOWN:
-                self.in_box.activate()
+                self.in_box.activate(event.pos)
             if event.type == pg.KEYDOWN:
                 self.in_box.input(event, on_confirm=self.start_or_error)
-        else:
-            self.reconnect_btn.handle_event(event)
 
     def start_or_error(self):
         validation = self.in_box.validate(min_length=3, max_length=10)
         if validation['success']:
-            self.game.player.create_user(self.in_box.get_value())
-            self.done = True
+            self.validation_message = ""
+            self.track(self.game.player.create_user(self.in_box.get_value(), on_done=self.user_created))
         else:
             self.validation_message = validation['message']
 
+    def user_created(self):
+        self.done = True
+
     def reconnect(self):
-        self.game.player.is_connected = tools.check_internet()
+        self.game.player.check_connection()
 
     def update(self, now):
         super().update(now)
         self.in_box.update(now)
-
-    def draw(self):
-        err_font = Font('regular', 'sm', 'red')
-
+        self.now = now
+        # kým je server nedostupný, spojenie sa pravidelne overuje znova
+        if self.game.player.is_connected is False and now >= self.retry_at:
+            self.reconnect()
+
+    def is_idle(self):
+        return True
+
+    def next_timer(self, now):
+        if self.game.player.is_connected is None:
+            # animácia textu pripájania
+            return setup.BLINK_TIME - now % setup.BLINK_TIME
+        if self.game.player.is_connected is False:
+            return self.retry_at - now
+        return self.in_box.next_timer(now)
+
+    def static_key(self):
+        return self.game.player.is_connected, self.validation_message, self.is_loading()
+
+    def draw_static(self, screen):
         # Uvítací text
-        font = Font('vintage', '2xl', 'yellow')
-        welcome_text = font.render("Welcome!")
-        self.game.screen.blit(welcome_text, (
+        welcome_text = self.title_font.render("Welcome!")
+        screen.blit(welcome_text, (
             self.game.width / 2 - welcome_text.get_width() / 2, self.game.height / 2 - welcome_text.get_height() - 20))
 
         # Chyba zadaného mena
         if self.validation_message:
-            v_text = err_font.render(self.validation_message)
-            self.game.screen.blit(v_text, (
+            v_text = self.err_font.render(self.validation_message)
+            screen.blit(v_text, (
                 self.game.width / 2 - v_text.get_width() / 2, self.game.height * 2 / 3 - 20))
 
-        # Zobrazí input box ak je user pripojený, ak nie, zobrazí error
         if self.game.player.is_connected:
+            if not self.is_loading():
+                self.start_btn.draw(screen)
+        elif self.game.player.is_connected is False:
+            c_text = self.err_font.render("You are not connected to internet.")
+            c2_text = self.err_font.render("Please, try to reconnect.")
+            screen.blit(c_text, (
+                self.game.width / 2 - c_text.get_width() / 2, self.game.height / 2 - c_text.get_height()))
+            screen.blit(c2_text, (
+                self.game.width / 2 - c2_text.get_width() / 2, self.game.height / 2))
+            self.reconnect_btn.draw(screen)
+
+    def draw(self):
+        # Počas overovania spojenia zobrazí stav pripájania, potom input box
+        # ak je user pripojený, ak nie, error zo statickej vrstvy
+        if self.game.player.is_connected is None:
+            # text je zarovnaný podľa textu bez bodiek, aby sa pri animácii neposúval
+            dots = int(self.now // setup.BLINK_TIME) % 4
+            l_width = self.loading_font.render("Connecting").get_width()
+            l_text = self.loading_font.render("Connecting" + "." * dots)
+            self.game.renderer.blit(l_text, (
+                self.game.width / 2 - l_width / 2, self.game.height / 2 - l_text.get_height() / 2))
+        elif self.game.player.is_connected:
             self.in_box.draw(
-                self.game.screen,
+                self.game.renderer,
                 (self.game.width / 2 - self.in_box.width / 2, self.game.height / 2 - self.in_box.height / 2)
             )
-            self.start_btn.draw(self.game.screen)
-        else:
-            c_text = err_font.render("You are not connected to internet.")
-            c2_text = err_font.render("Please, try to reconnect.")
-            self.game.screen.blit(c_text, (
-                self.game.width / 2 - c_text.get_width() / 2, self.game.height / 2 - c_text.get_height()))
-            self.game.screen.blit(c2_text, (
-                self.game.width / 2 - c2_text.get_width() / 2, self.game.height / 2))
-            self.reconnect_btn.draw(self.game.screen)
+            if self.is_loading():
+                l_text = self.loading_font.render("Connecting...")
+                self.game.renderer.blit(l_text, (
+                    self.game.width / 2 - l_text.get_width() / 2,
+                    self.start_btn.y + self.start_btn.height / 2 - l_text.get_height() / 2))
 
 
 class MainMenu(_Scene):
@@ -123,14 +241,34 @@ class MainMenu(_Scene):
         super().__init__(game, next_scene="show")
         self.menu = Menu('MAIN MENU')
         self.menu.add_button("PLAY!", self.play)
-        self.menu.add_button("MY STATS", self.my_stats)
-        self.menu.add_button("STATS", self.stats)
+        self.menu.add_button("MY STATS", self.my_stats, on_hover=lambda: self.game.prefetch('my_stats'))
+        self.menu.add_button("STATS", self.stats, on_hover=lambda: self.game.prefetch('stats'))
         self.menu.add_button("CREDITS", self.credits)
+        self.music_button = self.menu.add_button(self.music_text(), self.toggle_music)
         self.menu.add_button("EXIT", self.exit, _type="danger")
+        self.idle_prefetched = False
 
     def handle_event(self, event):
         self.menu.handle_event(event)
 
+    def update(self, now):
+        super().update(now)
+        # hráč je v menu dlhšie bez kliknutia, dáta štatistík sa načítajú vopred
+        if not self.idle_prefetched and now - self.start_time >= setup.PREFETCH_IDLE_TIME:
+            self.idle_prefetched = True
+            for name in setup.PREFETCH_SCENES:
+                self.game.prefetch(name)
+
+    def next_timer(self, now):
+        if self.idle_prefetched or not self.start_time:
+            return None
+        return self.start_time + setup.PREFETCH_IDLE_TIME - now
+
+    def reset(self):
+        super().reset()
+        self.menu.router.reset()
+        self.idle_prefetched = False
+
     def play(self):
         self.next = 'show'
         self.done = True
@@ -147,67 +285,139 @@ class MainMenu(_Scene):
         self.next = "credits"
         self.done = True
 
+    def music_text(self):
+        return "MUSIC: ON" if self.game.is_music else "MUSIC: OFF"
+
+    def toggle_music(self):
+        self.game.set_music(not self.game.is_music)
+        self.music_button.set_text(self.music_text())
+
     def exit(self):
         self.game.running = False
 
-    def draw(self):
-        self.menu.draw(self.game.screen)
+    def is_idle(self):
+        return True
+
+    def static_key(self):
+        # texty tlačidiel sa menia (hudba ON/OFF), surface textu je z cache fontu
+        return tuple(button.text for button in self.menu.buttons)
+
+    def draw_static(self, screen):
+        self.menu.draw(screen)
 
 
 class MyStats(_Scene):
     def __init__(self, game):
         super().__init__(game, next_scene="main_menu", previous_scene="main_menu")
-        self.table = Table("Your scores", self.game.player.scores)
         self.back_btn = Button('BACK', (0, 0), self.back)
         self.back_btn.set_position((self.game.width / 2 - self.back_btn.width / 2,
                                     self.game.height - self.back_btn.height * 2))
+        self.router.add(self.back_btn)
+        self.table = Table("Your scores", bottom=self.back_btn.y - self.back_btn.height / 2,
+                           loader=self.load_page)
+        self.table.add_column('Score', 'score')
+        self.table.add_column('Date', 'created_at', tools.format_date)
+
+    def load_page(self, offset, limit, on_done):
+        return self.game.player.get_user_scores(on_done, offset, limit)
 
     def handle_event(self, event):
-        self.back_btn.handle_event(event)
+        self.router.dispatch(event)
+        self.table.handle_event(event)
 
     def update(self, now):
-        if not self.start_time:
-            self.game.player.get_user_scores()
-            self.table.data = self.game.player.scores
-            self.table.add_column('Score', 'score')
-            self.table.add_column('Date', 'created_at', tools.format_date)
+        if not self.start_time and not self.table.data:
+            # dáta mohol začať načítavať už prefetch
+            self.track(self.table.load() or self.table.call)
         super().update(now)
 
+    def prefetch(self):
+        if self.table.data or self.table.call:
+            return False
+        self.table.prerender()
+        self.table.load()
+        # hlavička tabuľky a tlačidlo sa vykreslia do vrstvy vopred,
+        # prvý snímok po prechode na scénu ju už len blitne
+        self.build_layer()
+        return True
+
+    def static_key(self):
+        return self.is_loading()
+
+    def draw_static(self, screen):
+        if not self.is_loading():
+            self.table.draw_header(screen)
+        self.back_btn.draw(screen)
+
     def draw(self):
-        self.table.draw(self.game.screen)
-        self.back_btn.draw(self.game.screen)
+        if self.is_loading():
+            self.draw_loading()
+        else:
+            self.table.draw_rows(self.game.renderer)
+
+    def is_idle(self):
+        return True
 
     def reset(self):
-        self.table.table = []
+        self.table.clear()
         super().reset()
 
 
 class Stats(_Scene):
     def __init__(self, game):
         super().__init__(game, next_scene="main_menu", previous_scene="main_menu")
-        self.table = Table("Top scores", self.game.player.scores)
         self.back_btn = Button('BACK', (0, 0), self.back)
         self.back_btn.set_position((self.game.width / 2 - self.back_btn.width / 2,
                                     self.game.height - self.back_btn.height * 2))
+        self.router.add(self.back_btn)
+        self.table = Table("Top scores", bottom=self.back_btn.y - self.back_btn.height / 2,
+                           loader=self.load_page)
+        self.table.add_column('Score', 'score')
+        self.table.add_column('Player', 'user')
+        self.table.add_column('Date', 'created_at', tools.format_date)
+
+    def load_page(self, offset, limit, on_done):
+        return self.game.get_top_scores(on_done, offset, limit)
 
     def handle_event(self, event):
-        self.back_btn.handle_event(event)
+        self.router.dispatch(event)
+        self.table.handle_event(event)
 
     def update(self, now):
-        if not self.start_time:
-            self.game.get_top_scores()
-            self.table.data = self.game.top_scores
-            self.table.add_column('Score', 'score')
-            self.table.add_column('Player', 'user')
-            self.table.add_column('Date', 'created_at', tools.format_date)
+        if not self.start_time and not self.table.data:
+            # dáta mohol začať načítavať už prefetch
+            self.track(self.table.load() or self.table.call)
         super().update(now)
 
+    def prefetch(self):
+        if self.table.data or self.table.call:
+            return False
+        self.table.prerender()
+        self.table.load()
+        # hlavička tabuľky a tlačidlo sa vykreslia do vrstvy vopred,
+        # prvý snímok po prechode na scénu ju už len blitne
+        self.build_layer()
+        return True
+
+    def static_key(self):
+        return self.is_loading()
+
+    def draw_static(self, screen):
+        if not self.is_loading():
+            self.table.draw_header(screen)
+        self.back_btn.draw(screen)
+
     def draw(self):
-        self.table.draw(self.game.screen)
-        self.back_btn.draw(self.game.screen)
+        if self.is_loading():
+            self.draw_loading()
+        else:
+            self.table.draw_rows(self.game.renderer)
+
+    def is_idle(self):
+        return True
 
     def reset(self):
-        self.table.table = []
+        self.table.clear()
         super().reset()
 
 
@@ -217,15 +427,15 @@ class Credits(_Scene):
         self.back_btn = Button('BACK', (0, 0), action=self.back)
         self.back_btn.set_position(
             (self.game.width / 2 - self.back_btn.width / 2, self.game.height - self.back_btn.height * 2))
-        self.title_font = Font('vintage', 'xl', 'yellow')
-        self.text_font = Font(color='light')
-        self.py_img = pg.image.load(tools.parse_path(setup.IMG_PATH, "others", "python.png")).convert_alpha()
+        self.router.add(self.back_btn)
+        self.title_font = Font.get('vintage', 'xl', 'yellow')
+        self.text_font = Font.get(color='light')
+        self.py_img = Assets.image(tools.parse_path(setup.IMG_PATH, "others", "python.png"))
 
-    def draw(self):
+    def draw_static(self, screen):
         credits_text = self.title_font.render('CREDITS')
-        self.game.screen.blit(credits_text, (self.game.width / 2 - credits_text.get_width() / 2, 20))
-        self.game.screen.blit(self.py_img,
-                              (self.game.width / 2 - self.py_img.get_width() / 2, 20 + credits_text.get_height()))
+        screen.blit(credits_text, (self.game.width / 2 - credits_text.get_width() / 2, 20))
+        screen.blit(self.py_img, (self.game.width / 2 - self.py_img.get_width() / 2, 20 + credits_text.get_height()))
 
         text = "Sounds: www.freesound.org\n" \
                "Author: Samuel Krupík\n" \
@@ -235,73 +445,98 @@ class Credits(_Scene):
         for i, t in enumerate(texts):
             r = self.text_font.render(t)
             rw, rh = r.get_size()
-            self.game.screen.blit(r, (self.game.width / 2 - rw / 2, self.game.height / 2 + 20 + rh * 1.5 * i))
-        self.back_btn.draw(self.game.screen)
+            screen.blit(r, (self.game.width / 2 - rw / 2, self.game.height / 2 + 20 + rh * 1.5 * i))
+        self.back_btn.draw(screen)
 
     def handle_event(self, event):
-        self.back_btn.handle_event(event)
+        self.router.dispatch(event)
+
+    def is_idle(self):
+        return True
 
 
 class Show(_Scene):
     def __init__(self, game):
         super().__init__(game, next_scene="play")
-        self.blink = False
-        self.blink_time = setup.TILE_LIGHT_TIME
-        self.sequence_index = 0
-        self.counter = -1
-        self.timer = 0
-        self.can_play_sound = False
+        self.tiles = {tile.id: tile for tile in self.game.tiles}
+        self.timeline = None
+        self.cursor = 0
+        self.end_time = 0
+        self.lit = None
+        self.font = Font.get(color="light")
+
+    def light_time(self, length: int):
+        """Čas svietenia dlaždice pre sekvenciu danej dĺžky (zrýchľovanie po kolách)"""
+        ramp = setup.TILE_LIGHT_RAMP ** (length - 1)
+        return max(setup.TILE_LIGHT_MIN_TIME, setup.TILE_LIGHT_TIME * ramp)
+
+    def build_timeline(self, start):
+        """
+        Predpočíta prehrávanie celej sekvencie ako zoznam udalostí
+        (čas, id dlaždice, svieti, zvuk). Časy sú absolútne od začiatku
+        scény, takže sa chyby jednotlivých snímkov nesčítavajú.
+        Po poslednej dlaždici nasleduje ešte jedna pauza.
+        """
+        light = self.light_time(len(self.game.sequence))
+        self.timeline = []
+        t = start + light
+        for tile_id in self.game.sequence:
+            self.timeline.append((t, tile_id, True, True))
+            self.timeline.append((t + light, tile_id, False, False))
+            t += light * 2
+        self.end_time = t
+        self.cursor = 0
 
     def update(self, now):
         super().update(now)
 
-        # kontrola púštania zvuku (reset pri každom update aby sa pustil len raz)
-        self.can_play_sound = False
-
-        # prvý update -> generuj nové číslo
-        if self.timer == 0:
-            self.timer = now
+        # prvý update -> generuj nové číslo a naplánuj prehrávanie
+        if self.timeline is None:
             self.game.generate_next()
-
-        # prešiel cyklus bliknutia -> reset
-        if now - self.blink_time > self.timer:
-            self.timer = now
-            self.counter += 1
-            self.blink = not self.blink
-            # ak je počítadlo párne -> pustí zvuk (inak by hral dvakrat)
-            if self.counter % 2 == 0:
-                self.can_play_sound = True
-                if self.counter >= 2:
-                    self.sequence_index += 1
-
-        # prechádzanie a nastavenie aktívnej Tile
-        for tile in self.game.tiles:
-            tile.active = False
-            if self.sequence_index < len(self.game.sequence):
-                if self.blink and tile.id == self.game.sequence[self.sequence_index]:
-                    tile.active = True
+            self.build_timeline(now)
+
+        # udalosti ktorých čas nastal, zvuk sa pustí len pri aktuálnej udalosti
+        event = None
+        while self.cursor < len(self.timeline) and self.timeline[self.cursor][0] <= now:
+            event = self.timeline[self.cursor]
+            self.cursor += 1
+        if event:
+            t, tile_id, on, sound = event
+            self.set_lit(self.tiles[tile_id] if on else None)
+            if sound:
+                self.lit.play_sound()
 
         # posledný -> koniec
-        if self.sequence_index == len(self.game.sequence):
+        if now >= self.end_time:
             self.done = True
-            return
 
-    def draw(self):
-        font = Font(color="light")
-        text = font.render("Simon's move")
+    def set_lit(self, tile):
+        """Rozsvieti zadanú dlaždicu (None = žiadnu) a zhasne predchádzajúcu"""
+        if self.lit:
+            self.lit.active = False
+        self.lit = tile
+        if tile:
+            tile.active = True
+
+    def draw_static(self, screen):
+        text = self.font.render("Simon's move")
         tw, th = text.get_size()
-        self.game.screen.blit(text, (self.game.width / 2 - tw / 2, self.game.height / 2 - th / 2))
+        screen.blit(text, (self.game.width / 2 - tw / 2, self.game.height / 2 - th / 2))
         for tile in self.game.tiles:
-            self.game.screen.blit(tile.get_img(), tile.position)
-            if self.can_play_sound:
-                tile.play_sound()
+            screen.blit(tile.img_off, tile.position)
+
+    def draw(self):
+        # svietiaca dlaždica prekryje zhasnutú zo statickej vrstvy aj s pozadím
+        for tile in self.game.tiles:
+            if tile.active:
+                self.game.renderer.draw_rect(setup.COLORS['background'], (tile.position, tile.img_on.get_size()))
+                self.game.renderer.blit(tile.img_on, tile.position)
 
     def reset(self):
         super().reset()
-        self.timer = 0
-        self.counter = -1
-        self.blink = False
-        self.sequence_index = 0
+        self.set_lit(None)
+        self.timeline = None
+        self.cursor = 0
 
 
 class Play(_Scene):
@@ -311,15 +546,16 @@ class Play(_Scene):
         self.blink_time = setup.TILE_CLICK_LIGHT_TIME
         self.was_clicked = False
         self.locked = False
+        self.font = Font.get(color="white")
+        self.router.add(*self.game.tiles)
 
     def tile_clicked(self, tile):
-        if tile.id == self.game.sequence[self.game.player.click_count]:
-            self.game.player.click_count += 1
-            if self.game.player.click_count == len(self.game.sequence):
-                self.game.player.score += 1
-                self.locked = True
-                self.next = "show"
-        else:
+        result = self.game.core.press(tile.id)
+        if result == core.COMPLETE:
+            self.game.player.score = self.game.core.score
+            self.locked = True
+            self.next = "show"
+        elif result == core.WRONG:
             self.next = "game_over"
             self.done = True
 
@@ -331,10 +567,11 @@ class Play(_Scene):
             # deaktivuje všetky Tiles okrem kliknutej
             for tile in self.game.tiles:
                 tile.active = False
-                self.was_clicked = True
-                if tile.mouse_over(pg.mouse.get_pos()):
-                    tile.active = True
-                    tile.click(self.tile_clicked, params=(tile,))
+            self.was_clicked = True
+            tile = self.router.hit(event.pos)
+            if tile:
+                tile.active = True
+                tile.click(self.tile_clicked, params=(tile,))
 
     def update(self, now):
         super().update(now)
@@ -350,66 +587,90 @@ class Play(_Scene):
             if self.locked:
                 self.done = True
 
-    def draw(self):
-        font = Font(color="white")
-        text = font.render("Your move")
+    def is_idle(self):
+        # kliknutie prebudí hlavný cyklus hneď, nečaká sa na ďalší snímok
+        return True
+
+    def next_timer(self, now):
+        if self.locked or any(tile.active for tile in self.game.tiles):
+            return self.timer + self.blink_time + 1 - now
+        return None
+
+    def draw_static(self, screen):
+        text = self.font.render("Your move")
         tw, th = text.get_size()
-        self.game.screen.blit(text, (self.game.width / 2 - tw / 2, self.game.height / 2 - th / 2))
+        screen.blit(text, (self.game.width / 2 - tw / 2, self.game.height / 2 - th / 2))
+        for tile in self.game.tiles:
+            screen.blit(tile.img_off, tile.position)
+
+    def draw(self):
+        # svietiaca dlaždica prekryje zhasnutú zo statickej vrstvy aj s pozadím
         for tile in self.game.tiles:
-            self.game.screen.blit(tile.get_img(), tile.position)
+            if tile.active:
+                self.game.renderer.draw_rect(setup.COLORS['background'], (tile.position, tile.img_on.get_size()))
+                self.game.renderer.blit(tile.img_on, tile.position)
 
     def reset(self):
         super().reset()
-        self.game.player.click_count = 0
+        self.game.core.start_round()
         self.locked = False
 
 
 class GameOver(_Scene):
     def __init__(self, game):
         super().__init__(game, next_scene="main_menu")
-        self.sound = pg.mixer.Sound(tools.parse_path(setup.SOUND_PATH, 'general', 'game_over.wav'))
+        self.sound = Assets.sound(tools.parse_path(setup.SOUND_PATH, 'general', 'game_over.wav'))
         self.is_highscore = False
         self.continue_text_visible = False
         self.timer = 0
+        self.highscore_font = Font.get("regular", "lg", "yellow")
+        self.score_font = Font.get("regular", "xl", "light")
+        self.title_font = Font.get("vintage", "2xl", "red")
+        self.continue_font = Font.get("regular", "md", "light")
 
     def update(self, now):
         if not self.start_time:
             self.is_highscore = self.game.player.create_score()
-            self.game.sequence = []
-            self.sound.play()
+            self.game.core.reset()
+            Audio.play(self.sound)
         if now - setup.BLINK_TIME > self.timer:
             self.continue_text_visible = not self.continue_text_visible
             self.timer = now
         super().update(now)
 
-    def draw(self):
+    def static_key(self):
+        return self.is_highscore, self.game.player.score
+
+    def draw_static(self, screen):
         if self.is_highscore:
-            font = Font("regular", "lg", "yellow")
-            text = font.render("Wooah, new high score!")
+            text = self.highscore_font.render("Wooah, new high score!")
             tw, th = text.get_size()
-            self.game.screen.blit(text, (self.game.width / 2 - tw / 2, 160))
+            screen.blit(text, (self.game.width / 2 - tw / 2, 160))
 
-        font = Font("regular", "xl", "light")
-        text = font.render(f"Your score: {self.game.player.score}")
+        text = self.score_font.render(f"Your score: {self.game.player.score}")
         tw, th = text.get_size()
-        self.game.screen.blit(text, (self.game.width / 2 - tw / 2, 200))
+        screen.blit(text, (self.game.width / 2 - tw / 2, 200))
 
-        font = Font("vintage", "2xl", "red")
-        text = font.render("Game over")
+        text = self.title_font.render("Game over")
         tw, th = text.get_size()
-        self.game.screen.blit(text, (self.game.width / 2 - tw / 2, self.game.height / 2 - th / 2))
+        screen.blit(text, (self.game.width / 2 - tw / 2, self.game.height / 2 - th / 2))
 
+    def draw(self):
         if self.continue_text_visible:
-            font = Font("regular", "md", "light")
-            text = font.render("[click anywhere to continue]")
+            text = self.continue_font.render("[click anywhere to continue]")
             tw, th = text.get_size()
-            self.game.screen.blit(text, (self.game.width / 2 - tw / 2, 350))
+            self.game.renderer.blit(text, (self.game.width / 2 - tw / 2, 350))
 
     def handle_event(self, event):
         if event.type == pg.MOUSEBUTTONDOWN or event.type == pg.KEYDOWN:
             self.done = True
 
+    def is_idle(self):
+        return True
+
+    def next_timer(self, now):
+        return self.timer + setup.BLINK_TIME + 1 - now
+
     def reset(self):
         super().reset()
         self.game.player.score = 0
-        self.game.player.get_user_scores()
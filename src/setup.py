@@ -1,20 +1,72 @@
+import os
 from src import tools
+from src.bundle import Bundle
 
 # Nastavenie veľkosti, názvu okna
-# definovanie obnovovacej frekvencie
+# definovanie obnovovacej frekvencie vykresľovania (0 = bez obmedzenia)
 SCREEN_SIZE = (560, 560)
 CAPTION = "SIMON"
 FPS = 60
 
+# Rozlíšenie - SCREEN_SIZE je logická veľkosť, v ktorej sú navrhnuté scény,
+# hra sa kreslí v natívnom rozlíšení okna (meniteľná veľkosť, F11 = celá
+# obrazovka). Počiatočná veľkosť okna (SIMON_WINDOW=1920x1080, None =
+# SCREEN_SIZE), štart na celej obrazovke (SIMON_FULLSCREEN=1), počet
+# obrázkov/textov preškálovaných na rozlíšenie okna držaných v cache
+# a počet písiem načítaných vo veľkosti pre mierku okna
+WINDOW_SIZE = tuple(map(int, os.environ['SIMON_WINDOW'].split('x'))) if os.environ.get('SIMON_WINDOW') else None
+FULLSCREEN = bool(os.environ.get('SIMON_FULLSCREEN'))
+SCALE_CACHE_SIZE = 512
+SCALED_FONT_CACHE = 32
+
+# Veľkosť bunky mriežky (v logických pixeloch), podľa ktorej EventRouter
+# hľadá klikateľný komponent pod myšou
+HIT_GRID_CELL = 64
+
+# Synchronizácia vykresľovania s displejom (napr. 120/144/240 Hz panely,
+# vtedy je vhodné nastaviť FPS = 0) a obnovovacia frekvencia displeja,
+# podľa ktorej sa počítajú vynechané snímky
+VSYNC = False
+REFRESH_RATE = 60
+
+# Logika hry beží v pevných krokoch nezávisle od vykresľovania
+# Dĺžka kroku v ms a max. počet krokov v jednom snímku
+TICK_MS = 1000 / 240
+MAX_TICKS_PER_FRAME = 16
+
+# Profilovanie hlavného cyklu a HUD (zapína sa aj klávesou F3, F4 = cProfile)
+# Priečinok pre pstats súbory a počet snímkov v grafe HUD
+PROFILE = bool(os.environ.get('SIMON_PROFILE'))
+PROFILE_DIR = "profiles"
+HUD_GRAPH_FRAMES = 60
+
+# Výpis štatistík dĺžky snímkov (p50/p99, vynechané) pre scény pri ukončení hry
+FRAME_STATS_REPORT = bool(os.environ.get('SIMON_FRAME_STATS'))
+
+# Prekresľovanie len zmenených oblastí obrazovky
+# Pri False sa každý snímok prekreslí celá obrazovka
+DIRTY_RECTS = True
+
+# Idle mód - statické scény (menu, štatistiky...) sa neobnovujú so
+# stálou frekvenciou FPS, ale čakajú na event alebo časovač scény.
+# Najdlhší čas čakania v milisekundách
+IDLE_MODE = True
+IDLE_MAX_WAIT = 1000
+
 # Zadefinovanie najpoužívanejších ciest
 # ku súborom. Fonty, obrázky a zvuky.
 FONT_PATH = "assets/fonts"
 IMG_PATH = "assets/images"
 SOUND_PATH = "assets/sounds"
 
+# Balík assetov vytvorený cez "python -m src.bundle". Ak existuje, všetky
+# obrázky, zvuky a fonty sa čítajú z neho, inak z priečinka assets.
+BUNDLE_PATH = "assets.bundle"
+BUNDLE = Bundle.load(BUNDLE_PATH)
+
 # Načítanie fontov z priečinka a definovanie niekoľkých
 # veľkostí pre písmo. Iné veľkosti by sa nemali používať.
-FONTS = tools.load_fonts(FONT_PATH)
+FONTS = tools.load_fonts(FONT_PATH, BUNDLE)
 FONT_SIZES = {
     "xs": 10,
     "sm": 15,
@@ -25,6 +77,15 @@ FONT_SIZES = {
     "3xl": 75
 }
 
+# Maximálny počet vyrenderovaných textov držaných v cache
+# Pri prekročení sa vyhodí najdlhšie nepoužitý text
+TEXT_CACHE_SIZE = 256
+
+# Tabuľky skóre - počet riadkov načítaných zo servera naraz
+# a počet vyrenderovaných riadkov držaných v cache
+TABLE_PAGE_SIZE = 50
+TABLE_ROW_CACHE = 128
+
 # Definovanie farieb
 # V hre by sa mali používať len farby tu definované
 COLORS = {
@@ -37,10 +98,38 @@ COLORS = {
     "background": (18, 32, 47),
 }
 
+# Zvuk - vzorkovacia frekvencia a veľkosť buffera mixera vo vzorkách
+# (menší buffer = menšie oneskorenie, 256 vzoriek pri 44100 Hz je ~6 ms),
+# počet kanálov navyše k rezervovaným kanálom dlaždíc
+AUDIO_FREQUENCY = 44100
+AUDIO_BUFFER = int(os.environ.get('SIMON_AUDIO_BUFFER', 256))
+AUDIO_CHANNELS = 8
+
+# Hudba v pozadí - zapnutá pri štarte (SIMON_MUSIC=0 vypne), hlasitosť,
+# dĺžka postupného zosilnenia/stíšenia pri zmene scény v ms, hlasitosť počas
+# zvuku dlaždice (násobok) a scény, v ktorých hudba nehrá
+MUSIC = os.environ.get('SIMON_MUSIC', '1') != '0'
+MUSIC_PATH = tools.parse_path(SOUND_PATH, "general", "music.mp3")
+MUSIC_VOLUME = 0.4
+MUSIC_FADE_TIME = 800
+MUSIC_DUCK = 0.3
+MUSIC_MUTED_SCENES = ["game_over"]
+
+# Výpis oneskorenia od kliknutia na dlaždicu po zvuk pri ukončení hry
+AUDIO_LATENCY_REPORT = bool(os.environ.get('SIMON_AUDIO_LATENCY'))
+
 # Čas v milisekundách udávajúci ako dlho bude
 # dlaždica pri prehrávaní sekvencie svietiť/nesvietť
 TILE_LIGHT_TIME = 300
 
+# Seed generátora sekvencie, None = náhodný
+SEED = int(os.environ['SIMON_SEED']) if os.environ.get('SIMON_SEED') else None
+
+# Zrýchľovanie prehrávania sekvencie - čas svietenia sa každé kolo
+# vynásobí koeficientom (1 = bez zrýchľovania), najviac však po minimum
+TILE_LIGHT_RAMP = 1.0
+TILE_LIGHT_MIN_TIME = 120
+
 # Čas v milisekundách udávajúci ako
 # dlho bude dlaždica po stlačení svietiť
 TILE_CLICK_LIGHT_TIME = 200
@@ -66,5 +155,84 @@ SCENES = [
 # Začiatočná scéna
 START_SCENE = "welcome"
 
-# Adresa servera
-SERVER_URL = 'https://simon-backend.azurewebsites.net'
+# Scény sa vytvárajú až pri prvom prechode na ne. Po vykreslení snímku sa
+# postupne (jedna za snímok) vytvoria scény, na ktoré sa dá z aktuálnej
+# scény prejsť (next/previous) a scény uvedené tu. None = vypnuté
+PREWARM_SCENES = {
+    "main_menu": ["my_stats", "stats", "credits"],
+    "show": ["play", "game_over"],
+}
+
+# Scény, ktorých dáta sa v hlavnom menu začnú načítavať vopred - pri
+# prechode myšou nad tlačidlom alebo keď je hráč v menu dlhšie ako
+# PREFETCH_IDLE_TIME milisekúnd
+PREFETCH_SCENES = ["stats", "my_stats"]
+PREFETCH_IDLE_TIME = 1500
+
+# Skupiny súborov, ktoré sa načítajú naraz (Assets.preload) pred vytvorením
+# scény s rovnakým názvom. Skupinu je možné uvoľniť cez Assets.unload_group
+ASSET_GROUPS = {
+    "welcome": [
+        tools.parse_path(IMG_PATH, "text_input", "ti_white.png"),
+        tools.parse_path(IMG_PATH, "buttons", "btn_primary.png"),
+        tools.parse_path(IMG_PATH, "buttons", "btn_danger.png"),
+        tools.parse_path(SOUND_PATH, "buttons", "button.wav"),
+    ],
+    "credits": [tools.parse_path(IMG_PATH, "others", "python.png")],
+    "game_over": [tools.parse_path(SOUND_PATH, "general", "game_over.wav")],
+}
+
+# Obrázky zabalené do jedného textúrového atlasu (Assets.sprite)
+# a jeho maximálna šírka v pixeloch
+ATLAS_IMAGES = [
+    *(tools.parse_path(IMG_PATH, "tiles", f"{color}{state}.png")
+      for color in ("red", "blue", "yellow", "green") for state in ("", "_on")),
+    tools.parse_path(IMG_PATH, "buttons", "btn_primary.png"),
+    tools.parse_path(IMG_PATH, "buttons", "btn_danger.png"),
+    tools.parse_path(IMG_PATH, "text_input", "ti_white.png"),
+]
+ATLAS_WIDTH = 1024
+
+# Výpis trvania jednotlivých fáz štartu hry po vykreslení prvého snímku
+STARTUP_REPORT = bool(os.environ.get('SIMON_STARTUP_REPORT'))
+
+# Adresa servera, dá sa prepísať premennou prostredia
+# (napr. pre lokálnu náhradu servera v src.stub_server)
+SERVER_URL = os.environ.get('SIMON_SERVER_URL', 'https://simon-backend.azurewebsites.net')
+
+# Počet vlákien pre požiadavky na server a čas v sekundách,
+# po ktorom sa požiadavka bez odpovede ukončí
+API_WORKERS = 2
+API_TIMEOUT = 5
+
+# Počet udržiavaných (keep-alive) spojení na server, počet opakovaní
+# GET požiadaviek pri chybe a faktor exponenciálneho čakania medzi nimi
+API_POOL_SIZE = 4
+API_RETRIES = 2
+API_BACKOFF = 0.3
+
+# Lokálne úložisko skóre (SQLite, ":memory:" = bez súboru), počet skóre
+# odoslaných v jednej dávke, čakanie v sekundách po chybe spojenia
+# (zdvojnásobuje sa až po maximum) a počet skóre stiahnutých zo servera
+STORE_PATH = os.environ.get('SIMON_STORE', 'simon.db')
+STORE_SYNC_BATCH = 20
+STORE_SYNC_BACKOFF = 1
+STORE_SYNC_MAX_DELAY = 60
+STORE_IMPORT_LIMIT = 100
+
+# Cache odpovedí servera (rebríček skóre) - súbor, do ktorého sa ukladá
+# medzi behmi (None = neukladať), čas v sekundách, počas ktorého sa
+# odpoveď považuje za čerstvú (stará sa vráti a overí na pozadí) a počet
+# uložených odpovedí - každá strana rebríčka je samostatná odpoveď
+RESPONSE_CACHE_PATH = os.environ.get('SIMON_RESPONSE_CACHE', 'responses.json')
+RESPONSE_CACHE_TTL = 60
+RESPONSE_CACHE_SIZE = 50
+
+# Overenie spojenia so serverom - čas v sekundách na odpoveď a čas
+# v milisekundách, po ktorom sa pri nedostupnom serveri overí znova
+CONNECT_TIMEOUT = 3
+CONNECT_RETRY_TIME = 5000
+
+# Súbor do ktorého sa pri ukončení hry uložia štatistiky požiadaviek
+# (latencia, prenesené bajty, chybovosť). None = neukladať
+API_STATS_FILE = os.environ.get('SIMON_API_STATS')
@@ -0,0 +1,168 @@
+import argparse
+import json
+import random
+from collections import Counter
+
+from src import core
+from src.core import SimonCore
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+"""
+Hromadná simulácia hier bez displeja pre ladenie obtiažnosti a analýzu
+rozdelenia skóre. Ak je nainštalovaný NumPy, celá dávka hier sa simuluje
+vektorovo po kolách, inak sa hrá hra po hre.
+Spustenie: python -m src.simulation --games 1000000 --model memory --span 8
+"""
+
+
+class PlayerModel:
+    """Model hráča - pravdepodobnosť chyby pri stlačení dlaždice"""
+
+    def press_error(self, position: int, length: int):
+        """Pravdepodobnosť chyby pri stlačení na pozícii (od 0) v sekvencii dĺžky length"""
+        return 0.0
+
+    def round_success(self, length: int):
+        """Pravdepodobnosť bezchybného zopakovania celej sekvencie"""
+        success = 1.0
+        for position in range(length):
+            success *= 1 - self.press_error(position, length)
+        return success
+
+    def choose(self, game: SimonCore, rng: random.Random):
+        """Vyberie dlaždicu, ktorú hráč stlačí"""
+        expected = game.expected()
+        if rng.random() < self.press_error(game.position, len(game.sequence)):
+            return rng.choice([t for t in range(1, game.tiles + 1) if t != expected])
+        return expected
+
+
+class PerfectPlayer(PlayerModel):
+    """Hráč, ktorý sa nikdy nepomýli"""
+
+
+class ErrorRatePlayer(PlayerModel):
+    def __init__(self, error: float = 0.02):
+        """Hráč s rovnakou pravdepodobnosťou chyby pri každom stlačení"""
+        self.error = error
+
+    def press_error(self, position: int, length: int):
+        return self.error
+
+
+class MemoryPlayer(PlayerModel):
+    def __init__(self, span: int = 7, error: float = 0.02, overload: float = 0.15):
+        """
+        Hráč s obmedzenou pamäťou - do dĺžky sekvencie span sa mýli s
+        pravdepodobnosťou error, za každú dlaždicu navyše sa pravdepodobnosť
+        chyby pri stlačeniach za hranicou pamäte zvýši o overload
+        """
+        self.span = span
+        self.error = error
+        self.overload = overload
+
+    def press_error(self, position: int, length: int):
+        if position < self.span:
+            return self.error
+        return min(1.0, self.error + self.overload * (length - self.span))
+
+
+MODELS = {
+    'perfect': PerfectPlayer,
+    'error': ErrorRatePlayer,
+    'memory': MemoryPlayer,
+}
+
+
+def play_game(model: PlayerModel, seed: int = None, max_rounds: int = 1000):
+    """Odohrá jednu hru cez SimonCore a vráti skóre"""
+    game = SimonCore(seed=seed)
+    rng = random.Random(game.seed)
+    while game.score < max_rounds:
+        game.generate_next()
+        game.start_round()
+        while True:
+            result = game.press(model.choose(game, rng))
+            if result == core.WRONG:
+                return game.score
+            if result == core.COMPLETE:
+                break
+    return game.score
+
+
+def simulate(model: PlayerModel, games: int, max_rounds: int = 1000, seed: int = None):
+    """
+    Vráti skóre pre zadaný počet hier. Každé kolo sa pre všetky ešte
+    bežiace hry vyhodnotí naraz podľa pravdepodobnosti úspechu kola.
+    """
+    success = [model.round_success(length) for length in range(1, max_rounds + 1)]
+    if np is None:
+        rng = random.Random(seed)
+        scores = []
+        for _ in range(games):
+            score = 0
+            while score < max_rounds and rng.random() < success[score]:
+                score += 1
+            scores.append(score)
+        return scores
+
+    rng = np.random.default_rng(seed)
+    scores = np.zeros(games, dtype=np.int32)
+    alive = np.arange(games)
+    for length in range(1, max_rounds + 1):
+        alive = alive[rng.random(alive.size) < success[length - 1]]
+        if alive.size == 0:
+            break
+        scores[alive] += 1
+    return scores
+
+
+def summarize(scores):
+    """Štatistiky rozdelenia skóre"""
+    scores = sorted(int(s) for s in scores)
+    count = len(scores)
+
+    def percentile(p):
+        return scores[min(count - 1, int(count * p / 100))] if count else 0
+
+    return {
+        'games': count,
+        'mean': round(sum(scores) / count, 4) if count else 0,
+        'p50': percentile(50),
+        'p90': percentile(90),
+        'p99': percentile(99),
+        'max': scores[-1] if count else 0,
+        'histogram': dict(sorted(Counter(scores).items())),
+    }
+
+
+def create_model(args):
+    if args.model == 'error':
+        return ErrorRatePlayer(args.error)
+    if args.model == 'memory':
+        return MemoryPlayer(args.span, args.error, args.overload)
+    return PerfectPlayer()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Batch simulation of Simon games")
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--model', choices=sorted(MODELS), default='memory')
+    parser.add_argument('--error', type=float, default=0.02)
+    parser.add_argument('--span', type=int, default=7)
+    parser.add_argument('--overload', type=float, default=0.15)
+    parser.add_argument('--max-rounds', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--exact', action='store_true', help="Play every game through SimonCore (slow)")
+    args = parser.parse_args()
+    model = create_model(args)
+    if args.exact:
+        rng = random.Random(args.seed)
+        scores = [play_game(model, rng.randrange(2 ** 32), args.max_rounds) for _ in range(args.games)]
+    else:
+        scores = simulate(model, args.games, args.max_rounds, args.seed)
+    print(json.dumps(summarize(scores), indent=2))
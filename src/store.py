@@ -0,0 +1,192 @@
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Callable
+
+from src import setup
+
+"""
+Lokálne úložisko používateľov a skóre (SQLite). Skóre sa najprv uloží lokálne
+a nesynchronizované skóre tvoria frontu (outbox), ktorú vlákno ScoreSync
+posiela na server po dávkach. Pri výpadku spojenia sa odosielanie opakuje
+s exponenciálnym čakaním, fronta prežije aj reštart hry.
+"""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    name TEXT PRIMARY KEY,
+    server_id INTEGER,
+    high_score INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    server_id INTEGER UNIQUE,
+    user TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    synced INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS scores_user_top ON scores (user, score DESC, id);
+CREATE INDEX IF NOT EXISTS scores_outbox ON scores (id) WHERE synced = 0;
+"""
+
+# Stav synchronizácie skóre
+PENDING = 0
+SYNCED = 1
+REJECTED = -1
+
+# Formát dátumu rovnaký ako posiela server
+DATE_FORMAT = "%a, %d %b %Y %H:%M:%S -0000"
+
+
+class ScoreStore:
+    def __init__(self, path: str):
+        """
+        :param path: Cesta k databáze, ":memory:" = len v pamäti
+        """
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock, self.db:
+            self.db.executescript(SCHEMA)
+
+    def save_user(self, name: str, server_id: int = None, high_score: int = 0):
+        """Uloží používateľa, server_id a najvyššie skóre sa len doplnia/zvýšia"""
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT INTO users (name, server_id, high_score) VALUES (?, ?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET server_id = COALESCE(excluded.server_id, server_id), "
+                "high_score = MAX(high_score, excluded.high_score)",
+                (name, server_id, high_score))
+
+    def user(self, name: str):
+        """Vráti používateľa (dict) alebo None"""
+        with self.lock:
+            row = self.db.execute("SELECT * FROM users WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+    def add_score(self, user: str, score: int):
+        """Uloží skóre do fronty na odoslanie a vráti jeho lokálne id"""
+        created_at = datetime.now(timezone.utc).strftime(DATE_FORMAT)
+        with self.lock, self.db:
+            cursor = self.db.execute(
+                "INSERT INTO scores (user, score, created_at) VALUES (?, ?, ?)", (user, score, created_at))
+            self.db.execute("UPDATE users SET high_score = MAX(high_score, ?) WHERE name = ?", (score, user))
+        return cursor.lastrowid
+
+    def import_scores(self, user: str, scores: list):
+        """Uloží skóre stiahnuté zo servera (už synchronizované), duplicitné preskočí"""
+        with self.lock, self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO scores (server_id, user, score, created_at, synced) VALUES (?, ?, ?, ?, ?)",
+                [(s['id'], user, s['score'], s['created_at'], SYNCED) for s in scores])
+
+    def top_scores(self, user: str, offset: int = 0, limit: int = 10):
+        """Najlepšie skóre používateľa (aj neodoslané) zoradené od najvyššieho"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT score, created_at FROM scores WHERE user = ? AND synced != ? "
+                "ORDER BY score DESC, id LIMIT ? OFFSET ?", (user, REJECTED, limit, offset)).fetchall()
+        return [dict(row) for row in rows]
+
+    def outbox(self, limit: int):
+        """Najstaršie neodoslané skóre spolu so server_id používateľa"""
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT scores.id, scores.user, scores.score, users.server_id AS user_id FROM scores "
+                "LEFT JOIN users ON users.name = scores.user WHERE synced = ? ORDER BY scores.id LIMIT ?",
+                (PENDING, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def outbox_size(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM scores WHERE synced = ?", (PENDING,)).fetchone()[0]
+
+    def mark(self, score_id: int, state: int, server_id: int = None):
+        """Nastaví stav synchronizácie skóre"""
+        with self.lock, self.db:
+            self.db.execute("UPDATE scores SET synced = ?, server_id = ? WHERE id = ?", (state, server_id, score_id))
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class ScoreSync(threading.Thread):
+    def __init__(self, store: ScoreStore, send: Callable, on_sent: Callable = None):
+        """
+        Vlákno odosielajúce frontu skóre na server
+        :param store: Lokálne úložisko
+        :param send: Synchrónne odoslanie požiadavky (metóda, endpoint, dáta) -> (dáta, status)
+        :param on_sent: Zavolá sa (vo vlákne) po odoslaní dávky skóre
+        """
+        super().__init__(name='score-sync', daemon=True)
+        self.store = store
+        self.send = send
+        self.on_sent = on_sent
+        self.wake = threading.Event()
+        self.stopped = False
+        self.delay = None
+        self.sent = 0
+        self.failures = 0
+
+    def notify(self):
+        """Prebudí vlákno (napr. po pridaní skóre)"""
+        self.wake.set()
+
+    def stop(self):
+        self.stopped = True
+        self.wake.set()
+
+    def run(self):
+        # pri štarte sa odošle fronta z predchádzajúceho behu
+        self.wake.set()
+        while True:
+            self.wake.wait(self.delay)
+            self.wake.clear()
+            if self.stopped:
+                return
+            if self.flush():
+                self.delay = None
+            else:
+                self.failures += 1
+                self.delay = min(setup.STORE_SYNC_BACKOFF * 2 ** (self.failures - 1), setup.STORE_SYNC_MAX_DELAY)
+
+    def flush(self):
+        """Odosiela dávky, kým sa fronta nevyprázdni. Pri chybe spojenia vráti False"""
+        while not self.stopped:
+            batch = self.store.outbox(setup.STORE_SYNC_BATCH)
+            if not batch:
+                return True
+            for item in batch:
+                if not self.sync_score(item):
+                    return False
+            self.failures = 0
+            if self.on_sent:
+                self.on_sent()
+        return True
+
+    def sync_score(self, item: dict):
+        user_id = item['user_id']
+        if not user_id:
+            res, status = self.send('POST', 'users', {'name': item['user']})
+            if not res:
+                return self.failed(item, status)
+            user_id = res['data']['id']
+            self.store.save_user(item['user'], user_id)
+        res, status = self.send('POST', 'scores', {'score': item['score'], 'user_id': user_id})
+        if not res:
+            return self.failed(item, status)
+        self.store.mark(item['id'], SYNCED, res['data'].get('id'))
+        self.sent += 1
+        return True
+
+    def failed(self, item: dict, status: int):
+        """
+        Chyba spojenia alebo servera (5xx) - vráti False, odošle sa neskôr.
+        Inú chybu (skóre server odmietol) už neopakuje
+        """
+        if status is None or status >= 500:
+            return False
+        self.store.mark(item['id'], REJECTED)
+        return True
@@ -0,0 +1,180 @@
+import argparse
+import hashlib
+import json
+import re
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+"""
+Lokálna náhrada servera (setup.SERVER_URL) pre vývoj, merania a beh bez internetu.
+Dáta drží len v pamäti. Spustenie: python -m src.stub_server --port 5000
+a následne nastaviť premennú prostredia SIMON_SERVER_URL=http://127.0.0.1:5000
+"""
+
+
+class StubData:
+    def __init__(self):
+        self.users = {}
+        self.scores = []
+        self.lock = threading.Lock()
+        # počet otvorených spojení a prijatých požiadaviek (overenie keep-alive a opakovaní)
+        self.connections = 0
+        self.requests = 0
+        # nasledujúce požiadavky zlyhajú so zadaným statusom (None = zavretie spojenia)
+        self.failures = []
+
+    def fail(self, count: int = 1, status: int = 503):
+        """Nasledujúcich count požiadaviek zlyhá (chyba servera alebo spojenia)"""
+        with self.lock:
+            self.failures.extend([status] * count)
+
+    def count_request(self):
+        """Započíta požiadavku, vráti True a status ak má zlyhať"""
+        with self.lock:
+            self.requests += 1
+            if self.failures:
+                return True, self.failures.pop(0)
+            return False, None
+
+    def create_user(self, name: str):
+        with self.lock:
+            for user in self.users.values():
+                if user['name'] == name:
+                    return user, 200
+            user = {'id': len(self.users) + 1, 'name': name, 'high_score': 0}
+            self.users[user['id']] = user
+            return user, 201
+
+    def create_score(self, user_id: int, score: int):
+        with self.lock:
+            user = self.users.get(user_id, {'name': 'Player', 'high_score': 0})
+            user['high_score'] = max(user['high_score'], score)
+            created_at = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S -0000")
+            item = {'id': len(self.scores) + 1, 'user_id': user_id, 'user': user['name'],
+                    'score': score, 'created_at': created_at}
+            self.scores.append(item)
+            return item, 201
+
+    def top_scores(self, user_id: int = None, limit: int = 10, offset: int = 0):
+        with self.lock:
+            scores = [s for s in self.scores if user_id is None or s['user_id'] == user_id]
+            return sorted(scores, key=lambda s: -s['score'])[offset:offset + limit], 200
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 - spojenia ostávajú otvorené (keep-alive) ako na skutočnom serveri
+    protocol_version = 'HTTP/1.1'
+    data = None
+
+    def log_message(self, _format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.data.lock:
+            self.data.connections += 1
+
+    def failed(self):
+        """Odpovie nastavenou chybou, ak má požiadavka zlyhať"""
+        fail, status = self.data.count_request()
+        if not fail:
+            return False
+        if status is None:
+            self.close_connection = True
+        else:
+            self.respond(None, status)
+        return True
+
+    def respond(self, payload, status: int = 200):
+        body = json.dumps({'data': payload}).encode()
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.command == 'GET' and status == 200 and self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        if self.command == 'GET':
+            self.send_header('ETag', etag)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def form(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        fields = parse_qs(self.rfile.read(length).decode())
+        return {key: values[0] for key, values in fields.items()}
+
+    def do_HEAD(self):
+        if not self.failed():
+            self.respond(None)
+
+    def do_GET(self):
+        if self.failed():
+            return
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        limit = int(query.get('limit', 10))
+        offset = int(query.get('offset', 0))
+        path = url.path.strip('/')
+        user_scores = re.fullmatch(r'user/(\d+)/top-scores', path)
+        if path == 'top-scores':
+            self.respond(*self.data.top_scores(limit=limit, offset=offset))
+        elif user_scores:
+            self.respond(*self.data.top_scores(int(user_scores.group(1)), limit, offset))
+        elif path == '':
+            self.respond(None)
+        else:
+            self.respond(None, 404)
+
+    def do_POST(self):
+        path = urlparse(self.path).path.strip('/')
+        form = self.form()
+        if self.failed():
+            return
+        if path == 'users' and form.get('name'):
+            self.respond(*self.data.create_user(form['name']))
+        elif path == 'scores' and 'score' in form:
+            self.respond(*self.data.create_score(int(form.get('user_id', 0)), int(form['score'])))
+        else:
+            self.respond(None, 422)
+
+
+class StubServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        """Server bežiaci vo vlákne na pozadí, port 0 = náhodný voľný port"""
+        self.data = StubData()
+        handler = type('Handler', (StubHandler,), {'data': self.data})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Lokálna náhrada servera hry Simon")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5000)
+    args = parser.parse_args()
+    server = StubServer(args.host, args.port)
+    print(f"Serving on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -2,7 +2,6 @@ import os
 import time
 import unicodedata
 from datetime import datetime, timedelta
-import requests
 
 
 def parse_path(path: str, *paths):
@@ -15,13 +14,13 @@ def parse_path(path: str, *paths):
     return os.path.join(*path_list, *paths)
 
 
-def load_fonts(font_dir: str):
+def load_fonts(font_dir: str, bundle=None):
     """
-    Prehľadá špecifikovaný priečinok s fontami a vráti dictionary
-    kde kľuč je názov fontu bez koncovky a hodnota je cesta k fontu
+    Prehľadá špecifikovaný priečinok s fontami (v balíku assetov, ak je zadaný)
+    a vráti dictionary kde kľuč je názov fontu bez koncovky a hodnota je cesta k fontu
     """
     fonts = {}
-    font_list = os.listdir(parse_path(font_dir))
+    font_list = bundle.listdir(font_dir) if bundle else os.listdir(parse_path(font_dir))
     for font in font_list:
         name, ext = os.path.splitext(font)
         fonts[name] = parse_path(font_dir, font)
@@ -33,6 +32,11 @@ def snake_to_pascal(text: str):
     return text.replace("_", " ").title().replace(" ", "")
 
 
+def pascal_to_snake(text: str):
+    """Konvertuje text z 'PascalCase' do 'snake_case'"""
+    return ''.join('_' + c.lower() if c.isupper() and i else c.lower() for i, c in enumerate(text))
+
+
 def strip_accents(text: str):
     """Odstráni/ nahradí špeciálne znaky (napr. ščťž -> sctz)"""
     return ''.join(c for c in unicodedata.normalize('NFKD', text) if unicodedata.category(c) != 'Mn')
@@ -46,21 +50,6 @@ def split_multiline(text: str):
     return list(filter(lambda x: len(x) > 0, text.split("\n")))
 
 
-def check_internet():
-    """Detekuje či je používateľ pripojený k internetu"""
-    connection = None
-    try:
-        r = requests.head("https://google.com", timeout=5)
-        r.raise_for_status()
-        print("Internet connection detected.")
-        connection = True
-    except:
-        print("Internet connection not detected.")
-        connection = False
-    finally:
-        return connection
-
-
 def get_utc_offset():
     """Vráti hodnotu reprezentujúcu posun v hodínách od UTC času"""
     utc = time.gmtime()
@@ -0,0 +1,122 @@
+import weakref
+from typing import Callable, Tuple
+import pygame as pg
+
+from src import setup
+from src.atlas import Sprite
+from src.cache import LRUCache
+
+"""
+Vykresľovanie v natívnom rozlíšení okna. Scény a komponenty pracujú
+v logických súradniciach (setup.SCREEN_SIZE), viewport ich prepočíta
+na pixely okna (rovnomerná mierka, zvyšok okna je pozadie). Obrázky a texty
+sa na rozlíšenie okna preškálujú raz a držia sa v cache, nie každý snímok.
+"""
+
+# Mierky sa zaokrúhľujú, aby drobná zmena veľkosti okna nevyhodila cache
+SCALE_PRECISION = 100
+
+MOUSE_EVENTS = (pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP)
+
+
+def set_mode(fullscreen: bool = False):
+    """
+    Vytvorí okno hry. Bez vsyncu je okno s meniteľnou veľkosťou (alebo
+    celá obrazovka v natívnom rozlíšení), hra kreslí priamo v jeho
+    rozlíšení. Vsync v pygame vyžaduje pg.SCALED - vtedy hra kreslí
+    v logickej veľkosti a škáluje grafická karta.
+    """
+    if setup.VSYNC:
+        flags = pg.SCALED | (pg.FULLSCREEN if fullscreen else 0)
+        return pg.display.set_mode(setup.SCREEN_SIZE, flags, vsync=1)
+    if fullscreen:
+        return pg.display.set_mode((0, 0), pg.FULLSCREEN)
+    return pg.display.set_mode(setup.WINDOW_SIZE or setup.SCREEN_SIZE, pg.RESIZABLE)
+
+
+class Viewport:
+    # texty, ktoré sa v inej mierke dajú vyrenderovať ostro (surface -> funkcia(mierka))
+    sources = weakref.WeakKeyDictionary()
+
+    def __init__(self, size: Tuple, logical_size: Tuple = setup.SCREEN_SIZE):
+        """
+        :param size: Veľkosť okna v pixeloch
+        :param logical_size: Veľkosť, v ktorej sú navrhnuté rozloženia scén
+        """
+        self.logical_size = logical_size
+        self.size = None
+        self.scale = 1
+        self.offset = (0, 0)
+        self.identity = True
+        # preškálované surfacy podľa pôvodného surfacu (alebo Sprite)
+        self.cache = LRUCache(setup.SCALE_CACHE_SIZE)
+        self.resize(size)
+
+    @classmethod
+    def register(cls, surface: pg.Surface, factory: Callable):
+        """Zaregistruje funkciu, ktorá surface vytvorí znova v zadanej mierke"""
+        cls.sources[surface] = factory
+
+    def resize(self, size: Tuple):
+        """Prepočíta mierku a odsadenie pre novú veľkosť okna"""
+        lw, lh = self.logical_size
+        scale = int(min(size[0] / lw, size[1] / lh) * SCALE_PRECISION) / SCALE_PRECISION
+        scale = max(scale, 1 / SCALE_PRECISION)
+        if scale != self.scale:
+            self.cache.clear()
+        self.size = tuple(size)
+        self.scale = scale
+        self.offset = (int((size[0] - lw * scale) / 2), int((size[1] - lh * scale) / 2))
+        self.identity = scale == 1 and self.offset == (0, 0)
+        # oblasť okna, do ktorej sa kreslí (mimo nej je len pozadie)
+        self.rect = self.to_screen_rect((0, 0, lw, lh))
+
+    def to_screen(self, pos: Tuple):
+        """Logická pozícia -> pixely okna"""
+        return self.offset[0] + round(pos[0] * self.scale), self.offset[1] + round(pos[1] * self.scale)
+
+    def to_screen_rect(self, rect):
+        """Logický obdĺžnik -> pixely okna (prepočítajú sa oba rohy, aby nevznikali medzery)"""
+        rect = pg.Rect(rect)
+        x, y = self.to_screen(rect.topleft)
+        right, bottom = self.to_screen(rect.bottomright)
+        return pg.Rect(x, y, right - x, bottom - y)
+
+    def to_logical(self, pos: Tuple):
+        """Pixely okna -> logická pozícia (napr. pozícia myši)"""
+        return int((pos[0] - self.offset[0]) / self.scale), int((pos[1] - self.offset[1]) / self.scale)
+
+    def transform(self, surface, pos: Tuple, area: pg.Rect = None):
+        """Parametre blitu v logických súradniciach -> surface, pozícia a oblasť v pixeloch okna"""
+        scaled = self.scaled(surface)
+        if area:
+            area = pg.Rect(round(area.x * self.scale), round(area.y * self.scale),
+                           round(area.w * self.scale), round(area.h * self.scale))
+        return scaled, self.to_screen(pos), area
+
+    def map_event(self, event):
+        """Prepočíta pozíciu myši v evente na logické súradnice"""
+        if not self.identity and event.type in MOUSE_EVENTS:
+            event.pos = self.to_logical(event.pos)
+            if event.type == pg.MOUSEMOTION:
+                event.rel = (int(event.rel[0] / self.scale), int(event.rel[1] / self.scale))
+        return event
+
+    def scaled(self, surface):
+        """Surface (alebo Sprite) v mierke okna, vytvorí sa len raz pre danú mierku"""
+        return self.cache.get_or_create(surface, lambda: self._scale(surface))
+
+    def _scale(self, surface):
+        if isinstance(surface, Sprite):
+            surface = surface.surface.subsurface(surface.rect)
+        elif surface in Viewport.sources:
+            return Viewport.sources[surface](self.scale)
+        w, h = surface.get_size()
+        size = (max(1, round(w * self.scale)), max(1, round(h * self.scale)))
+        # smoothscale funguje len pre 24/32 bitové surfacy
+        if surface.get_bitsize() >= 24:
+            return pg.transform.smoothscale(surface, size)
+        return pg.transform.scale(surface, size)
+
+    def info(self):
+        return {'size': self.size, 'scale': self.scale, 'cache': self.cache.info()}
@@ -0,0 +1,38 @@
+import os
+
+# hra sa v testoch spúšťa bez okna a zvuku, nezapisuje lokálne skóre ani cache
+# odpovedí a bez lokálnej náhrady servera sa nepripojí na skutočný server
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+os.environ["SIMON_STORE"] = ":memory:"
+os.environ["SIMON_RESPONSE_CACHE"] = ""
+os.environ["SIMON_SERVER_URL"] = "http://127.0.0.1:9"
+# cesty k assetom v setup sú relatívne ku koreňu projektu
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src import setup
+from src.cache import ResponseCache
+from src.game import Api
+from src.metrics import RequestStats
+from src.stub_server import StubServer
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Lokálna náhrada servera, Api s novou session, štatistikami a cache"""
+    stub = StubServer().start()
+    monkeypatch.setattr(setup, 'SERVER_URL', stub.url)
+    monkeypatch.setattr(setup, 'API_BACKOFF', 0)
+    monkeypatch.setattr(Api, 'session', None)
+    monkeypatch.setattr(Api, 'probe_session', None)
+    monkeypatch.setattr(Api, 'stats', RequestStats())
+    monkeypatch.setattr(Api, 'cache', ResponseCache(ttl=60))
+    yield stub
+    if Api.session:
+        Api.session.close()
+    if Api.probe_session:
+        Api.probe_session.close()
+    stub.stop()
@@ -0,0 +1,115 @@
+from src import setup
+from src.game import Api
+
+
+def create_scores(server, count: int = 5):
+    user, _ = server.data.create_user('player')
+    for score in range(count):
+        server.data.create_score(user['id'], score)
+    return user
+
+
+def test_connection_reuse(server):
+    create_scores(server)
+    for _ in range(5):
+        res, status = Api.send('GET', 'top-scores')
+        assert status == 200
+        assert len(res['data']) == 5
+    Api.send('POST', 'users', {'name': 'other'})
+    assert server.data.requests == 6
+    assert server.data.connections == 1
+
+
+def test_retry_server_error(server):
+    create_scores(server)
+    server.data.fail(setup.API_RETRIES, 503)
+    res, status = Api.send('GET', 'top-scores')
+    assert status == 200
+    assert len(res['data']) == 5
+    assert server.data.requests == setup.API_RETRIES + 1
+    assert Api.stats.to_dict()['GET top-scores']['errors'] == 0
+
+
+def test_retry_exhausted(server):
+    server.data.fail(setup.API_RETRIES + 1, 500)
+    assert Api.send('GET', 'top-scores') == (False, None)
+    assert server.data.requests == setup.API_RETRIES + 1
+    assert Api.stats.to_dict()['GET top-scores']['errors'] == 1
+
+
+def test_retry_connection_error(server):
+    server.data.fail(1, None)
+    res, status = Api.send('GET', 'top-scores')
+    assert status == 200
+    assert server.data.requests == 2
+
+
+def test_post_not_retried(server):
+    server.data.fail(1, 503)
+    assert Api.send('POST', 'users', {'name': 'player'}) == (False, 503)
+    assert server.data.requests == 1
+    assert server.data.users == {}
+
+
+def test_server_down(server):
+    server.stop()
+    assert Api.send('GET', 'top-scores') == (False, None)
+    stats = Api.stats.to_dict()['GET top-scores']
+    assert stats['requests'] == 1
+    assert stats['errors'] == 1
+    assert stats['error_rate'] == 1.0
+
+
+def test_metrics(server):
+    user = create_scores(server, 3)
+    Api.send('GET', f"user/{user['id']}/top-scores?limit=2")
+    Api.send('GET', 'user/999/top-scores')
+    Api.send('POST', 'scores', {'score': 10, 'user_id': user['id']})
+    Api.send('POST', 'scores', {})
+    stats = Api.stats.to_dict()
+    assert set(stats) == {'GET user/{id}/top-scores', 'POST scores'}
+    user_scores = stats['GET user/{id}/top-scores']
+    assert user_scores['requests'] == 2
+    assert user_scores['errors'] == 0
+    assert user_scores['bytes_sent'] == 0
+    assert user_scores['bytes_received'] > 0
+    assert user_scores['latency_ms']['count'] == 2
+    scores = stats['POST scores']
+    assert scores['requests'] == 2
+    assert scores['errors'] == 1
+    assert scores['error_rate'] == 0.5
+    assert scores['bytes_sent'] == len('score=10&user_id=1')
+
+
+def test_endpoint_name():
+    assert Api.endpoint_name('GET', '/user/12/top-scores?limit=3') == 'GET user/{id}/top-scores'
+    assert Api.endpoint_name('POST', 'users') == 'POST users'
+
+
+def test_cached_not_modified(server):
+    create_scores(server)
+    first = Api.send('GET', 'top-scores', cached=True)
+    second = Api.send('GET', 'top-scores', cached=True)
+    assert first == second
+    assert Api.cache.info()['not_modified'] == 1
+    assert Api.cache.cached(Api.url('top-scores')) == first[0]
+
+
+def test_cache_key_per_server(server, monkeypatch):
+    create_scores(server)
+    Api.send('GET', 'top-scores', cached=True)
+    monkeypatch.setattr(setup, 'SERVER_URL', 'http://127.0.0.1:9')
+    assert Api.cache.lookup(Api.url('top-scores')) == (None, True)
+
+
+def test_ping_any_response_is_connected(server):
+    server.data.fail(1, 503)
+    assert Api.ping().result() is True
+    assert server.data.requests == 1
+
+
+def test_ping_single_attempt(server):
+    server.data.fail(1, None)
+    assert Api.ping().result() is False
+    assert server.data.requests == 1
+    assert Api.ping().result() is True
@@ -0,0 +1,53 @@
+import pygame as pg
+
+from src.atlas import Atlas
+
+
+def image(size, color):
+    surface = pg.Surface(size, pg.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+IMAGES = {
+    'tile.png': image((100, 80), (255, 0, 0, 255)),
+    'button.png': image((60, 20), (0, 255, 0, 255)),
+    'input.png': image((90, 30), (0, 0, 255, 128)),
+    'small.png': image((5, 5), (1, 2, 3, 255)),
+}
+
+
+def test_regions_inside_and_disjoint():
+    atlas = Atlas(IMAGES, max_width=128, padding=1)
+    bounds = atlas.surface.get_rect()
+    rects = list(atlas.regions.values())
+    for path, rect in atlas.regions.items():
+        assert rect.size == IMAGES[path].get_size()
+        assert bounds.contains(rect)
+    for i, rect in enumerate(rects):
+        assert rect.collidelist(rects[i + 1:]) == -1
+    assert atlas.surface.get_width() <= 128
+
+
+def test_sprite_pixels():
+    atlas = Atlas(IMAGES)
+    for path, source in IMAGES.items():
+        assert path in atlas
+        sprite = atlas.get(path)
+        assert sprite.get_size() == source.get_size()
+        assert (sprite.get_width(), sprite.get_height()) == source.get_size()
+        assert sprite.surface is atlas.surface
+        assert sprite.surface.get_at(sprite.rect.center) == source.get_at((0, 0))
+    assert 'missing.png' not in atlas
+
+
+def test_padding_keeps_transparent_gap():
+    atlas = Atlas({'a': image((10, 10), (255, 255, 255, 255)), 'b': image((10, 10), (255, 255, 255, 255))},
+                  padding=2)
+    a, b = atlas.regions['a'], atlas.regions['b']
+    assert b.x - a.right == 2
+    assert atlas.surface.get_at((a.right, a.y)).a == 0
+
+
+def test_empty():
+    assert Atlas({}).surface.get_size() == (1, 1)
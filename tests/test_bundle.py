@@ -0,0 +1,59 @@
+import io
+
+import pytest
+
+from src.bundle import Bundle, build
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    src = tmp_path / 'assets'
+    (src / 'images' / 'tiles').mkdir(parents=True)
+    (src / 'images' / 'tiles' / 'red.png').write_bytes(b'red tile')
+    (src / 'images' / 'logo.png').write_bytes(b'logo')
+    (src / 'fonts').mkdir()
+    (src / 'fonts' / 'regular.ttf').write_bytes(bytes(range(256)))
+    out = tmp_path / 'assets.bundle'
+    build(str(src), str(out))
+    bundle = Bundle(str(out))
+    yield bundle, str(src)
+    bundle.map.close()
+    bundle.file.close()
+
+
+def test_index_and_get(bundle):
+    bundle, src = bundle
+    assert len(bundle.index) == 3
+    assert src + '/images/logo.png' in bundle
+    assert src + '/images/missing.png' not in bundle
+    assert bytes(bundle.get(src + '/images/tiles/red.png')) == b'red tile'
+    assert bytes(bundle.get(src + '/fonts/regular.ttf')) == bytes(range(256))
+
+
+def test_listdir(bundle):
+    bundle, src = bundle
+    assert bundle.listdir(src + '/images') == ['logo.png']
+    assert bundle.listdir(src + '/images/tiles/') == ['red.png']
+    assert bundle.listdir(src + '/sounds') == []
+
+
+def test_open_reader(bundle):
+    bundle, src = bundle
+    f = bundle.open(src + '/fonts/regular.ttf')
+    assert f.read(4) == bytes([0, 1, 2, 3])
+    assert f.seek(-2, io.SEEK_END) == 254
+    assert f.read() == bytes([254, 255])
+    f.seek(10)
+    assert f.seek(5, io.SEEK_CUR) == 15
+    assert f.tell() == 15
+    assert f.seek(1000) == 256
+    assert f.read() == b''
+
+
+def test_load(tmp_path):
+    assert Bundle.load(None) is None
+    assert Bundle.load(str(tmp_path / 'missing.bundle')) is None
+    other = tmp_path / 'other.bundle'
+    other.write_bytes(b'NOTABNDL' + bytes(8))
+    with pytest.raises(ValueError):
+        Bundle.load(str(other))
@@ -0,0 +1,114 @@
+import time
+
+from src.cache import LRUCache, ResponseCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert len(cache) == 2
+
+
+def test_lru_get_or_create():
+    cache = LRUCache(4)
+    calls = []
+    factory = lambda: calls.append(1) or len(calls)
+    assert cache.get_or_create('key', factory) == 1
+    assert cache.get_or_create('key', factory) == 1
+    assert len(calls) == 1
+    assert cache.get('missing', 'default') == 'default'
+    info = cache.info()
+    assert (info['hits'], info['misses'], info['size']) == (1, 2, 1)
+    cache.clear()
+    assert cache.info()['size'] == 0
+    assert cache.hit_rate() == 0.0
+
+
+def test_response_fresh_and_miss():
+    cache = ResponseCache(ttl=60)
+    assert cache.lookup('url') == (None, True)
+    cache.put('url', {'data': [1]}, etag='"x"', last_modified='Mon')
+    assert cache.lookup('url') == ({'data': [1]}, False)
+    assert cache.validators('url') == {'If-None-Match': '"x"', 'If-Modified-Since': 'Mon'}
+    assert cache.validators('other') == {}
+    info = cache.info()
+    assert (info['hits'], info['misses'], info['hit_rate']) == (1, 1, 0.5)
+
+
+def test_response_stale_revalidates_once():
+    cache = ResponseCache(ttl=60)
+    cache.put('url', 'old')
+    cache.entries['url']['time'] = time.time() - 120
+    assert cache.lookup('url') == ('old', True)
+    assert cache.lookup('url') == ('old', False)
+    cache.release('url')
+    assert cache.lookup('url') == ('old', True)
+    cache.touch('url')
+    assert cache.lookup('url') == ('old', False)
+    info = cache.info()
+    assert info['stale_hits'] == 3
+    assert info['not_modified'] == 1
+    assert info['staleness_s']['count'] == 3
+
+
+def test_response_invalidate_prefix():
+    cache = ResponseCache()
+    cache.put('http://a/top-scores', 1)
+    cache.put('http://a/top-scores?offset=10', 2)
+    cache.put('http://a/user/1/top-scores', 3)
+    cache.invalidate('http://a/top-scores')
+    assert list(cache.entries) == ['http://a/user/1/top-scores']
+    cache.invalidate()
+    assert cache.entries == {}
+    assert cache.info()['invalidations'] == 3
+
+
+def test_response_save_load(tmp_path):
+    path = str(tmp_path / 'responses.json')
+    cache = ResponseCache(path)
+    cache.put('url', {'data': []}, etag='"x"')
+    cache.save()
+    loaded = ResponseCache(path)
+    assert loaded.cached('url') == {'data': []}
+    assert loaded.validators('url') == {'If-None-Match': '"x"'}
+
+
+def test_response_corrupt_file(tmp_path):
+    path = tmp_path / 'responses.json'
+    path.write_text('{not json')
+    assert ResponseCache(str(path)).entries == {}
+
+
+def test_response_without_path():
+    cache = ResponseCache(None)
+    cache.put('url', 1)
+    cache.save()
+    assert ResponseCache(None).entries == {}
+
+
+def test_response_evicts_least_recently_used():
+    cache = ResponseCache(max_size=2)
+    cache.put('page1', 1)
+    cache.put('page2', 2)
+    assert cache.lookup('page1') == (1, False)
+    cache.put('page3', 3)
+    assert list(cache.entries) == ['page1', 'page3']
+    assert cache.info()['evictions'] == 1
+
+
+def test_response_load_keeps_newest(tmp_path):
+    path = str(tmp_path / 'responses.json')
+    cache = ResponseCache(path, max_size=10)
+    for page in range(10):
+        cache.put(f'page{page}', page)
+        cache.entries[f'page{page}']['time'] = 1000 + page
+    cache.save()
+    loaded = ResponseCache(path, max_size=3)
+    assert list(loaded.entries) == ['page7', 'page8', 'page9']
+    loaded.save()
+    assert len(ResponseCache(path, max_size=10).entries) == 3
@@ -0,0 +1,45 @@
+from src.core import COMPLETE, CORRECT, WRONG, SimonCore
+
+
+def test_seed_is_deterministic():
+    a = SimonCore(seed=7)
+    b = SimonCore(seed=7)
+    sequence = [a.generate_next() for _ in range(50)]
+    assert sequence == [b.generate_next() for _ in range(50)]
+    assert set(sequence) <= {1, 2, 3, 4}
+    assert SimonCore().seed is not None
+
+
+def test_round():
+    core = SimonCore(seed=1)
+    for _ in range(3):
+        core.generate_next()
+    core.start_round()
+    assert core.press(core.sequence[0]) == CORRECT
+    assert core.press(core.sequence[1]) == CORRECT
+    assert core.press(core.sequence[2]) == COMPLETE
+    assert core.score == 1
+    core.generate_next()
+    core.start_round()
+    assert core.expected() == core.sequence[0]
+
+
+def test_wrong_tile():
+    core = SimonCore(tiles=2, seed=3)
+    core.generate_next()
+    core.start_round()
+    wrong = 3 - core.expected()
+    assert core.press(wrong) == WRONG
+    assert core.position == 0
+    assert core.score == 0
+
+
+def test_reset_continues_generator():
+    core = SimonCore(seed=5)
+    first = [core.generate_next() for _ in range(5)]
+    core.score = 3
+    core.reset()
+    assert (core.sequence, core.position, core.score) == ([], 0, 0)
+    following = [core.generate_next() for _ in range(5)]
+    fresh = SimonCore(seed=5)
+    assert first + following == [fresh.generate_next() for _ in range(10)]
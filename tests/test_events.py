@@ -0,0 +1,103 @@
+import pygame as pg
+
+from src.components import Clickable
+from src.events import EventRouter, coalesce_motion
+
+
+def motion(pos, rel, buttons=(0, 0, 0)):
+    return pg.event.Event(pg.MOUSEMOTION, pos=pos, rel=rel, buttons=buttons)
+
+
+def click(pos, event_type=pg.MOUSEBUTTONDOWN):
+    return pg.event.Event(event_type, pos=pos, button=1)
+
+
+class Target(Clickable):
+    def __init__(self, x, y, width, height):
+        super().__init__(x, y, width, height)
+        self.events = []
+        self.left = 0
+
+    def handle_event(self, event):
+        self.events.append(event.type)
+
+    def leave(self):
+        self.left += 1
+
+
+def test_coalesce_merges_runs():
+    down = click((5, 5))
+    events = [motion((1, 1), (1, 1)), motion((3, 2), (2, 1)), down,
+              motion((4, 4), (1, 2)), motion((6, 9), (2, 5), (1, 0, 0))]
+    result = coalesce_motion(events)
+    assert len(result) == 3
+    assert (result[0].pos, result[0].rel) == ((3, 2), (3, 2))
+    assert result[1] is down
+    assert (result[2].pos, result[2].rel, result[2].buttons) == ((6, 9), (3, 7), (1, 0, 0))
+
+
+def test_coalesce_keeps_single_events():
+    single = motion((1, 1), (1, 1))
+    key = pg.event.Event(pg.KEYDOWN, key=pg.K_a, mod=0, unicode='a')
+    assert coalesce_motion([single, key]) == [single, key]
+    assert coalesce_motion([]) == []
+
+
+def test_hit_first_registered():
+    router = EventRouter(cell_size=64)
+    back = Target(0, 0, 200, 200)
+    front = Target(50, 50, 20, 20)
+    router.add(front, back)
+    assert router.hit((60, 60)) is front
+    assert router.hit((150, 150)) is back
+    assert router.hit((300, 300)) is None
+    front.enabled = False
+    assert router.hit((60, 60)) is back
+
+
+def test_hit_across_cells():
+    router = EventRouter(cell_size=10)
+    wide = Target(5, 5, 100, 3)
+    router.add(wide)
+    assert router.hit((5, 5)) is wide
+    assert router.hit((105, 8)) is wide
+    assert router.hit((106, 8)) is None
+
+
+def test_invalidate_after_move():
+    router = EventRouter(cell_size=64)
+    target = Target(0, 0, 10, 10)
+    router.add(target)
+    assert router.hit((5, 5)) is target
+    target.x = 300
+    router.invalidate()
+    assert router.hit((5, 5)) is None
+    assert router.hit((305, 5)) is target
+
+
+def test_dispatch_hover_and_leave():
+    router = EventRouter()
+    a = Target(0, 0, 50, 50)
+    b = Target(100, 0, 50, 50)
+    router.add(a, b)
+    assert router.dispatch(motion((10, 10), (1, 1))) is a
+    assert router.dispatch(click((10, 10))) is a
+    assert router.dispatch(motion((120, 10), (1, 1))) is b
+    assert a.left == 1
+    assert router.dispatch(motion((300, 300), (1, 1))) is None
+    assert b.left == 1
+    assert a.events == [pg.MOUSEMOTION, pg.MOUSEBUTTONDOWN]
+    assert b.events == [pg.MOUSEMOTION]
+    assert router.dispatch(pg.event.Event(pg.KEYDOWN, key=pg.K_a)) is None
+
+
+def test_reset_leaves_hovered():
+    router = EventRouter()
+    target = Target(0, 0, 50, 50)
+    router.add(target)
+    router.dispatch(motion((10, 10), (1, 1)))
+    router.reset()
+    assert target.left == 1
+    assert router.hovered is None
+    router.reset()
+    assert target.left == 1
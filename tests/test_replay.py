@@ -0,0 +1,63 @@
+import pygame as pg
+import pytest
+
+from src.game import CONNECTION_EVENT
+from src.replay import Recorder, Replay, decode, encode
+
+EVENTS = [
+    pg.event.Event(pg.MOUSEMOTION, pos=(10, 20), rel=(-3, 4), buttons=(1, 0, 0)),
+    pg.event.Event(pg.MOUSEBUTTONDOWN, pos=(100, 200), button=1),
+    pg.event.Event(pg.MOUSEBUTTONUP, pos=(100, 201), button=1),
+    pg.event.Event(pg.MOUSEWHEEL, x=0, y=-1),
+    pg.event.Event(pg.KEYDOWN, key=pg.K_a, mod=pg.KMOD_SHIFT, unicode='Á'),
+    pg.event.Event(pg.KEYUP, key=pg.K_a, mod=0),
+    pg.event.Event(CONNECTION_EVENT, connected=True),
+    pg.event.Event(pg.QUIT),
+]
+
+
+def same(decoded, event):
+    return decoded.type == event.type and all(getattr(decoded, key) == value for key, value in event.dict.items())
+
+
+@pytest.mark.parametrize('event', EVENTS, ids=lambda event: pg.event.event_name(event.type))
+def test_codec_roundtrip(event):
+    assert same(decode(event.type, encode(event)), event)
+
+
+def test_encode_skips_other_events():
+    assert encode(pg.event.Event(pg.ACTIVEEVENT, gain=1, state=1)) is None
+
+
+class FakeGame:
+    def __init__(self, batches: list):
+        self.batches = list(batches)
+        self.now = 500.0
+        self.event_source = lambda: self.batches.pop(0)
+        self.time_source = lambda: self.now
+
+
+def test_recorder_replay(tmp_path):
+    path = str(tmp_path / 'session.rec')
+    game = FakeGame([EVENTS[:2], [], EVENTS[2:]])
+    recorder = Recorder(path, seed=1234)
+    recorder.attach(game)
+    assert game.event_source() == EVENTS[:2]
+    game.now += 16
+    game.event_source()
+    game.now += 16
+    game.event_source()
+    recorder.close()
+
+    replay = Replay(path)
+    assert replay.seed == 1234
+    assert replay.duration == 32
+    assert [t for t, _ in replay.events] == [0, 0] + [32] * (len(EVENTS) - 2)
+    assert all(same(decoded, event) for (_, decoded), event in zip(replay.events, EVENTS))
+
+
+def test_replay_rejects_other_files(tmp_path):
+    path = tmp_path / 'other.rec'
+    path.write_bytes(b'NOTAREC!' + bytes(32))
+    with pytest.raises(ValueError):
+        Replay(str(path))
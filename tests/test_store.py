@@ -0,0 +1,126 @@
+import time
+
+import pytest
+
+from src.game import Api
+from src.store import PENDING, REJECTED, SYNCED, ScoreStore, ScoreSync
+
+
+@pytest.fixture
+def store():
+    store = ScoreStore(':memory:')
+    yield store
+    store.close()
+
+
+class FakeServer:
+    def __init__(self, responses: list = ()):
+        """Odpovede na požiadavky v poradí, potom úspech"""
+        self.responses = list(responses)
+        self.requests = []
+
+    def send(self, method: str, endpoint: str, data: dict = None):
+        self.requests.append((method, endpoint, data))
+        if self.responses:
+            return self.responses.pop(0)
+        return {'data': {'id': len(self.requests)}}, 201
+
+
+def states(store):
+    return [row[0] for row in store.db.execute("SELECT synced FROM scores ORDER BY id")]
+
+
+def test_user_high_score(store):
+    store.save_user('player')
+    store.add_score('player', 5)
+    store.add_score('player', 3)
+    assert store.user('player')['high_score'] == 5
+    store.save_user('player', 7, 2)
+    assert store.user('player') == {'name': 'player', 'server_id': 7, 'high_score': 5}
+    store.save_user('player')
+    assert store.user('player')['server_id'] == 7
+    assert store.user('nobody') is None
+
+
+def test_top_scores(store):
+    for score in (3, 9, 1, 9):
+        store.add_score('player', score)
+    store.add_score('other', 100)
+    assert [s['score'] for s in store.top_scores('player')] == [9, 9, 3, 1]
+    assert [s['score'] for s in store.top_scores('player', offset=1, limit=2)] == [9, 3]
+    store.mark(2, REJECTED)
+    assert [s['score'] for s in store.top_scores('player')] == [9, 3, 1]
+
+
+def test_import_scores(store):
+    scores = [{'id': 1, 'score': 4, 'created_at': 'Mon'}, {'id': 2, 'score': 6, 'created_at': 'Tue'}]
+    store.import_scores('player', scores)
+    store.import_scores('player', scores)
+    assert [s['score'] for s in store.top_scores('player')] == [6, 4]
+    assert store.outbox_size() == 0
+
+
+def test_outbox(store):
+    store.save_user('player', 7)
+    first = store.add_score('player', 1)
+    store.add_score('other', 2)
+    store.add_score('player', 3)
+    store.mark(first, SYNCED, 10)
+    assert store.outbox_size() == 2
+    assert store.outbox(1) == [{'id': 2, 'user': 'other', 'score': 2, 'user_id': None}]
+    assert [item['user_id'] for item in store.outbox(10)] == [None, 7]
+
+
+def test_sync_creates_user(store):
+    store.add_score('player', 5)
+    server = FakeServer([({'data': {'id': 42}}, 201)])
+    sent = []
+    sync = ScoreSync(store, server.send, on_sent=lambda: sent.append(1))
+    assert sync.flush()
+    assert server.requests == [
+        ('POST', 'users', {'name': 'player'}),
+        ('POST', 'scores', {'score': 5, 'user_id': 42}),
+    ]
+    assert store.user('player')['server_id'] == 42
+    assert states(store) == [SYNCED]
+    assert (sync.sent, sent) == (1, [1])
+
+
+def test_sync_keeps_score_on_server_error(store):
+    store.save_user('player', 1)
+    store.add_score('player', 5)
+    store.add_score('player', 6)
+    sync = ScoreSync(store, FakeServer([(False, 503)]).send)
+    assert not sync.flush()
+    assert states(store) == [PENDING, PENDING]
+    sync = ScoreSync(store, FakeServer([(False, None)]).send)
+    assert not sync.flush()
+    assert store.outbox_size() == 2
+    assert ScoreSync(store, FakeServer().send).flush()
+    assert states(store) == [SYNCED, SYNCED]
+
+
+def test_sync_drops_rejected_score(store):
+    store.save_user('player', 1)
+    store.add_score('player', 5)
+    store.add_score('player', 6)
+    server = FakeServer([(False, 422)])
+    assert ScoreSync(store, server.send).flush()
+    assert states(store) == [REJECTED, SYNCED]
+    assert len(server.requests) == 2
+
+
+def test_sync_thread(store, server):
+    store.add_score('player', 5)
+    store.add_score('player', 8)
+    sync = ScoreSync(store, Api.send)
+    sync.start()
+    end = time.time() + 5
+    while store.outbox_size() and time.time() < end:
+        time.sleep(0.01)
+    sync.stop()
+    sync.join(1)
+    assert not sync.is_alive()
+    assert store.outbox_size() == 0
+    assert [s['score'] for s in server.data.scores] == [5, 8]
+    assert server.data.users[1]['high_score'] == 8